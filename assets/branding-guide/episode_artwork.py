@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+"""
+Episode Artwork Generator for The Right Path Podcast
+
+Renders every social template (podcast, instagram_quote, instagram_stat,
+facebook, linkedin, email) for every episode in a manifest.
+
+Manifest: CSV with a header row, or JSON list of objects, with the fields
+number, title, guest, quote.
+
+Usage:
+    python episode_artwork.py episodes.csv
+    python episode_artwork.py episodes.json --templates podcast facebook --workers 8
+"""
+
+import csv
+import json
+import argparse
+from pathlib import Path
+from datetime import datetime
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from PIL import Image, ImageDraw, ImageFont
+
+from generate_premium_pdf_v2 import (
+    ASSETS_DIR, NAVY_RGB, GOLD_RGB, ELECTRIC_BLUE_RGB, WHITE_RGB,
+    asset_key, draw_social_template
+)
+from brand import FONT_FILES  # on sys.path via generate_premium_pdf_v2
+
+# ==================== CONFIGURATION ====================
+
+OUTPUT_DIR = ASSETS_DIR / "episodes"
+
+TEMPLATE_TYPES = ["podcast", "instagram_quote", "instagram_stat", "facebook", "linkedin", "email"]
+
+MANIFEST_FIELDS = ("number", "title", "guest", "quote")
+
+# Text placement per template: (text format, box (x0, y0, x1, y1), font, max size, color, align)
+TEMPLATE_LAYOUTS = {
+    "podcast": [
+        ("THE RIGHT PATH PODCAST", (100, 120, 980, 190), "bold", 44, GOLD_RGB, "center"),
+        ("EPISODE {number}", (100, 260, 980, 400), "bold", 96, WHITE_RGB, "center"),
+        ("{title}", (120, 450, 960, 630), "bold", 64, NAVY_RGB, "center"),
+        ("with {guest}", (100, 700, 980, 800), "regular", 48, ELECTRIC_BLUE_RGB, "center"),
+    ],
+    "instagram_quote": [
+        ("EPISODE {number}: {title}", (60, 60, 1020, 180), "bold", 44, GOLD_RGB, "center"),
+        ("{quote}", (120, 360, 960, 740), "italic", 56, WHITE_RGB, "left"),
+        ("— {guest}", (120, 760, 960, 840), "bold", 40, GOLD_RGB, "right"),
+        ("THE RIGHT PATH PODCAST", (60, 910, 1020, 1000), "bold", 36, WHITE_RGB, "center"),
+    ],
+    "instagram_stat": [
+        ("EPISODE {number}", (60, 40, 1020, 170), "bold", 110, NAVY_RGB, "center"),
+        ("{title}", (60, 190, 1020, 340), "bold", 52, NAVY_RGB, "center"),
+        ("{number}", (400, 600, 680, 780), "bold", 150, GOLD_RGB, "center"),
+        ("with {guest}", (60, 400, 1020, 510), "regular", 52, WHITE_RGB, "center"),
+        ("THE RIGHT PATH PODCAST", (60, 900, 1020, 1000), "bold", 40, ELECTRIC_BLUE_RGB, "center"),
+    ],
+    "facebook": [
+        ("THE RIGHT PATH PODCAST  |  EPISODE {number}", (40, 15, 1160, 85), "bold", 44, NAVY_RGB, "left"),
+        ("{title}", (80, 180, 570, 470), "bold", 52, WHITE_RGB, "left"),
+        ("with {guest}", (80, 490, 570, 560), "regular", 34, GOLD_RGB, "left"),
+        ("“{quote}”", (640, 170, 1150, 570), "italic", 40, WHITE_RGB, "left"),
+    ],
+    "linkedin": [
+        ("EPISODE {number}", (160, 80, 1110, 150), "bold", 48, GOLD_RGB, "left"),
+        ("{title}", (160, 170, 1110, 360), "bold", 60, WHITE_RGB, "left"),
+        ("with {guest}", (160, 380, 1110, 440), "regular", 38, ELECTRIC_BLUE_RGB, "left"),
+        ("“{quote}”", (160, 460, 1110, 560), "italic", 30, WHITE_RGB, "left"),
+    ],
+    "email": [
+        ("{title}", (50, 20, 1150, 200), "bold", 60, NAVY_RGB, "left"),
+        ("THE RIGHT PATH PODCAST  |  EPISODE {number}", (50, 250, 1150, 320), "bold", 40, GOLD_RGB, "left"),
+        ("with {guest}", (50, 340, 1150, 400), "regular", 36, WHITE_RGB, "left"),
+        ("“{quote}”", (50, 430, 1150, 600), "italic", 32, WHITE_RGB, "left"),
+    ],
+}
+
+# ==================== MANIFEST ====================
+
+def load_manifest(manifest_path):
+    """Load episodes from a CSV or JSON manifest as a list of dicts."""
+    manifest_path = Path(manifest_path)
+
+    if manifest_path.suffix.lower() == ".json":
+        with open(manifest_path, encoding="utf-8") as f:
+            episodes = json.load(f)
+    else:
+        with open(manifest_path, newline="", encoding="utf-8-sig") as f:
+            episodes = list(csv.DictReader(f))
+
+    # Missing fields render as empty text rather than failing mid-run
+    return [{field: str(ep.get(field) or "").strip() for field in MANIFEST_FIELDS} for ep in episodes]
+
+# ==================== RENDERING ====================
+
+@lru_cache(maxsize=None)
+def _font(role, size):
+    for font_file in FONT_FILES[role]:
+        try:
+            return ImageFont.truetype(font_file, size)
+        except OSError:
+            continue
+    return ImageFont.load_default(size)
+
+class BackgroundCache:
+    """Static template frames keyed by content hash and held as raw pixel buffers.
+
+    The key hashes draw_social_template's code, parameters and brand colors, so a
+    frame is rendered once per change; every episode card then starts from a
+    single buffer copy instead of redrawing the frame.
+    """
+
+    def __init__(self):
+        self.keys = {}      # template type -> content hash
+        self.buffers = {}   # content hash -> (mode, size, raw bytes)
+
+    def key(self, template_type):
+        if template_type not in self.keys:
+            self.keys[template_type] = asset_key(draw_social_template, {'template_type': template_type})
+        return self.keys[template_type]
+
+    def warm(self, template_types):
+        """Render any missing frames and return the cache state for worker processes."""
+        for template_type in template_types:
+            key = self.key(template_type)
+            if key not in self.buffers:
+                img = draw_social_template(template_type)
+                self.buffers[key] = (img.mode, img.size, img.tobytes())
+        return self.keys, self.buffers
+
+    def load(self, state):
+        self.keys, self.buffers = state
+
+    def get(self, template_type):
+        """Return a fresh, writable copy of a template frame."""
+        self.warm([template_type])
+        mode, size, data = self.buffers[self.key(template_type)]
+        return Image.frombytes(mode, size, data)
+
+# Per-process frame cache, filled by the parent and handed to pool workers
+BACKGROUNDS = BackgroundCache()
+
+def _init_worker(state):
+    BACKGROUNDS.load(state)
+
+def _wrap(draw, text, font, max_width):
+    """Greedy word wrap of text to max_width pixels."""
+    lines = []
+    for paragraph in text.splitlines() or [""]:
+        line = ""
+        for word in paragraph.split():
+            candidate = f"{line} {word}".strip()
+            if line and draw.textlength(candidate, font=font) > max_width:
+                lines.append(line)
+                line = word
+            else:
+                line = candidate
+        lines.append(line)
+    return lines
+
+def draw_fitted_text(draw, text, box, role, max_size, color, align="left", min_size=18):
+    """Draw text wrapped into box, shrinking the font until it fits."""
+    x0, y0, x1, y1 = box
+    size = max_size
+    while True:
+        font = _font(role, size)
+        lines = _wrap(draw, text, font, x1 - x0)
+        line_height = int(size * 1.2)
+        if len(lines) * line_height <= y1 - y0 or size <= min_size:
+            break
+        size = max(min_size, int(size * 0.9))
+
+    y = y0 + max(0, (y1 - y0 - len(lines) * line_height) // 2)
+    for line in lines:
+        width = draw.textlength(line, font=font)
+        if align == "center":
+            x = x0 + (x1 - x0 - width) / 2
+        elif align == "right":
+            x = x1 - width
+        else:
+            x = x0
+        draw.text((x, y), line, font=font, fill=color)
+        y += line_height
+
+def render_episode_artwork(template_type, episode, output_path):
+    """Stamp one episode's text onto a cached template frame and save it."""
+    img = BACKGROUNDS.get(template_type)
+    draw = ImageDraw.Draw(img)
+
+    for text_format, box, role, max_size, color, align in TEMPLATE_LAYOUTS[template_type]:
+        # Skip fields whose data is missing from the manifest
+        if any(f"{{{field}}}" in text_format and not episode[field] for field in MANIFEST_FIELDS):
+            continue
+        draw_fitted_text(draw, text_format.format(**episode), box, role, max_size, color, align)
+
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    img.save(output_path)
+    return str(output_path)
+
+def artwork_path(output_dir, template_type, episode):
+    """Output path for one template x episode combination."""
+    return Path(output_dir) / f"episode_{episode['number']}" / f"{template_type}.png"
+
+def iter_season_artwork(episodes, output_dir=OUTPUT_DIR, templates=TEMPLATE_TYPES, max_workers=None):
+    """Render every template x episode combination in a process pool, yielding paths as they complete."""
+    state = BACKGROUNDS.warm(templates)
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker, initargs=(state,)) as pool:
+        futures = [
+            pool.submit(render_episode_artwork, template_type, episode,
+                        artwork_path(output_dir, template_type, episode))
+            for episode in episodes
+            for template_type in templates
+        ]
+        for future in as_completed(futures):
+            yield future.result()
+
+# ==================== MAIN ====================
+
+def main():
+    """Main execution."""
+    parser = argparse.ArgumentParser(description="Render social artwork for every episode in a manifest.")
+    parser.add_argument("manifest", help="CSV or JSON episode manifest (number, title, guest, quote)")
+    parser.add_argument("--output", default=str(OUTPUT_DIR), help="output directory")
+    parser.add_argument("--templates", nargs="+", choices=TEMPLATE_TYPES, default=TEMPLATE_TYPES,
+                        help="templates to render (default: all)")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: CPU count)")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("THE RIGHT PATH - EPISODE ARTWORK GENERATOR")
+    print("=" * 60)
+
+    start = datetime.now()
+    episodes = load_manifest(args.manifest)
+    print(f"  Episodes: {len(episodes)}  Templates: {len(args.templates)}")
+
+    rendered = 0
+    for path in iter_season_artwork(episodes, args.output, args.templates, args.workers):
+        rendered += 1
+        print(f"    [OK] {path}")
+
+    elapsed = (datetime.now() - start).total_seconds()
+    print("\n" + "=" * 60)
+    print(f"  Rendered {rendered} images in {elapsed:.1f} seconds")
+    print("=" * 60)
+
+if __name__ == "__main__":
+    main()
@@ -10,27 +10,25 @@ This script:
 """
 
 import os
+import re
+import hashlib
+import inspect
+import math
 import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 from datetime import datetime
-
-# PDF Generation
-from reportlab.lib.pagesizes import letter
-from reportlab.lib.units import inch
-from reportlab.lib.colors import HexColor, white, black
-from reportlab.platypus import (
-    SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle,
-    Image, PageBreak, KeepTogether
-)
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_JUSTIFY, TA_RIGHT
-from reportlab.platypus.flowables import HRFlowable
-
-# Word Document Processing
-from docx import Document
+from functools import partial
 
 # Image Processing
+import numpy as np
 from PIL import Image as PILImage, ImageDraw, ImageFont
+from PIL.PngImagePlugin import PngInfo
+
+# Brand tokens (scripts/brand)
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "scripts"))
+from brand import PDF_FONTS, REIMAGINED
+from stage_timing import stage
 
 # ==================== CONFIGURATION ====================
 
@@ -39,106 +37,322 @@ BASE_DIR = Path(r"C:\Users\MarieLexisDad\The Right Path\assets\branding-guide")
 WORD_DOC = BASE_DIR / "The_Right_Path_Brand_Guide_COMPLETE.docx"
 OUTPUT_PDF = BASE_DIR / "The_Right_Path_Brand_Guide_PREMIUM_v2.pdf"
 ASSETS_DIR = BASE_DIR / "pdf_assets"
-
-# Create assets directory
-ASSETS_DIR.mkdir(exist_ok=True)
-
-# Brand Colors (RGB tuples for PIL, HexColor for ReportLab)
-NAVY_RGB = (11, 29, 58)
-GOLD_RGB = (255, 211, 58)
-ELECTRIC_BLUE_RGB = (0, 217, 255)
-WHITE_RGB = (255, 255, 255)
-DARK_GRAY_RGB = (51, 51, 51)
-
-NAVY = HexColor('#0B1D3A')
-GOLD = HexColor('#FFD33A')
-ELECTRIC_BLUE = HexColor('#00D9FF')
-DARK_GRAY = HexColor('#333333')
-LIGHT_GRAY = HexColor('#F5F5F5')
+DISPLAY_DIR = ASSETS_DIR / "display"
+
+# Embedding profiles: target resolution and JPEG quality for photographic images
+OUTPUT_PROFILES = {
+    'screen': {'dpi': 150, 'jpeg_quality': 80},
+    'print': {'dpi': 300, 'jpeg_quality': 92},
+}
+
+# Brand Colors (RGB tuples for PIL; ReportLab colors are bound by _import_reportlab)
+NAVY_RGB = REIMAGINED.navy.rgb
+GOLD_RGB = REIMAGINED.gold.rgb
+ELECTRIC_BLUE_RGB = REIMAGINED.electric_blue.rgb
+WHITE_RGB = REIMAGINED.white.rgb
+DARK_GRAY_RGB = REIMAGINED.charcoal.rgb
+
+# PNG text chunk holding the parameters/code hash a graphic was rendered with
+GRAPHIC_META_KEY = "trp-asset-key"
+
+# ==================== PDF BACKEND (deferred) ====================
+
+def _import_reportlab():
+    """Bind the ReportLab names used by the PDF builder as module globals.
+
+    ReportLab takes about 0.2 s to import, so it is loaded only once a PDF is
+    actually built; rendering graphics or importing this module does not need it.
+    """
+    global letter, inch, white, black, SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
+    global Image, PageBreak, KeepTogether, getSampleStyleSheet, ParagraphStyle
+    global TA_CENTER, TA_LEFT, TA_JUSTIFY, TA_RIGHT, HRFlowable
+    global NAVY, GOLD, ELECTRIC_BLUE, DARK_GRAY, LIGHT_GRAY
+
+    from reportlab.lib.pagesizes import letter
+    from reportlab.lib.units import inch
+    from reportlab.lib.colors import white, black
+    from reportlab.platypus import (
+        SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle,
+        Image, PageBreak, KeepTogether
+    )
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_JUSTIFY, TA_RIGHT
+    from reportlab.platypus.flowables import HRFlowable
+
+    NAVY = REIMAGINED.navy.reportlab
+    GOLD = REIMAGINED.gold.reportlab
+    ELECTRIC_BLUE = REIMAGINED.electric_blue.reportlab
+    DARK_GRAY = REIMAGINED.charcoal.reportlab
+    LIGHT_GRAY = REIMAGINED.light_gray.reportlab
+
+# ==================== PATTERN PRIMITIVES ====================
+
+class PatternCanvas:
+    """Procedural canvas that paints layers of stripes, bands, rings, rectangles, triangles and waves.
+
+    Layers are recorded by the shape methods and rasterized on render(), tile by
+    tile, at supersample x supersample sub-samples per pixel. Box-filtering the
+    sub-samples back down anti-aliases every edge. Coordinates are in output pixels.
+
+    The 'pil' engine (default) paints each layer as polygons, ellipses and
+    rectangles with ImageDraw, which runs in C and is as fast as drawing the
+    shapes by hand. The 'numpy' engine evaluates each layer as a mask on
+    coordinate grids (restricted to its bounding box when it has one), writes
+    layer indices into a label plane and maps the labels to colors once per
+    tile: exact at every sub-sample, but several times slower.
+    """
+
+    ENGINES = ('pil', 'numpy')
+    TILE_SAMPLE_ROWS = 4096
+
+    def __init__(self, width, height, background, supersample=1, engine='pil'):
+        if engine not in self.ENGINES:
+            raise ValueError(f"unknown PatternCanvas engine: {engine}")
+        self.width = width
+        self.height = height
+        self.background = background
+        self.supersample = supersample
+        self.engine = engine
+        self.layers = []
+
+    # --- masks ('numpy' engine): x has shape (W,), y has shape (R, 1) ---
+
+    @staticmethod
+    def _band_mask(x, y, offset, width, slope):
+        u = x - slope * y
+        return (u >= offset) & (u <= offset + width)
+
+    @staticmethod
+    def _stripe_mask(x, y, period, width, phase, slope):
+        return np.mod(x - slope * y - phase, period) <= width
+
+    @staticmethod
+    def _ring_mask(x, y, cx, cy, r_inner, r_outer):
+        d2 = (x - cx) ** 2 + (y - cy) ** 2
+        return (d2 >= r_inner * r_inner) & (d2 <= r_outer * r_outer)
+
+    @staticmethod
+    def _rect_mask(x, y, x0, y0, x1, y1):
+        return ((x >= x0) & (x <= x1)) & ((y >= y0) & (y <= y1))
+
+    @staticmethod
+    def _triangle_mask(x, y, points):
+        (x1, y1), (x2, y2), (x3, y3) = points
+        d1 = (x - x2) * (y1 - y2) - (x1 - x2) * (y - y2)
+        d2 = (x - x3) * (y2 - y3) - (x2 - x3) * (y - y3)
+        d3 = (x - x1) * (y3 - y1) - (x3 - x1) * (y - y1)
+        has_neg = (d1 < 0) | (d2 < 0) | (d3 < 0)
+        has_pos = (d1 > 0) | (d2 > 0) | (d3 > 0)
+        return ~(has_neg & has_pos)
+
+    @staticmethod
+    def _rows_mask(x, y, centers, thickness):
+        rows = (np.abs(y - centers[None, :]) <= thickness / 2).any(axis=1, keepdims=True)
+        return np.broadcast_to(rows, (y.shape[0], x.shape[0]))
+
+    # --- fills ('pil' engine): draw into a tile starting at output row top, scaled by ss ---
+
+    @staticmethod
+    def _tile_points(points, ss, top):
+        return [(x * ss, (y - top) * ss) for x, y in points]
+
+    def _band_fill(self, draw, fill, ss, top, offset, width, slope):
+        h = self.height
+        corners = [(offset, 0), (offset + width, 0), (offset + width + slope * h, h), (offset + slope * h, h)]
+        draw.polygon(self._tile_points(corners, ss, top), fill=fill)
+
+    def _stripe_fill(self, draw, fill, ss, top, period, width, phase, slope):
+        # Every band whose x - slope*y range reaches the canvas
+        u_min = min(0, -slope * self.height)
+        u_max = max(self.width, self.width - slope * self.height)
+        k = (u_min - width - phase) // period
+        while phase + k * period <= u_max:
+            self._band_fill(draw, fill, ss, top, phase + k * period, width, slope)
+            k += 1
+
+    def _ring_fill(self, draw, fill, ss, top, cx, cy, r_inner, r_outer):
+        box = self._tile_points([(cx - r_outer, cy - r_outer), (cx + r_outer, cy + r_outer)], ss, top)
+        if r_inner <= 0:
+            draw.ellipse(box, fill=fill)
+        else:
+            draw.ellipse(box, outline=fill, width=max(1, round((r_outer - r_inner) * ss)))
+
+    def _rect_fill(self, draw, fill, ss, top, x0, y0, x1, y1):
+        draw.rectangle(self._tile_points([(x0, y0), (x1, y1)], ss, top), fill=fill)
+
+    def _triangle_fill(self, draw, fill, ss, top, points):
+        draw.polygon(self._tile_points(points, ss, top), fill=fill)
+
+    def _rows_fill(self, draw, fill, ss, top, centers, thickness):
+        # Sub-sample rows whose centers lie within thickness / 2 of a line
+        for center in centers:
+            r0 = math.ceil((center - thickness / 2 - top) * ss - 0.5)
+            r1 = math.floor((center + thickness / 2 - top) * ss - 0.5)
+            if r0 <= r1:
+                draw.rectangle([0, r0, self.width * ss - 1, r1], fill=fill)
+
+    # --- shapes ---
+
+    def _add(self, color, mask, fill, bbox=None):
+        self.layers.append((color, mask, fill, bbox))
+
+    def band(self, offset, width, color, slope=0.0):
+        """Fill the band offset <= x - slope*y <= offset + width."""
+        params = dict(offset=offset, width=width, slope=slope)
+        self._add(color, partial(self._band_mask, **params), partial(self._band_fill, **params))
+
+    def stripes(self, period, width, color, phase=0.0, slope=1.0):
+        """Fill repeating bands of the given width every period pixels along x - slope*y."""
+        params = dict(period=period, width=width, phase=phase, slope=slope)
+        self._add(color, partial(self._stripe_mask, **params), partial(self._stripe_fill, **params))
+
+    def ring(self, center, r_inner, r_outer, color):
+        """Fill the annulus between two radii (r_inner=0 gives a disc)."""
+        cx, cy = center
+        params = dict(cx=cx, cy=cy, r_inner=r_inner, r_outer=r_outer)
+        self._add(color, partial(self._ring_mask, **params), partial(self._ring_fill, **params),
+                  (cx - r_outer, cy - r_outer, cx + r_outer, cy + r_outer))
+
+    def rect(self, x0, y0, x1, y1, color):
+        """Fill an axis-aligned rectangle."""
+        params = dict(x0=x0, y0=y0, x1=x1, y1=y1)
+        self._add(color, partial(self._rect_mask, **params), partial(self._rect_fill, **params), (x0, y0, x1, y1))
+
+    def triangle(self, points, color):
+        """Fill the triangle spanned by three (x, y) points."""
+        xs, ys = zip(*points)
+        self._add(color, partial(self._triangle_mask, points=points), partial(self._triangle_fill, points=points),
+                  (min(xs), min(ys), max(xs), max(ys)))
+
+    def wave(self, top, count, amplitude, color, thickness=2, start=0, stop=None):
+        """Fill full-width lines top + i - amplitude*sin(i*pi/count) for i in [start, stop)."""
+        i = np.arange(start, count if stop is None else stop, dtype=np.float32)
+        centers = top + i - np.trunc(amplitude * np.sin(i * np.pi / count))
+        params = dict(centers=centers, thickness=thickness)
+        self._add(color, partial(self._rows_mask, **params), partial(self._rows_fill, **params),
+                  (0, centers.min() - thickness, self.width, centers.max() + thickness))
+
+    # --- rendering ---
+
+    def _paint_tile_pil(self, top, rows):
+        ss = self.supersample
+        tile = PILImage.new('RGB', (self.width * ss, rows * ss), self.background)
+        draw = ImageDraw.Draw(tile)
+        for color, _, fill, bbox in self.layers:
+            if bbox and (bbox[3] < top or bbox[1] >= top + rows):
+                continue
+            fill(draw, color, ss, top)
+        return tile
+
+    def _label_tile_numpy(self, top, rows):
+        ss = self.supersample
+        x = (np.arange(self.width * ss, dtype=np.float32) + 0.5) / ss
+        y = ((np.arange(rows * ss, dtype=np.float32) + 0.5) / ss + top)[:, None]
+        labels = np.zeros((rows * ss, self.width * ss), dtype=np.uint8)
+
+        for label, (_, mask, _, bbox) in enumerate(self.layers, start=1):
+            r0, r1, c0, c1 = 0, rows * ss, 0, self.width * ss
+            if bbox:
+                # Sub-sample index range covered by the bounding box within this tile
+                r0 = max(r0, int((bbox[1] - top) * ss))
+                r1 = min(r1, int((bbox[3] - top + 1) * ss) + 1)
+                c0 = max(c0, int(bbox[0] * ss))
+                c1 = min(c1, int((bbox[2] + 1) * ss) + 1)
+                if r0 >= r1 or c0 >= c1:
+                    continue
+            region = labels[r0:r1, c0:c1]
+            region[mask(x[c0:c1], y[r0:r1])] = label
+        return PILImage.fromarray(labels, mode='L')
+
+    def _render_tile(self, top, rows):
+        """RGB image of output rows [top, top + rows)."""
+        if self.engine == 'pil':
+            tile_img = self._paint_tile_pil(top, rows)
+        else:
+            tile_img = self._label_tile_numpy(top, rows)
+            tile_img.putpalette([channel for color in [self.background] + [layer[0] for layer in self.layers]
+                                 for channel in color])
+            tile_img = tile_img.convert('RGB')
+        return tile_img.reduce(self.supersample) if self.supersample > 1 else tile_img
+
+    def render(self, tile_rows=None):
+        """Rasterize all layers in order and return an RGB PIL image.
+
+        tile_rows is the number of output rows rasterized at a time (default:
+        TILE_SAMPLE_ROWS sub-sample rows' worth, which bounds memory at high
+        supersampling).
+        """
+        if self.engine == 'numpy' and len(self.layers) > 255:
+            raise ValueError("PatternCanvas supports at most 255 layers")
+
+        tile_rows = tile_rows or max(1, self.TILE_SAMPLE_ROWS // self.supersample)
+        if tile_rows >= self.height:
+            return self._render_tile(0, self.height)
+
+        out = PILImage.new('RGB', (self.width, self.height))
+        for top in range(0, self.height, tile_rows):
+            out.paste(self._render_tile(top, min(tile_rows, self.height - top)), (0, top))
+        return out
 
 # ==================== BRANDED GRAPHICS GENERATION WITH PIL ====================
 
-def create_cover_graphic(output_path, width=2550, height=3300):
+def _save_graphic(img, output_path, asset_key=None):
+    """Save a generated graphic, embedding its asset key so unchanged graphics can be skipped."""
+    pnginfo = None
+    if asset_key:
+        pnginfo = PngInfo()
+        pnginfo.add_text(GRAPHIC_META_KEY, asset_key)
+    Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+    img.save(output_path, pnginfo=pnginfo)
+
+def create_cover_graphic(output_path, width=2550, height=3300, supersample=1, engine='pil', asset_key=None):
     """Create a branded cover page graphic with elegant diagonal design."""
     print(f"  Creating cover graphic: {Path(output_path).name}")
-    import math
 
-    img = PILImage.new('RGB', (width, height), NAVY_RGB)
-    draw = ImageDraw.Draw(img)
+    canvas = PatternCanvas(width, height, NAVY_RGB, supersample=supersample, engine=engine)
 
     # Create elegant diagonal stripe pattern (top-left to bottom-right)
     stripe_width = 200
     stripe_gap = 400
 
-    # Draw multiple diagonal gold accent stripes
-    for offset in range(-height, width + height, stripe_gap):
-        points = [
-            (offset, 0),
-            (offset + stripe_width, 0),
-            (offset + stripe_width + height, height),
-            (offset + height, height)
-        ]
-        # Subtle navy variation stripe
-        draw.polygon(points, fill=(20, 40, 75))
+    # Subtle navy variation stripes
+    canvas.stripes(stripe_gap, stripe_width, (20, 40, 75), phase=-height)
 
     # Large gold diagonal band (dominant visual element)
     gold_band_offset = width // 3
-    gold_band_points = [
-        (gold_band_offset, 0),
-        (gold_band_offset + 400, 0),
-        (gold_band_offset + 400 + height * 0.6, height),
-        (gold_band_offset + height * 0.6, height)
-    ]
-    draw.polygon(gold_band_points, fill=GOLD_RGB)
+    canvas.band(gold_band_offset, 400, GOLD_RGB, slope=0.6)
 
     # Electric blue accent stripe (parallel to gold)
-    blue_offset = gold_band_offset + 420
-    blue_points = [
-        (blue_offset, 0),
-        (blue_offset + 30, 0),
-        (blue_offset + 30 + height * 0.6, height),
-        (blue_offset + height * 0.6, height)
-    ]
-    draw.polygon(blue_points, fill=ELECTRIC_BLUE_RGB)
+    canvas.band(gold_band_offset + 420, 30, ELECTRIC_BLUE_RGB, slope=0.6)
 
     # Create elegant curved element at bottom
-    for i in range(80):
-        y = height - 200 + i
-        curve_height = int(40 * math.sin(i * math.pi / 80))
-        draw.line([(0, y - curve_height), (width, y - curve_height)],
-                  fill=GOLD_RGB if i < 40 else ELECTRIC_BLUE_RGB, width=2)
+    canvas.wave(height - 200, 80, 40, GOLD_RGB, stop=40)
+    canvas.wave(height - 200, 80, 40, ELECTRIC_BLUE_RGB, start=40)
 
     # Add horizontal gold bar at very bottom
-    draw.rectangle([(0, height - 60), (width, height)], fill=GOLD_RGB)
+    canvas.rect(0, height - 60, width, height, GOLD_RGB)
 
     # Add corner accent triangles
     # Top-left corner
-    draw.polygon([(0, 0), (200, 0), (0, 200)], fill=GOLD_RGB)
+    canvas.triangle([(0, 0), (200, 0), (0, 200)], GOLD_RGB)
 
     # Bottom-right corner
-    draw.polygon([(width, height), (width - 200, height), (width, height - 200)], fill=GOLD_RGB)
+    canvas.triangle([(width, height), (width - 200, height), (width, height - 200)], GOLD_RGB)
 
     # Central focal circle with electric blue ring
-    center_x, center_y = width // 2 + 300, height // 2
+    center = (width // 2 + 300, height // 2)
     radius = 350
-    # Outer gold ring
-    for r in range(radius + 20, radius + 30):
-        draw.ellipse([(center_x - r, center_y - r), (center_x + r, center_y + r)],
-                     outline=GOLD_RGB, width=3)
-    # Electric blue ring
-    for r in range(radius + 5, radius + 15):
-        draw.ellipse([(center_x - r, center_y - r), (center_x + r, center_y + r)],
-                     outline=ELECTRIC_BLUE_RGB, width=2)
-    # Inner navy circle
-    draw.ellipse([(center_x - radius, center_y - radius),
-                  (center_x + radius, center_y + radius)],
-                 fill=(15, 35, 70), outline=GOLD_RGB, width=4)
-
-    img.save(output_path, quality=95)
+    canvas.ring(center, radius + 17, radius + 29, GOLD_RGB)            # Outer gold ring
+    canvas.ring(center, radius + 3, radius + 14, ELECTRIC_BLUE_RGB)    # Electric blue ring
+    canvas.ring(center, 0, radius, (15, 35, 70))                       # Inner navy circle
+    canvas.ring(center, radius - 4, radius, GOLD_RGB)
+
+    img = canvas.render()
+    _save_graphic(img, output_path, asset_key)
     print(f"    [OK] Created: {output_path}")
     return output_path
 
-def create_logo_concept(output_path, variant=1, size=1024):
+def create_logo_concept(output_path, variant=1, size=1024, asset_key=None):
     """Create a branded logo concept graphic."""
     print(f"  Creating logo concept {variant}: {Path(output_path).name}")
 
@@ -190,11 +404,11 @@ def create_logo_concept(output_path, variant=1, size=1024):
             inner_points.append((px, py))
         draw.polygon(inner_points, fill=ELECTRIC_BLUE_RGB)
 
-    img.save(output_path, quality=95)
+    _save_graphic(img, output_path, asset_key)
     print(f"    [OK] Created: {output_path}")
     return output_path
 
-def create_color_palette_visual(output_path, width=2400, height=600):
+def create_color_palette_visual(output_path, width=2400, height=600, asset_key=None):
     """Create color palette visualization."""
     print(f"  Creating color palette: {Path(output_path).name}")
 
@@ -202,9 +416,9 @@ def create_color_palette_visual(output_path, width=2400, height=600):
     draw = ImageDraw.Draw(img)
 
     colors = [
-        (NAVY_RGB, "Primary: Navy", "#0B1D3A"),
-        (GOLD_RGB, "Secondary: Gold", "#FFD33A"),
-        (ELECTRIC_BLUE_RGB, "Accent: Electric Blue", "#00D9FF")
+        (NAVY_RGB, "Primary: Navy", REIMAGINED.navy.hex),
+        (GOLD_RGB, "Secondary: Gold", REIMAGINED.gold.hex),
+        (ELECTRIC_BLUE_RGB, "Accent: Electric Blue", REIMAGINED.electric_blue.hex)
     ]
 
     swatch_width = width // 3
@@ -219,14 +433,12 @@ def create_color_palette_visual(output_path, width=2400, height=600):
         draw.rectangle([(x + 20, height - 70), (x + swatch_width - 20, height - 20)],
                        fill=(240, 240, 240))
 
-    img.save(output_path, quality=95)
+    _save_graphic(img, output_path, asset_key)
     print(f"    [OK] Created: {output_path}")
     return output_path
 
-def create_social_template(output_path, template_type="instagram", size=1080):
-    """Create social media template graphic."""
-    print(f"  Creating {template_type} template: {Path(output_path).name}")
-
+def draw_social_template(template_type="instagram", size=1080):
+    """Draw the empty frame of a social media template and return it as a PIL image."""
     if template_type in ["facebook", "linkedin", "email"]:
         # Horizontal format
         img = PILImage.new('RGB', (1200, 630), NAVY_RGB)
@@ -278,7 +490,14 @@ def create_social_template(output_path, template_type="instagram", size=1080):
         draw.rectangle([(0, 0), (w, h//3)], fill=GOLD_RGB)
         draw.rectangle([(0, h//3), (w, h//3 + 8)], fill=ELECTRIC_BLUE_RGB)
 
-    img.save(output_path, quality=95)
+    return img
+
+def create_social_template(output_path, template_type="instagram", size=1080, asset_key=None):
+    """Create social media template graphic."""
+    print(f"  Creating {template_type} template: {Path(output_path).name}")
+
+    img = draw_social_template(template_type, size)
+    _save_graphic(img, output_path, asset_key)
     print(f"    [OK] Created: {output_path}")
     return output_path
 
@@ -288,6 +507,8 @@ def extract_word_content():
     """Extract content from Word document."""
     print("\n[Phase 1] Extracting content from Word document...")
 
+    from docx import Document
+
     doc = Document(str(WORD_DOC))
 
     content = {
@@ -326,14 +547,211 @@ def extract_word_content():
     print(f"  Extracted {len(content['paragraphs'])} paragraphs, {len(content['tables'])} tables")
     return content
 
+# ==================== SECTION CLASSIFICATION ====================
+
+# Heading keyword -> guide section (dict order is match priority)
+SECTION_KEYWORDS = {
+    'mission': 'MISSION & VISION',
+    'vision': 'MISSION & VISION',
+    'brand story': 'BRAND STORY',
+    'target': 'TARGET AUDIENCE',
+    'audience': 'TARGET AUDIENCE',
+    'voice': 'BRAND VOICE & TONE',
+    'tone': 'BRAND VOICE & TONE',
+    'pillar': 'BRAND PILLARS',
+    'imagery': 'IMAGERY GUIDELINES',
+    'visual language': 'VISUAL LANGUAGE',
+    'application': 'APPLICATION EXAMPLES',
+    'do\'s': 'DO\'S & DON\'TS',
+    'don\'t': 'DO\'S & DON\'TS',
+    'social media': 'SOCIAL MEDIA GUIDELINES',
+    'contact': 'CONTACT & RESOURCES'
+}
+
+# Heading keyword -> hero image from existing files
+HERO_IMAGES = {
+    'mission': BASE_DIR / 'page2_hero_image.png',
+    'brand story': BASE_DIR / 'page3_hero_image.png',
+    'target': BASE_DIR / 'page4_hero_image.png',
+    'voice': BASE_DIR / 'page5_hero_image.png'
+}
+
+class SectionClassifier:
+    """Map heading text to a guide section and hero image in a single regex scan.
+
+    Keywords are compiled into one case-insensitive lookahead alternation so
+    overlapping hits are found in one pass; ties go to the earliest dict entry.
+    """
+
+    def __init__(self, section_keywords, hero_images):
+        self.section_keywords = dict(section_keywords)
+        self.hero_images = dict(hero_images)
+        self._section_rank = {kw: i for i, kw in enumerate(self.section_keywords)}
+        self._hero_rank = {kw: i for i, kw in enumerate(self.hero_images)}
+
+        keywords = sorted(set(self.section_keywords) | set(self.hero_images), key=len, reverse=True)
+        # The regex only reports the longest keyword starting at each position,
+        # so remember which shorter keywords are prefixes of it.
+        self._prefixes = {
+            kw: [other for other in keywords if other != kw and kw.startswith(other)]
+            for kw in keywords
+        }
+        alternation = '|'.join(re.escape(kw) for kw in keywords)
+        self._pattern = re.compile(f'(?=({alternation}))', re.IGNORECASE)
+
+    def classify(self, text):
+        """Return (section_name, hero_path) for text, or (None, None) if no keyword matches."""
+        found = set()
+        for match in self._pattern.finditer(text):
+            keyword = match.group(1).lower()
+            found.add(keyword)
+            found.update(self._prefixes[keyword])
+
+        sections = [kw for kw in found if kw in self._section_rank]
+        if not sections:
+            return None, None
+        section_name = self.section_keywords[min(sections, key=self._section_rank.__getitem__)]
+
+        hero_path = None
+        for keyword in sorted((kw for kw in found if kw in self._hero_rank), key=self._hero_rank.__getitem__):
+            if self.hero_images[keyword].exists():
+                hero_path = self.hero_images[keyword]
+                break
+
+        return section_name, hero_path
+
+# ==================== IMAGE PREPARATION ====================
+
+class ImageOptimizer:
+    """Prepare images for embedding: downsample to the profile DPI, JPEG-encode photos, dedupe by content.
+
+    Copies are content-addressed (digest + pixel size) in DISPLAY_DIR/<profile>, so
+    identical images under different names resolve to one file, which ReportLab
+    embeds as a single XObject. Copies are reused across runs.
+    """
+
+    def __init__(self, profile='screen', cache_dir=DISPLAY_DIR):
+        _import_reportlab()
+        self.profile = profile
+        self.dpi = OUTPUT_PROFILES[profile]['dpi']
+        self.jpeg_quality = OUTPUT_PROFILES[profile]['jpeg_quality']
+        self.cache_dir = Path(cache_dir) / profile
+        self._digests = {}   # (path, mtime, size) -> content digest
+        self._copies = {}    # content digest -> [(width, height, path)]
+        self.savings = {}    # source path -> (source bytes, embedded path)
+
+    def _digest(self, path):
+        stat = path.stat()
+        key = (str(path), stat.st_mtime_ns, stat.st_size)
+        if key not in self._digests:
+            sha = hashlib.sha1()
+            with open(path, 'rb') as f:
+                for chunk in iter(lambda: f.read(1 << 20), b''):
+                    sha.update(chunk)
+            self._digests[key] = sha.hexdigest()[:16]
+        return self._digests[key]
+
+    def _find_copy(self, digest, target):
+        """Return an existing copy at least as large as target, if any."""
+        if digest not in self._copies:
+            self._copies[digest] = []
+            for path in self.cache_dir.glob(f"{digest}_*"):
+                w, h = path.stem.split('_')[1].split('x')
+                self._copies[digest].append((int(w), int(h), path))
+        for w, h, path in sorted(self._copies[digest]):
+            if w >= target[0] and h >= target[1]:
+                return path
+        return None
+
+    @staticmethod
+    def _is_photo(img):
+        """Photographic images have far more distinct colors than our flat brand graphics."""
+        if 'A' in img.getbands() or 'transparency' in img.info:
+            return False
+        sample = img.convert('RGB')
+        sample.thumbnail((128, 128))
+        return sample.getcolors(1024) is None
+
+    def _write_copy(self, src, digest, target):
+        src.draft('RGB', target)
+        img = src.resize(target, PILImage.Resampling.LANCZOS) if src.size != target else src
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        if self._is_photo(img):
+            out_path = self.cache_dir / f"{digest}_{target[0]}x{target[1]}.jpg"
+            img.convert('RGB').save(out_path, 'JPEG', quality=self.jpeg_quality, optimize=True)
+        else:
+            out_path = self.cache_dir / f"{digest}_{target[0]}x{target[1]}.png"
+            img.save(out_path, 'PNG', optimize=True)
+        self._copies[digest].append((target[0], target[1], out_path))
+        return out_path
+
+    def prepare(self, image_path, width, height=None):
+        """Return (path, width, height) of the copy to embed for an image drawn at width x height points."""
+        image_path = Path(image_path)
+        digest = self._digest(image_path)
+        with PILImage.open(image_path) as src:
+            src_w, src_h = src.size
+            if height is None:
+                # ReportLab falls back to the native pixel height when only width is given
+                height = src_h
+
+            target = (
+                max(1, min(src_w, round(width / inch * self.dpi))),
+                max(1, min(src_h, round(height / inch * self.dpi)))
+            )
+            out_path = self._find_copy(digest, target) or self._write_copy(src, digest, target)
+
+        self.savings.setdefault(str(image_path), (image_path.stat().st_size, out_path))
+        return str(out_path), width, height
+
+    def report(self):
+        """Print per-image savings and return (source bytes, embedded bytes)."""
+        print(f"\n  Image optimization ({self.profile} profile, {self.dpi} DPI):")
+        source_total = 0
+        embedded = set()
+        for source, (source_bytes, out_path) in self.savings.items():
+            out_bytes = out_path.stat().st_size
+            source_total += source_bytes
+            embedded.add(out_path)
+            print(f"    {Path(source).name:<36} {source_bytes / 1024:>8.0f} KB -> "
+                  f"{out_bytes / 1024:>7.0f} KB {out_path.suffix[1:].upper()}")
+
+        embedded_total = sum(path.stat().st_size for path in embedded)
+        print(f"    {len(self.savings)} images, {len(embedded)} unique embedded: "
+              f"{source_total / 1024 / 1024:.2f} MB -> {embedded_total / 1024 / 1024:.2f} MB")
+        return source_total, embedded_total
+
 # ==================== PDF GENERATION ====================
 
+class _SectionStream(list):
+    """Flowable list that pulls the next section from a generator whenever it runs dry.
+
+    ReportLab consumes flowables from the front of the list, so only the section
+    being laid out is held in memory instead of the whole story.
+    """
+
+    def __init__(self, pdf, sections):
+        super().__init__()
+        self._pdf = pdf
+        self._sections = iter(sections)
+
+    def __len__(self):
+        while not list.__len__(self) and self._sections is not None:
+            if next(self._sections, StopIteration) is StopIteration:
+                self._sections = None
+            self.extend(self._pdf.story)
+            self._pdf.story.clear()
+        return list.__len__(self)
+
+
 class BrandGuidePDF:
     """Premium PDF generator for The Right Path Brand Guide."""
 
-    def __init__(self):
+    def __init__(self, profile='screen'):
+        _import_reportlab()
         self.styles = self._create_styles()
         self.story = []
+        self.images = ImageOptimizer(profile)
 
     def _create_styles(self):
         """Create custom paragraph styles."""
@@ -343,7 +761,7 @@ class BrandGuidePDF:
         custom_styles = {
             'TRPCoverTitle': ParagraphStyle(
                 name='TRPCoverTitle',
-                fontName='Helvetica-Bold',
+                fontName=PDF_FONTS['heading'],
                 fontSize=36,
                 textColor=white,
                 alignment=TA_CENTER,
@@ -351,7 +769,7 @@ class BrandGuidePDF:
             ),
             'TRPCoverSubtitle': ParagraphStyle(
                 name='TRPCoverSubtitle',
-                fontName='Helvetica',
+                fontName=PDF_FONTS['body'],
                 fontSize=18,
                 textColor=white,
                 alignment=TA_CENTER,
@@ -359,7 +777,7 @@ class BrandGuidePDF:
             ),
             'TRPSectionHeader': ParagraphStyle(
                 name='TRPSectionHeader',
-                fontName='Helvetica-Bold',
+                fontName=PDF_FONTS['heading'],
                 fontSize=28,
                 textColor=NAVY,
                 alignment=TA_LEFT,
@@ -368,7 +786,7 @@ class BrandGuidePDF:
             ),
             'TRPSubsectionHeader': ParagraphStyle(
                 name='TRPSubsectionHeader',
-                fontName='Helvetica-Bold',
+                fontName=PDF_FONTS['heading'],
                 fontSize=16,
                 textColor=NAVY,
                 alignment=TA_LEFT,
@@ -377,7 +795,7 @@ class BrandGuidePDF:
             ),
             'TRPBodyText': ParagraphStyle(
                 name='TRPBodyText',
-                fontName='Helvetica',
+                fontName=PDF_FONTS['body'],
                 fontSize=11,
                 textColor=DARK_GRAY,
                 alignment=TA_JUSTIFY,
@@ -387,7 +805,7 @@ class BrandGuidePDF:
             ),
             'TRPQuoteText': ParagraphStyle(
                 name='TRPQuoteText',
-                fontName='Helvetica-Oblique',
+                fontName=PDF_FONTS['emphasis'],
                 fontSize=13,
                 textColor=NAVY,
                 alignment=TA_CENTER,
@@ -399,14 +817,14 @@ class BrandGuidePDF:
             ),
             'TRPTableHeader': ParagraphStyle(
                 name='TRPTableHeader',
-                fontName='Helvetica-Bold',
+                fontName=PDF_FONTS['heading'],
                 fontSize=10,
                 textColor=white,
                 alignment=TA_LEFT
             ),
             'TRPTableCell': ParagraphStyle(
                 name='TRPTableCell',
-                fontName='Helvetica',
+                fontName=PDF_FONTS['body'],
                 fontSize=9,
                 textColor=DARK_GRAY,
                 alignment=TA_LEFT,
@@ -414,7 +832,7 @@ class BrandGuidePDF:
             ),
             'TRPTOCItem': ParagraphStyle(
                 name='TRPTOCItem',
-                fontName='Helvetica',
+                fontName=PDF_FONTS['body'],
                 fontSize=12,
                 textColor=NAVY,
                 alignment=TA_LEFT,
@@ -433,8 +851,7 @@ class BrandGuidePDF:
         """Add cover page with image above text."""
         if cover_image_path and Path(cover_image_path).exists():
             # Large image above text (fit within margins, leave room for title)
-            img = Image(cover_image_path, width=7*inch, height=4.5*inch)
-            self.story.append(img)
+            self.story.append(self._image_flowable(cover_image_path, width=7*inch, height=4.5*inch))
             self.story.append(Spacer(1, 0.3*inch))
         else:
             # Text-based cover
@@ -454,7 +871,7 @@ class BrandGuidePDF:
             "Brand Guidelines",
             ParagraphStyle(
                 'TRPBrandGuide',
-                fontName='Helvetica-Bold',
+                fontName=PDF_FONTS['heading'],
                 fontSize=24,
                 textColor=GOLD,
                 alignment=TA_CENTER
@@ -465,7 +882,7 @@ class BrandGuidePDF:
             "Demystifying AI for Black and Latino Educators",
             ParagraphStyle(
                 'TRPTagline',
-                fontName='Helvetica-Oblique',
+                fontName=PDF_FONTS['emphasis'],
                 fontSize=14,
                 textColor=ELECTRIC_BLUE,
                 alignment=TA_CENTER
@@ -524,21 +941,19 @@ class BrandGuidePDF:
         """Add styled quote."""
         self.story.append(Paragraph(f'"{text}"', self.styles['TRPQuoteText']))
 
-    def add_image(self, image_path, width=6*inch, height=None, caption=None):
-        """Add image with optional caption."""
+    def add_image(self, image_path, width=None, height=None, caption=None):
+        """Add image with optional caption (default width 6 inches)."""
+        if width is None:
+            width = 6 * inch
         if Path(image_path).exists():
-            if height:
-                img = Image(image_path, width=width, height=height)
-            else:
-                img = Image(image_path, width=width)
-            self.story.append(img)
+            self.story.append(self._image_flowable(image_path, width=width, height=height))
 
             if caption:
                 self.story.append(Paragraph(
                     caption,
                     ParagraphStyle(
                         'TRPImageCaption',
-                        fontName='Helvetica-Oblique',
+                        fontName=PDF_FONTS['emphasis'],
                         fontSize=9,
                         textColor=DARK_GRAY,
                         alignment=TA_CENTER,
@@ -549,14 +964,19 @@ class BrandGuidePDF:
             else:
                 self.story.append(Spacer(1, 15))
 
+    def _image_flowable(self, image_path, width, height=None):
+        """Create an image flowable that opens its optimized copy only at draw time."""
+        path, width, height = self.images.prepare(image_path, width, height)
+        return Image(path, width=width, height=height, lazy=2)
+
     def add_color_palette_section(self):
         """Add visual color palette section."""
         self.add_section_header("COLOR PALETTE")
 
         colors = [
-            ("Primary: Navy Blue", "#0B1D3A", NAVY, "Authority, Trust, Professionalism"),
-            ("Secondary: Gold", "#FFD33A", GOLD, "Optimism, Warmth, Excellence"),
-            ("Accent: Electric Blue", "#00D9FF", ELECTRIC_BLUE, "Innovation, Technology, Future")
+            ("Primary: Navy Blue", REIMAGINED.navy.hex, NAVY, "Authority, Trust, Professionalism"),
+            ("Secondary: Gold", REIMAGINED.gold.hex, GOLD, "Optimism, Warmth, Excellence"),
+            ("Accent: Electric Blue", REIMAGINED.electric_blue.hex, ELECTRIC_BLUE, "Innovation, Technology, Future")
         ]
 
         for name, hex_code, color, meaning in colors:
@@ -586,7 +1006,7 @@ class BrandGuidePDF:
             "ABCDEFGHIJKLMNOPQRSTUVWXYZ<br/>abcdefghijklmnopqrstuvwxyz<br/>0123456789",
             ParagraphStyle(
                 'TRPFontSample1',
-                fontName='Helvetica-Bold',
+                fontName=PDF_FONTS['heading'],
                 fontSize=14,
                 textColor=NAVY,
                 leading=20,
@@ -603,7 +1023,7 @@ class BrandGuidePDF:
             "ABCDEFGHIJKLMNOPQRSTUVWXYZ<br/>abcdefghijklmnopqrstuvwxyz<br/>0123456789",
             ParagraphStyle(
                 'TRPFontSample2',
-                fontName='Helvetica',
+                fontName=PDF_FONTS['body'],
                 fontSize=14,
                 textColor=DARK_GRAY,
                 leading=20,
@@ -699,8 +1119,12 @@ class BrandGuidePDF:
         self.add_subsection_header("Brand Assets")
         self.add_body_text("For brand assets, templates, and guidelines, please contact the marketing team. All brand materials should be used in accordance with these guidelines to maintain consistency and brand integrity.")
 
-    def build(self, output_path):
-        """Build the final PDF."""
+    def build(self, output_path, sections=None):
+        """Build the final PDF.
+
+        If sections is a generator that fills self.story and yields at each section
+        boundary, pages are laid out section by section instead of from one big story.
+        """
         doc = SimpleDocTemplate(
             str(output_path),
             pagesize=letter,
@@ -710,111 +1134,143 @@ class BrandGuidePDF:
             rightMargin=0.75*inch
         )
 
-        doc.build(self.story)
+        doc.build(self.story if sections is None else _SectionStream(self, sections))
         print(f"\n  [OK] PDF saved: {output_path}")
 
 # ==================== MAIN WORKFLOW ====================
 
-def generate_graphics():
-    """Generate all branded graphics using PIL."""
-    print("\n[Phase 2] Generating branded graphics with PIL...")
-
-    images = {
-        'cover': None,
-        'logos': [],
-        'color_palette': None,
-        'templates': []
-    }
-
-    # Cover graphic
-    cover_path = str(ASSETS_DIR / "cover_graphic.png")
-    create_cover_graphic(cover_path)
-    images['cover'] = cover_path
+def graphic_tasks():
+    """Describe every branded graphic as (slot, function, output path, kwargs)."""
+    tasks = [('cover', create_cover_graphic, ASSETS_DIR / "cover_graphic.png", {})]
 
     # Logo concepts
     for i in range(1, 4):
-        logo_path = str(ASSETS_DIR / f"logo_concept_{i}.png")
-        create_logo_concept(logo_path, variant=i)
-        images['logos'].append(logo_path)
+        tasks.append(('logos', create_logo_concept, ASSETS_DIR / f"logo_concept_{i}.png", {'variant': i}))
 
     # Color palette
-    palette_path = str(ASSETS_DIR / "color_palette.png")
-    create_color_palette_visual(palette_path)
-    images['color_palette'] = palette_path
+    tasks.append(('color_palette', create_color_palette_visual, ASSETS_DIR / "color_palette.png", {}))
 
     # Social templates
     template_types = ["podcast", "instagram_quote", "instagram_stat", "facebook", "linkedin", "email"]
     for template_type in template_types:
-        template_path = str(ASSETS_DIR / f"{template_type}_template.png")
-        create_social_template(template_path, template_type)
-        images['templates'].append(template_path)
+        tasks.append(('templates', create_social_template, ASSETS_DIR / f"{template_type}_template.png",
+                      {'template_type': template_type}))
+
+    return tasks
+
+def _code_sources(obj, seen=None):
+    """Source of a function plus every function/class of this module it references."""
+    seen = set() if seen is None else seen
+    if obj in seen:
+        return []
+    seen.add(obj)
+
+    sources = [inspect.getsource(obj)]
+    for name in getattr(getattr(obj, '__code__', None), 'co_names', ()):
+        dep = globals().get(name)
+        if (inspect.isfunction(dep) or inspect.isclass(dep)) and dep.__module__ == obj.__module__:
+            sources += _code_sources(dep, seen)
+    return sources
+
+def asset_key(func, kwargs):
+    """Hash a graphic's code (including helpers it calls), parameters and brand colors."""
+    payload = repr((
+        _code_sources(func),
+        sorted(kwargs.items()),
+        (NAVY_RGB, GOLD_RGB, ELECTRIC_BLUE_RGB, WHITE_RGB, DARK_GRAY_RGB)
+    ))
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+def is_current(output_path, key):
+    """Check whether an existing graphic was rendered with the same asset key."""
+    try:
+        with PILImage.open(output_path) as img:
+            return img.info.get(GRAPHIC_META_KEY) == key
+    except OSError:
+        return False
+
+def _render_graphic(func, output_path, kwargs, key):
+    func(output_path, asset_key=key, **kwargs)
+    return output_path
 
-    return images
+def iter_graphics(tasks, max_workers=None):
+    """Render stale graphics on a process pool, yielding (slot, path) as each one is ready."""
+    stale = []
+    for slot, func, output_path, kwargs in tasks:
+        key = asset_key(func, kwargs)
+        if is_current(output_path, key):
+            print(f"  Up to date: {Path(output_path).name}")
+            yield slot, str(output_path)
+        else:
+            stale.append((slot, func, str(output_path), kwargs, key))
 
-def build_pdf(content, images):
-    """Build the premium PDF."""
-    print("\n[Phase 3] Building premium PDF...")
+    if not stale:
+        return
+
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        futures = {
+            pool.submit(_render_graphic, func, output_path, kwargs, key): slot
+            for slot, func, output_path, kwargs, key in stale
+        }
+        for future in as_completed(futures):
+            yield futures[future], future.result()
+
+def generate_graphics(max_workers=None):
+    """Generate all branded graphics using PIL, in parallel, skipping up-to-date files."""
+    print("\n[Phase 2] Generating branded graphics with PIL...")
 
-    pdf = BrandGuidePDF()
+    tasks = graphic_tasks()
+    for _ in iter_graphics(tasks, max_workers):
+        pass
 
+    # Assemble in task order so logos and templates keep their sequence
+    images = {
+        'cover': None,
+        'logos': [],
+        'color_palette': None,
+        'templates': []
+    }
+    for slot, _, output_path, _ in tasks:
+        if isinstance(images[slot], list):
+            images[slot].append(str(output_path))
+        else:
+            images[slot] = str(output_path)
+
+    return images
+
+def compose_sections(pdf, content, images):
+    """Fill pdf.story with the guide content, yielding at every section boundary."""
     # Cover page
     pdf.add_cover_page(images.get('cover'))
+    yield
 
     # Table of contents
     pdf.add_toc()
-
-    # Hero images from existing files
-    hero_images = {
-        'mission': BASE_DIR / 'page2_hero_image.png',
-        'brand story': BASE_DIR / 'page3_hero_image.png',
-        'target': BASE_DIR / 'page4_hero_image.png',
-        'voice': BASE_DIR / 'page5_hero_image.png'
-    }
+    yield
 
     # Process content from Word doc
+    classifier = SectionClassifier(SECTION_KEYWORDS, HERO_IMAGES)
     current_section = None
     sections_added = set()
-    table_idx = 0
-
-    section_keywords = {
-        'mission': 'MISSION & VISION',
-        'vision': 'MISSION & VISION',
-        'brand story': 'BRAND STORY',
-        'target': 'TARGET AUDIENCE',
-        'audience': 'TARGET AUDIENCE',
-        'voice': 'BRAND VOICE & TONE',
-        'tone': 'BRAND VOICE & TONE',
-        'pillar': 'BRAND PILLARS',
-        'imagery': 'IMAGERY GUIDELINES',
-        'visual language': 'VISUAL LANGUAGE',
-        'application': 'APPLICATION EXAMPLES',
-        'do\'s': 'DO\'S & DON\'TS',
-        'don\'t': 'DO\'S & DON\'TS',
-        'social media': 'SOCIAL MEDIA GUIDELINES',
-        'contact': 'CONTACT & RESOURCES'
-    }
 
     for para in content['paragraphs']:
         text = para['text']
         is_heading = para['is_heading']
-        text_lower = text.lower()
-
-        # Check for new section
-        for keyword, section_name in section_keywords.items():
-            if keyword in text_lower and is_heading:
-                if section_name not in sections_added:
-                    if current_section:
-                        pdf.story.append(PageBreak())
-                    current_section = section_name
-                    sections_added.add(section_name)
-                    pdf.add_section_header(section_name)
-
-                    # Add hero image if available (constrained size to fit page)
-                    for hero_key, hero_path in hero_images.items():
-                        if hero_key in text_lower and hero_path.exists():
-                            pdf.add_image(str(hero_path), width=5*inch, height=3*inch)
-                            break
-                break
+
+        # Check for new section (only headings can open one)
+        section_name, hero_path = classifier.classify(text) if is_heading else (None, None)
+        if section_name:
+            if section_name not in sections_added:
+                if current_section:
+                    yield
+                    pdf.story.append(PageBreak())
+                current_section = section_name
+                sections_added.add(section_name)
+                pdf.add_section_header(section_name)
+
+                # Add hero image if available (constrained size to fit page)
+                if hero_path:
+                    pdf.add_image(str(hero_path), width=5*inch, height=3*inch)
         else:
             # Add content
             if current_section:
@@ -829,25 +1285,42 @@ def build_pdf(content, images):
     for table_data in content['tables'][:10]:  # Limit to first 10 tables
         if len(table_data) > 1:
             pdf.add_table(table_data)
+    yield
 
     # Add custom sections
-    pdf.story.append(PageBreak())
-    pdf.add_logo_section(images['logos'])
-
-    pdf.story.append(PageBreak())
-    pdf.add_color_palette_section()
-
-    pdf.story.append(PageBreak())
-    pdf.add_typography_section()
-
-    pdf.story.append(PageBreak())
-    pdf.add_templates_section(images['templates'])
+    for add_section in (
+        lambda: pdf.add_logo_section(images['logos']),
+        pdf.add_color_palette_section,
+        pdf.add_typography_section,
+        lambda: pdf.add_templates_section(images['templates']),
+        pdf.add_contact_section,
+    ):
+        pdf.story.append(PageBreak())
+        add_section()
+        yield
+
+def build_pdf(content, images, streaming=True, profile='screen'):
+    """Build the premium PDF with images optimized for the given output profile.
+
+    In streaming mode each section is laid out and released before the next one
+    is composed; otherwise the whole story is assembled first.
+    """
+    print("\n[Phase 3] Building premium PDF...")
 
-    pdf.story.append(PageBreak())
-    pdf.add_contact_section()
+    with stage("pdf: styles"):
+        pdf = BrandGuidePDF(profile)
+    sections = compose_sections(pdf, content, images)
 
     # Build PDF
-    pdf.build(OUTPUT_PDF)
+    with stage("pdf: layout and write"):
+        if streaming:
+            pdf.build(OUTPUT_PDF, sections=sections)
+        else:
+            for _ in sections:
+                pass
+            pdf.build(OUTPUT_PDF)
+
+    pdf.images.report()
     return OUTPUT_PDF
 
 def validate_pdf(pdf_path):
@@ -878,7 +1351,7 @@ def validate_pdf(pdf_path):
 
     return {'pages': page_count, 'size_mb': file_size_mb, 'valid': len(issues) == 0}
 
-def main():
+def main(profile='screen'):
     """Main execution."""
     print("=" * 60)
     print("THE RIGHT PATH - PREMIUM BRAND GUIDE PDF GENERATOR v2")
@@ -887,16 +1360,20 @@ def main():
     start = datetime.now()
 
     # Phase 1: Extract content
-    content = extract_word_content()
+    with stage("pdf: extract content"):
+        content = extract_word_content()
 
     # Phase 2: Generate graphics
-    images = generate_graphics()
+    with stage("pdf: graphics"):
+        images = generate_graphics()
 
     # Phase 3: Build PDF
-    pdf_path = build_pdf(content, images)
+    with stage("pdf: build"):
+        pdf_path = build_pdf(content, images, profile=profile)
 
     # Phase 4: Validate
-    result = validate_pdf(pdf_path)
+    with stage("pdf: validate"):
+        result = validate_pdf(pdf_path)
 
     elapsed = (datetime.now() - start).total_seconds()
 
@@ -912,4 +1389,9 @@ def main():
     return pdf_path
 
 if __name__ == "__main__":
-    main()
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Generate the premium brand guide PDF.")
+    parser.add_argument("--profile", choices=sorted(OUTPUT_PROFILES), default="screen",
+                        help="image resolution/compression profile (default: screen)")
+    main(profile=parser.parse_args().profile)
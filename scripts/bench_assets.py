@@ -0,0 +1,363 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite for the image compositors and document builders
+
+Runs every compositor and builder against deterministic synthetic fixtures (a
+seeded 1024x1792 hero, a fake logo, a Zoom base and placeholder guide text) in
+a temporary directory, so no network, API key or real asset is needed. Each
+benchmark runs in its own worker process and reports first-run and median wall
+time plus the process's peak RSS. Results are appended to a history file in
+docs/benchmarks (commit it with the change being measured so the numbers show
+up in review), and any benchmark more than 20% slower than the previous run on
+the same platform is flagged.
+
+Usage:
+    python bench_assets.py
+    python bench_assets.py --only cover_next_level pdf_build --repeat 5
+    python bench_assets.py --no-save
+"""
+import sys
+import json
+import platform
+import argparse
+import tempfile
+import subprocess
+from pathlib import Path
+from datetime import datetime
+from statistics import median
+from time import perf_counter
+from concurrent.futures import ProcessPoolExecutor
+
+# Paths
+SCRIPT_DIR = Path(__file__).resolve().parent
+REPO_DIR = SCRIPT_DIR.parent
+BRANDING_DIR = REPO_DIR / "assets" / "branding-guide"
+HISTORY_PATH = REPO_DIR / "docs" / "benchmarks" / "asset_benchmarks.jsonl"
+
+# A benchmark this much slower than the previous run is flagged
+REGRESSION_THRESHOLD = 0.2
+
+HERO_SIZE = (1024, 1792)
+
+# =============================================================================
+# FIXTURES
+# =============================================================================
+
+def make_hero(path, size=HERO_SIZE, seed=7):
+    """Seeded stand-in for an AI hero image: navy-to-blue gradient, glows and grain."""
+    import numpy as np
+    from PIL import Image, ImageDraw, ImageFilter
+
+    width, height = size
+    rng = np.random.default_rng(seed)
+    t = np.linspace(0, 1, height, dtype=np.float32)[:, None, None]
+    top, bottom = np.array([11, 29, 58], np.float32), np.array([0, 120, 170], np.float32)
+    pixels = np.broadcast_to(top + (bottom - top) * t, (height, width, 3)).copy()
+    pixels += rng.normal(0, 12, pixels.shape).astype(np.float32)
+    hero = Image.fromarray(np.clip(pixels, 0, 255).astype(np.uint8))
+
+    glow = Image.new('RGB', size)
+    draw = ImageDraw.Draw(glow)
+    for _ in range(12):
+        x, y, r = rng.integers(0, width), rng.integers(0, height), rng.integers(40, 220)
+        draw.ellipse((x - r, y - r, x + r, y + r), fill=tuple(int(c) for c in rng.integers(60, 255, 3)))
+    hero = Image.blend(hero, glow.filter(ImageFilter.GaussianBlur(60)), 0.35)
+    hero.save(path)
+    return path
+
+
+def make_logo(path, size=(900, 300)):
+    """Transparent wordmark-like logo."""
+    from PIL import Image, ImageDraw, ImageFont
+
+    logo = Image.new('RGBA', size, (0, 0, 0, 0))
+    draw = ImageDraw.Draw(logo)
+    draw.rounded_rectangle((10, 10, size[1] - 10, size[1] - 10), radius=40, fill=(107, 45, 139, 255))
+    draw.text((size[1] + 20, size[1] // 3), "THE RIGHT PATH", font=ImageFont.load_default(72),
+              fill=(44, 44, 44, 255))
+    logo.save(path)
+    return path
+
+
+def make_content(sections=8, paragraphs=12):
+    """Placeholder guide content shaped like extract_word_content's output."""
+    headings = ["MISSION", "BRAND STORY", "TARGET AUDIENCE", "BRAND VOICE", "BRAND PILLARS",
+                "IMAGERY", "VISUAL LANGUAGE", "SOCIAL MEDIA"]
+    text = ("The Right Path helps students and families find the education and career route "
+            "that fits them, with clear guidance at every step. ") * 3
+    content = {'paragraphs': [], 'tables': []}
+    for heading in headings[:sections]:
+        content['paragraphs'].append({'text': heading, 'style': 'Heading 1', 'is_heading': True})
+        for i in range(paragraphs):
+            content['paragraphs'].append({'text': f"{i + 1}. {text}", 'style': 'Normal', 'is_heading': False})
+    content['tables'].append([["Color", "Hex", "Use"], ["Purple", "#6B2D8B", "Primary accent"],
+                              ["Charcoal", "#2C2C2C", "Body text"]])
+    return content
+
+
+def make_fixtures(directory):
+    """Write every fixture into directory and return their paths."""
+    from PIL import Image
+
+    directory = Path(directory)
+    fixtures = {
+        'hero': str(make_hero(directory / "hero.png")),
+        'logo': str(make_logo(directory / "logo.png")),
+        'zoom_base': str(directory / "zoom_base.png"),
+    }
+    Image.open(fixtures['hero']).resize((1920, 1080)).save(fixtures['zoom_base'])
+    return fixtures
+
+# =============================================================================
+# BENCHMARKS
+# =============================================================================
+# Each benchmark takes (fixtures, out_dir) and writes its output into out_dir.
+
+def _import_path():
+    for path in (SCRIPT_DIR, BRANDING_DIR):
+        if str(path) not in sys.path:
+            sys.path.insert(0, str(path))
+
+
+def bench_cover_v1(fixtures, out_dir):
+    from create_cover_page import create_cover_page
+    create_cover_page(fixtures['hero'], out_dir / "cover_v1.png")
+
+
+def bench_cover_v2(fixtures, out_dir):
+    from create_cover_page_v2 import create_cover_page_v2
+    create_cover_page_v2(fixtures['hero'], out_dir / "cover_v2.png")
+
+
+def bench_cover_next_level(fixtures, out_dir):
+    from create_cover_page_next_level import create_next_level_cover
+    create_next_level_cover(out_dir / "cover_next_level.png", fixtures['hero'])
+
+
+def _zoom_branding(module_name, fixtures, out_dir):
+    import importlib
+    from PIL import Image
+
+    module = importlib.import_module(module_name)
+    module.LOGO_PATH = Path(fixtures['logo'])
+    module.add_branding(Image.open(fixtures['zoom_base'])).save(out_dir / f"{module_name}.png")
+
+
+def bench_zoom_branding(fixtures, out_dir):
+    _zoom_branding("generate_branded_zoom_background", fixtures, out_dir)
+
+
+def bench_zoom_branding_nano(fixtures, out_dir):
+    _zoom_branding("generate_branded_zoom_nano_banana", fixtures, out_dir)
+
+
+def bench_pdf_cover_graphic(fixtures, out_dir):
+    from generate_premium_pdf_v2 import create_cover_graphic
+    create_cover_graphic(out_dir / "cover_graphic.png")
+
+
+def bench_pdf_logo_concept(fixtures, out_dir):
+    from generate_premium_pdf_v2 import create_logo_concept
+    for variant in (1, 2, 3):
+        create_logo_concept(out_dir / f"logo_concept_{variant}.png", variant=variant)
+
+
+def bench_pdf_color_palette(fixtures, out_dir):
+    from generate_premium_pdf_v2 import create_color_palette_visual
+    create_color_palette_visual(out_dir / "color_palette.png")
+
+
+def bench_pdf_social_templates(fixtures, out_dir):
+    from generate_premium_pdf_v2 import create_social_template
+    for template_type in ("podcast", "instagram_quote", "instagram_stat", "facebook", "linkedin", "email"):
+        create_social_template(out_dir / f"{template_type}_template.png", template_type=template_type)
+
+
+def bench_guide_docx(fixtures, out_dir):
+    from generate_reimagined_brand_guide import ReimagineEDBrandGuide
+
+    guide = ReimagineEDBrandGuide()
+    guide.build({page: [fixtures['hero']] for page in (2, 4, 6, 10)}, fixtures['logo'])
+    guide.save(out_dir / "guide.docx")
+
+
+def bench_pdf_build(fixtures, out_dir):
+    import generate_premium_pdf_v2 as premium
+
+    # Every section hero comes from the fixture so the result does not depend on local files
+    premium.HERO_IMAGES = {keyword: Path(fixtures['hero']) for keyword in premium.HERO_IMAGES}
+    images = {
+        'cover': fixtures['hero'],
+        'logos': [fixtures['logo']] * 3,
+        'color_palette': fixtures['zoom_base'],
+        'templates': [fixtures['zoom_base']] * 2,
+    }
+    pdf = premium.BrandGuidePDF()
+    pdf.images = premium.ImageOptimizer(cache_dir=out_dir / "display")
+    pdf.build(out_dir / "guide.pdf", sections=premium.compose_sections(pdf, make_content(), images))
+
+
+BENCHMARKS = {
+    'cover_v1': bench_cover_v1,
+    'cover_v2': bench_cover_v2,
+    'cover_next_level': bench_cover_next_level,
+    'zoom_branding': bench_zoom_branding,
+    'zoom_branding_nano': bench_zoom_branding_nano,
+    'pdf_cover_graphic': bench_pdf_cover_graphic,
+    'pdf_logo_concepts': bench_pdf_logo_concept,
+    'pdf_color_palette': bench_pdf_color_palette,
+    'pdf_social_templates': bench_pdf_social_templates,
+    'guide_docx': bench_guide_docx,
+    'pdf_build': bench_pdf_build,
+}
+
+# =============================================================================
+# RUNNER
+# =============================================================================
+
+def peak_rss_mb():
+    """Peak resident set size of this process in MB, or None where it cannot be read."""
+    try:
+        import resource
+    except ImportError:
+        try:
+            import psutil
+        except ImportError:
+            return None
+        return psutil.Process().memory_info().peak_wset / 1024 / 1024
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / 1024 / 1024 if sys.platform == 'darwin' else peak / 1024  # bytes on macOS, KB elsewhere
+
+
+def run_benchmark(name, fixtures, work_dir, repeat):
+    """Run one benchmark repeat times in this (worker) process; output is discarded."""
+    import io
+    import contextlib
+
+    _import_path()
+    times = []
+    for i in range(repeat):
+        out_dir = Path(work_dir) / f"{name}_{i}"
+        out_dir.mkdir(parents=True)
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = perf_counter()
+            BENCHMARKS[name](fixtures, out_dir)
+            times.append((perf_counter() - start) * 1000)
+
+    peak = peak_rss_mb()
+    return {
+        'first_ms': round(times[0], 1),
+        'median_ms': round(median(times), 1),
+        'peak_rss_mb': round(peak, 1) if peak is not None else None,
+    }
+
+
+def run_suite(names, repeat=3):
+    """Run benchmarks, each in a fresh worker process; returns {name: result or {'error': ...}}."""
+    results = {}
+    with tempfile.TemporaryDirectory(prefix="bench_assets_") as work_dir:
+        fixtures = make_fixtures(work_dir)
+        for name in names:
+            print(f"  {name}...", end=" ", flush=True)
+            with ProcessPoolExecutor(max_workers=1) as pool:
+                try:
+                    results[name] = pool.submit(run_benchmark, name, fixtures, work_dir, repeat).result()
+                except Exception as e:
+                    results[name] = {'error': f"{type(e).__name__}: {e}"}
+            result = results[name]
+            print(result['error'] if 'error' in result else f"{result['median_ms']:.0f} ms")
+    return results
+
+
+def git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=REPO_DIR,
+                              capture_output=True, text=True).stdout.strip() or None
+    except OSError:
+        return None
+
+
+def load_history(path=HISTORY_PATH):
+    path = Path(path)
+    if not path.exists():
+        return []
+    with open(path, encoding='utf-8') as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def append_history(entry, path=HISTORY_PATH):
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'a', encoding='utf-8') as f:
+        f.write(json.dumps(entry, sort_keys=True) + "\n")
+
+
+def compare(results, previous, threshold=REGRESSION_THRESHOLD):
+    """Names of benchmarks whose median slowed by more than threshold since previous results."""
+    regressions = []
+    for name, result in results.items():
+        before = previous.get(name, {}).get('median_ms')
+        if before and 'median_ms' in result and result['median_ms'] > before * (1 + threshold):
+            regressions.append(name)
+    return regressions
+
+
+def print_results(results, previous):
+    print(f"\n  {'benchmark':<22} {'first':>9} {'median':>9} {'peak RSS':>10} {'vs last':>8}")
+    for name, result in results.items():
+        if 'error' in result:
+            print(f"  {name:<22} skipped: {result['error']}")
+            continue
+        before = previous.get(name, {}).get('median_ms')
+        change = f"{(result['median_ms'] / before - 1):+.0%}" if before else "-"
+        rss = f"{result['peak_rss_mb']:.0f} MB" if result['peak_rss_mb'] is not None else "n/a"
+        print(f"  {name:<22} {result['first_ms']:7.0f}ms {result['median_ms']:7.0f}ms {rss:>10} {change:>8}")
+
+
+def main():
+    """Main execution."""
+    parser = argparse.ArgumentParser(description="Benchmark the compositors and document builders offline.")
+    parser.add_argument("--only", nargs="+", metavar="NAME", help=f"benchmarks to run: {', '.join(BENCHMARKS)}")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per benchmark (default: 3)")
+    parser.add_argument("--history", default=str(HISTORY_PATH), help="results history file (JSON lines)")
+    parser.add_argument("--no-save", action="store_true", help="do not append this run to the history")
+    args = parser.parse_args()
+    unknown = [name for name in args.only or [] if name not in BENCHMARKS]
+    if unknown:
+        parser.error(f"unknown benchmark(s): {', '.join(unknown)}")
+
+    print("=" * 60)
+    print("Asset Benchmarks")
+    print("=" * 60)
+
+    results = run_suite(args.only or list(BENCHMARKS), args.repeat)
+    # Only runs on the same platform are comparable
+    same_platform = [h for h in load_history(args.history) if h['platform'] == platform.platform()]
+    previous = same_platform[-1]['results'] if same_platform else {}
+    print_results(results, previous)
+
+    if not args.no_save:
+        append_history({
+            'date': datetime.now().isoformat(timespec='seconds'),
+            'commit': git_commit(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'repeat': args.repeat,
+            'results': results,
+        }, args.history)
+        print(f"\nHistory: {args.history}")
+
+    regressions = compare(results, previous)
+    print("\n" + "=" * 60)
+    if regressions:
+        print(f"REGRESSION (> {REGRESSION_THRESHOLD:.0%} slower): {', '.join(regressions)}")
+    else:
+        print("No regressions against the previous run")
+    print("=" * 60)
+
+    return not regressions
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Startup benchmark for the asset CLI
+
+Times `cli.py --help` and a planning-only build in fresh interpreters (the
+cost a user pays before any work starts) and measures each script's import
+time with `python -X importtime`. Times are reported above a bare interpreter
+start so the figures do not depend on how slow the machine boots Python.
+
+Usage:
+    python bench_startup.py
+    python bench_startup.py --repeat 10 --budget 100
+"""
+import sys
+import time
+import argparse
+import subprocess
+from statistics import median
+
+from cli import COMMANDS, SCRIPT_DIR
+
+# Startup overhead above a bare interpreter allowed for --help
+BUDGET_MS = 100
+
+# CLI invocations whose startup is timed
+CLI_RUNS = {
+    '--help': ["--help"],
+    'build --dry-run': ["build", "--dry-run"],
+}
+
+
+def wall_ms(args, repeat):
+    """Median wall time in ms of running python with args."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, *args], cwd=SCRIPT_DIR, capture_output=True)
+        times.append((time.perf_counter() - start) * 1000)
+    return median(times)
+
+
+def import_ms(module, directory, repeat):
+    """Median cumulative import time in ms of a module, or an error message if it cannot be imported."""
+    code = f"import sys; sys.path[:0] = [{str(SCRIPT_DIR)!r}, {str(directory)!r}]; import {module}"
+    times = []
+    for _ in range(repeat):
+        result = subprocess.run([sys.executable, "-X", "importtime", "-c", code],
+                                cwd=SCRIPT_DIR, capture_output=True, text=True)
+        if result.returncode:
+            return result.stderr.strip().splitlines()[-1]
+        # Last importtime line is the module itself: "import time: self | cumulative | name"
+        line = [l for l in result.stderr.splitlines() if l.startswith("import time:")][-1]
+        times.append(int(line.split("|")[1]) / 1000)
+    return median(times)
+
+
+def main():
+    """Main execution."""
+    parser = argparse.ArgumentParser(description="Measure CLI startup and per-script import time.")
+    parser.add_argument("--repeat", type=int, default=5, help="runs per measurement (default: 5)")
+    parser.add_argument("--budget", type=float, default=BUDGET_MS,
+                        help=f"allowed --help overhead in ms (default: {BUDGET_MS})")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("CLI Startup Benchmark")
+    print("=" * 60)
+
+    baseline = wall_ms(["-c", "pass"], args.repeat)
+    print(f"\nBare interpreter: {baseline:.0f} ms")
+
+    print("\nCLI (wall time above bare interpreter):")
+    overheads = {}
+    for label, cli_args in CLI_RUNS.items():
+        overheads[label] = wall_ms(["cli.py", *cli_args], args.repeat) - baseline
+        print(f"  {label:<20} {overheads[label]:7.0f} ms")
+
+    print("\nScript import time:")
+    for name, (module, directory, _) in COMMANDS.items():
+        result = import_ms(module, directory, args.repeat)
+        shown = f"{result:7.0f} ms" if isinstance(result, float) else f"   n/a  ({result})"
+        print(f"  {name:<20} {shown}")
+
+    passed = overheads['--help'] <= args.budget
+    print("\n" + "=" * 60)
+    print(f"--help overhead {overheads['--help']:.0f} ms (budget {args.budget:.0f} ms): "
+          f"{'PASS' if passed else 'FAIL'}")
+    print("=" * 60)
+
+    return passed
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
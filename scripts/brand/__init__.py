@@ -0,0 +1,14 @@
+"""
+Brand tokens for ReimagineED and The Right Path
+
+Colors (every representation precomputed), font stacks, type sizes and
+spacing. Importing the package is cheap: it does not import PIL, ReportLab
+or python-docx.
+
+    from brand import REIMAGINED
+    REIMAGINED.navy.rgb        # (11, 29, 58)
+    REIMAGINED.gold.rgba(200)  # (255, 211, 58, 200)
+    REIMAGINED.navy.reportlab  # HexColor, created on first use
+"""
+from .colors import COMMON_ALPHAS, Color, Palette, PALETTES, REIMAGINED, RIGHT_PATH, SRGB_TO_XYZ, srgb_to_lab
+from .typography import DOCUMENT_FONTS, FONT_FILES, PDF_FONTS, SIZES, SPACING
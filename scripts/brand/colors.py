@@ -0,0 +1,123 @@
+"""
+Brand colors with every representation the generators need
+
+Hex, RGB, RGBA at the alphas the compositors use, and CIE Lab are computed
+once at import in plain Python. ReportLab HexColor and python-docx RGBColor
+objects are created on first access, so importing this module never pulls
+in those libraries.
+"""
+from functools import cached_property
+
+# Alpha levels (0-255) used by the compositors; RGBA tuples are prebuilt for these
+COMMON_ALPHAS = (15, 38, 45, 60, 128, 179, 180, 200, 204, 220, 230, 242, 255)
+
+
+# sRGB (D65) -> XYZ, each row divided by the reference white's component
+SRGB_TO_XYZ = tuple(
+    tuple(m / white for m in row)
+    for row, white in zip(((0.4124564, 0.3575761, 0.1804375),
+                           (0.2126729, 0.7151522, 0.0721750),
+                           (0.0193339, 0.1191920, 0.9503041)), (0.95047, 1.0, 1.08883))
+)
+
+
+def srgb_to_lab(rgb):
+    """CIE Lab (D65) of an sRGB 0-255 triple, or of every row of an (N, 3) NumPy array.
+
+    One formula for both: arrays swap in NumPy's element-wise where and cbrt,
+    so image pixels and the brand colors' .lab always agree.
+    """
+    if hasattr(rgb, 'shape'):
+        import numpy as np
+        channels = np.asarray(rgb, dtype=np.float32).T / np.float32(255)
+        where, cbrt = np.where, np.cbrt
+    else:
+        channels = [c / 255.0 for c in rgb]
+        where, cbrt = (lambda cond, a, b: a if cond else b), (lambda t: t ** (1 / 3))
+
+    r, g, b = (where(c <= 0.04045, c / 12.92, ((c + 0.055) / 1.055) ** 2.4) for c in channels)
+    x, y, z = (mr * r + mg * g + mb * b for mr, mg, mb in SRGB_TO_XYZ)
+    fx, fy, fz = (where(t > 0.008856, cbrt(t), 7.787 * t + 16 / 116) for t in (x, y, z))
+    lab = (116 * fy - 16, 500 * (fx - fy), 200 * (fy - fz))
+    return np.stack(lab, axis=1) if hasattr(rgb, 'shape') else lab
+
+
+class Color:
+    """One brand color."""
+
+    def __init__(self, name, hex_value):
+        self.name = name
+        self.hex = '#' + hex_value.lstrip('#').upper()
+        self.rgb = tuple(int(self.hex[i:i + 2], 16) for i in (1, 3, 5))
+        self.lab = srgb_to_lab(self.rgb)
+        self._rgba = {alpha: (*self.rgb, alpha) for alpha in COMMON_ALPHAS}
+
+    def rgba(self, alpha=255):
+        """RGBA tuple with alpha as 0-255."""
+        return self._rgba.get(alpha) or (*self.rgb, alpha)
+
+    @cached_property
+    def reportlab(self):
+        from reportlab.lib.colors import HexColor
+        return HexColor(self.hex)
+
+    @cached_property
+    def docx(self):
+        from docx.shared import RGBColor
+        return RGBColor(*self.rgb)
+
+    def __repr__(self):
+        return f"Color({self.name!r}, {self.hex!r})"
+
+
+class Palette:
+    """Named brand colors, available as attributes (palette.navy) or items (palette['navy'])."""
+
+    def __init__(self, name, **colors):
+        self.name = name
+        self.colors = {key: Color(key, value) for key, value in colors.items()}
+        self.__dict__.update(self.colors)
+
+    def __getitem__(self, key):
+        return self.colors[key]
+
+    def __iter__(self):
+        return iter(self.colors.values())
+
+    def items(self):
+        return self.colors.items()
+
+    def hex_map(self):
+        return {key: color.hex for key, color in self.colors.items()}
+
+    def __repr__(self):
+        return f"Palette({self.name!r}, {list(self.colors)})"
+
+
+# ReimagineED: tech-forward navy and gold with electric blue accents
+REIMAGINED = Palette(
+    'reimagined',
+    navy='#0B1D3A',
+    gold='#FFD33A',
+    electric_blue='#00D9FF',
+    purple='#7B2FFF',
+    coral='#FF6B6B',
+    white='#FFFFFF',
+    charcoal='#333333',
+    light_gray='#F5F5F5',
+)
+
+# The Right Path: warm purple on white
+RIGHT_PATH = Palette(
+    'right_path',
+    white='#FFFFFF',
+    purple='#6B2D8B',
+    light_purple='#8B4DAB',
+    dark_purple='#4A1D61',
+    charcoal='#2C2C2C',
+    gray_600='#6B6B6B',
+    gray_200='#E5E5E5',
+    off_white='#FAFAFA',
+)
+
+PALETTES = {palette.name: palette for palette in (REIMAGINED, RIGHT_PATH)}
@@ -0,0 +1,52 @@
+"""
+Font stacks, type sizes and spacing shared by the generators
+"""
+
+# TrueType files tried in order for each role (Windows fonts first, then
+# DejaVu, which ships with Pillow-friendly Linux installs)
+FONT_FILES = {
+    'bold': ("arialbd.ttf", "DejaVuSans-Bold.ttf"),
+    'regular': ("arial.ttf", "DejaVuSans.ttf"),
+    'italic': ("ariali.ttf", "DejaVuSans-Oblique.ttf"),
+    'mono_bold': ("courbd.ttf", "DejaVuSansMono-Bold.ttf"),
+    'serif': ("georgia.ttf", "C:/Windows/Fonts/georgia.ttf", "DejaVuSerif.ttf"),
+}
+
+# Built-in ReportLab fonts for the PDF guide
+PDF_FONTS = {
+    'heading': 'Helvetica-Bold',
+    'body': 'Helvetica',
+    'emphasis': 'Helvetica-Oblique',
+}
+
+# Word document fonts by brand (Georgia and Calibri stand in for Crimson Pro and DM Sans)
+DOCUMENT_FONTS = {
+    'reimagined': {'heading': 'Arial', 'body': 'Arial'},
+    'right_path': {'heading': 'Georgia', 'body': 'Calibri'},
+}
+
+# Type sizes in points
+SIZES = {
+    'cover_wordmark': 52,
+    'cover_title': 48,
+    'cover_subtitle': 36,
+    'section': 28,
+    'tagline': 18,
+    'subheader': 16,
+    'quote': 14,
+    'item': 12,
+    'body': 11,
+    'small': 10,
+    'caption': 9,
+}
+
+# Vertical rhythm in points
+SPACING = {
+    'none': 0,
+    'xs': 4,
+    'title': 6,
+    'sm': 8,
+    'paragraph': 10,
+    'md': 12,
+    'lg': 18,
+}
@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+"""
+Build orchestrator for the ReimagineED brand assets
+
+Runs the asset scripts as one dependency graph instead of by hand:
+
+    hero -> screen_hero -> cover -> validate_cover
+    extract_images, logo -> guide_docx -> guide_pdf
+
+Independent steps run concurrently, and a step is skipped when its script,
+arguments and input files are unchanged since it last succeeded.
+
+Usage:
+    python build_assets.py                    # build everything that is stale
+    python build_assets.py --dry-run          # show what would run
+    python build_assets.py validate_cover     # build one target and its prerequisites
+    python build_assets.py --touch hero       # adopt an existing hero image as up to date
+"""
+import argparse
+from pathlib import Path
+from datetime import datetime
+from functools import lru_cache
+
+from task_graph import TaskGraph, module_files
+
+# Paths
+SCRIPT_DIR = Path(__file__).parent
+REPO_DIR = SCRIPT_DIR.parent
+BRANDING_DIR = REPO_DIR / "assets" / "branding-guide"
+ASSESSMENTS_DIR = REPO_DIR / "docs" / "assessments"
+CACHE_PATH = BRANDING_DIR / ".build_cache.json"
+
+HERO_IMAGE = BRANDING_DIR / "cover_hero_image_1.png"
+HERO_PALETTE_REPORT = BRANDING_DIR / "cover_hero_image_1_palette.json"
+COVER_PAGE = BRANDING_DIR / "cover_page_next_level.png"
+COVER_ASSESSMENT = ASSESSMENTS_DIR / "cover_page_next_level_assessment.txt"
+
+PDF_SOURCE = REPO_DIR / "assets" / "AI-in-Action-Brand-Guide-Interactive.pdf"
+EXTRACTED_IMAGES_DIR = BRANDING_DIR / "extracted_images"
+EXTRACTED_MANIFEST = EXTRACTED_IMAGES_DIR / "extracted_images.json"
+LOGO_PATH = BRANDING_DIR / "generated_logos" / "reimagined_wordmark.png"
+GUIDE_DOCX = BRANDING_DIR / "reimagined" / "ReimagineED_Brand_Guide_v2.docx"
+GUIDE_PDF = BRANDING_DIR / "reimagined" / "ReimagineED_Brand_Guide_v2.pdf"
+
+# Scripts the steps call; each one and the local modules it imports are
+# inputs, so editing any of that code rebuilds its outputs
+HERO_SCRIPT = SCRIPT_DIR / "generate_reimagined_cover_image.py"
+COVER_SCRIPT = SCRIPT_DIR / "create_cover_page_next_level.py"
+VALIDATE_SCRIPT = SCRIPT_DIR / "validate_with_gpt_vision.py"
+PALETTE_SCRIPT = SCRIPT_DIR / "palette_analyzer.py"
+GUIDE_SCRIPT = SCRIPT_DIR / "generate_reimagined_brand_guide.py"
+
+# =============================================================================
+# STEPS
+# =============================================================================
+# Script modules are imported inside each step so the plan can be shown
+# without their API clients and document libraries installed.
+
+def generate_hero():
+    from generate_reimagined_cover_image import generate_reimagined_cover_image
+    if not generate_reimagined_cover_image():
+        raise RuntimeError("hero image generation failed")
+
+
+def screen_hero(image_path, report_path):
+    """Stop off-palette heroes before they are composited into the cover."""
+    import json
+    from palette_analyzer import MIN_ON_BRAND, analyze_palette, print_palette_report
+
+    result = analyze_palette(image_path, 'reimagined')
+    print_palette_report(result)
+    if result['on_brand'] < MIN_ON_BRAND:
+        raise RuntimeError(f"hero is only {result['on_brand']:.0%} on-brand")
+    with open(report_path, 'w', encoding='utf-8') as f:
+        json.dump(result, f, indent=2)
+
+
+def compose_cover():
+    from create_cover_page_next_level import create_next_level_cover
+    if create_next_level_cover() is None:
+        raise RuntimeError("cover composition failed")
+
+
+def validate_cover(image_path, assessment_path):
+    """Score the cover with the vision rubric and save the assessment."""
+    from validate_with_gpt_vision import validate_image_with_vision
+
+    result = validate_image_with_vision(
+        image_path,
+        "Cover Page (Next Level)",
+        "Full cover page with logo, tagline, mission statement, brand pillars, and tech elements layered on hero image"
+    )
+    if not result:
+        raise RuntimeError("vision validation failed")
+
+    assessment_path = Path(assessment_path)
+    assessment_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(assessment_path, 'w', encoding='utf-8') as f:
+        f.write(f"IMAGE: {result['image_path']}\n")
+        f.write(f"SCORE: {result['score']}/100\n")
+        f.write(f"STATUS: {result['status']}\n\n")
+        f.write(result['assessment'])
+
+
+def extract_images(pdf_path, output_dir, manifest_path):
+    """Extract the source PDF's images and record them for the guide build."""
+    import json
+    from generate_reimagined_brand_guide import extract_images_from_pdf
+
+    images = extract_images_from_pdf(Path(pdf_path), Path(output_dir))
+    with open(manifest_path, 'w', encoding='utf-8') as f:
+        json.dump(images, f, indent=2)
+
+
+def generate_logo(logo_path):
+    """Generate the wordmark, falling back to an existing cover asset like the guide script does."""
+    import shutil
+    from generate_reimagined_brand_guide import generate_logo_freepik
+
+    if generate_logo_freepik(Path(logo_path)):
+        return
+    existing = sorted(BRANDING_DIR.glob("cover*.png"))
+    if not existing:
+        raise RuntimeError("logo generation failed and no existing cover asset to use")
+    Path(logo_path).parent.mkdir(parents=True, exist_ok=True)
+    shutil.copyfile(existing[0], logo_path)
+    print(f"Using existing asset: {existing[0]}")
+
+
+def build_guide_docx(manifest_path, logo_path, docx_path):
+    import json
+    from generate_reimagined_brand_guide import ReimagineEDBrandGuide
+
+    with open(manifest_path, encoding='utf-8') as f:
+        # JSON object keys are strings; the guide looks pages up by index
+        extracted_images = {int(page): paths for page, paths in json.load(f).items()}
+
+    guide = ReimagineEDBrandGuide()
+    guide.build(extracted_images, str(logo_path))
+    guide.save(Path(docx_path))
+
+
+def export_guide_pdf(docx_path, pdf_path):
+    from generate_reimagined_brand_guide import export_to_pdf
+    if export_to_pdf(Path(docx_path), Path(pdf_path)) is None:
+        raise RuntimeError("PDF export failed")
+
+# =============================================================================
+# GRAPH
+# =============================================================================
+
+@lru_cache(maxsize=None)
+def step_code(script):
+    """script and the local modules it imports; walked when a graph is built, not on import."""
+    return tuple(module_files(script))
+
+
+def build_graph():
+    """Register every asset step with its prerequisites, inputs and outputs."""
+    graph = TaskGraph(CACHE_PATH)
+
+    graph.add("hero", generate_hero,
+              inputs=step_code(HERO_SCRIPT), outputs=[HERO_IMAGE])
+    graph.add("screen_hero", screen_hero, args=(str(HERO_IMAGE), str(HERO_PALETTE_REPORT)), deps=["hero"],
+              inputs=[*step_code(PALETTE_SCRIPT), HERO_IMAGE], outputs=[HERO_PALETTE_REPORT])
+    graph.add("cover", compose_cover, deps=["hero", "screen_hero"],
+              inputs=[*step_code(COVER_SCRIPT), HERO_IMAGE], outputs=[COVER_PAGE])
+    graph.add("validate_cover", validate_cover, args=(str(COVER_PAGE), str(COVER_ASSESSMENT)), deps=["cover"],
+              inputs=[*step_code(VALIDATE_SCRIPT), COVER_PAGE], outputs=[COVER_ASSESSMENT])
+
+    graph.add("extract_images", extract_images,
+              args=(str(PDF_SOURCE), str(EXTRACTED_IMAGES_DIR), str(EXTRACTED_MANIFEST)),
+              inputs=[*step_code(GUIDE_SCRIPT), PDF_SOURCE], outputs=[EXTRACTED_MANIFEST])
+    graph.add("logo", generate_logo, args=(str(LOGO_PATH),),
+              inputs=step_code(GUIDE_SCRIPT), outputs=[LOGO_PATH])
+    graph.add("guide_docx", build_guide_docx,
+              args=(str(EXTRACTED_MANIFEST), str(LOGO_PATH), str(GUIDE_DOCX)), deps=["extract_images", "logo"],
+              inputs=[*step_code(GUIDE_SCRIPT), EXTRACTED_MANIFEST, LOGO_PATH], outputs=[GUIDE_DOCX])
+    graph.add("guide_pdf", export_guide_pdf, args=(str(GUIDE_DOCX), str(GUIDE_PDF)), deps=["guide_docx"],
+              inputs=[GUIDE_DOCX], outputs=[GUIDE_PDF])
+
+    return graph
+
+
+def print_plan(graph, targets=None):
+    plan = graph.plan(targets)
+    for name, action in plan.items():
+        deps = graph.tasks[name].deps
+        after = f"  (after {', '.join(deps)})" if deps else ""
+        print(f"  [{'RUN' if action == 'run' else 'CACHED'}] {name}{after}")
+    print(f"\n{list(plan.values()).count('run')} of {len(plan)} steps would run")
+    return plan
+
+
+def main():
+    """Main execution."""
+    graph = build_graph()
+
+    parser = argparse.ArgumentParser(description="Build the brand assets, skipping steps that are up to date.")
+    parser.add_argument("targets", nargs="*",
+                        help=f"steps to build with their prerequisites: {', '.join(graph.tasks)} (default: all)")
+    parser.add_argument("--dry-run", action="store_true", help="show the plan without running anything")
+    parser.add_argument("--touch", action="store_true",
+                        help="mark steps whose outputs already exist as up to date without running them")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: CPU count)")
+    args = parser.parse_args()
+    unknown = [t for t in args.targets if t not in graph.tasks]
+    if unknown:
+        parser.error(f"unknown step(s): {', '.join(unknown)}")
+
+    print("=" * 60)
+    print("ReimagineED Asset Build")
+    print("=" * 60)
+
+    if args.dry_run:
+        return print_plan(graph, args.targets)
+
+    if args.touch:
+        touched = graph.touch(args.targets)
+        for name in touched:
+            print(f"  [TOUCHED] {name}")
+        return touched
+
+    start = datetime.now()
+    status = graph.run(max_workers=args.workers, targets=args.targets)
+
+    elapsed = (datetime.now() - start).total_seconds()
+    counts = {s: list(status.values()).count(s) for s in ('ran', 'cached', 'failed', 'blocked')}
+    print("\n" + "=" * 60)
+    print(f"Done in {elapsed:.1f}s: {counts['ran']} ran, {counts['cached']} cached, "
+          f"{counts['failed']} failed, {counts['blocked']} blocked")
+    print("=" * 60)
+
+    return status
+
+
+if __name__ == "__main__":
+    main()
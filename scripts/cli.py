@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+One entry point for every asset script
+
+Each subcommand runs the matching script exactly as `python <script>.py` would,
+with the remaining arguments passed through. Nothing beyond argparse is
+imported until a subcommand is chosen, so `--help` and cached builds start
+without paying for ReportLab, python-docx, NumPy or the API clients.
+
+Usage:
+    python cli.py --help
+    python cli.py build --dry-run
+    python cli.py episodes episodes.csv --episode 12
+    python cli.py palette ../assets/zoom-backgrounds --palette right_path
+    python cli.py cover --help                # help of the underlying script
+    python cli.py --profile --trace trace.json cover   # per-stage timing (stage_timing.py)
+"""
+import os
+import sys
+import argparse
+from pathlib import Path
+
+# Paths
+SCRIPT_DIR = Path(__file__).resolve().parent
+BRANDING_DIR = SCRIPT_DIR.parent / "assets" / "branding-guide"
+
+# Subcommand -> (module, directory, description); modules are imported only when run
+COMMANDS = {
+    'build': ("build_assets", SCRIPT_DIR, "build the ReimagineED assets as a cached task graph"),
+    'episodes': ("episode_pipeline", SCRIPT_DIR, "produce every asset for podcast episodes"),
+    'artwork': ("episode_artwork", BRANDING_DIR, "render social artwork for an episode manifest"),
+    'premium-pdf': ("generate_premium_pdf_v2", BRANDING_DIR, "build the premium Right Path PDF guide"),
+    'guide': ("generate_reimagined_brand_guide", SCRIPT_DIR, "build the ReimagineED brand guide DOCX"),
+    'right-path-guide': ("generate_right_path_brand_guide", SCRIPT_DIR, "build The Right Path brand guide DOCX"),
+    'hedge': ("hedging", SCRIPT_DIR, "generate with a deadline, hedging slow calls; --stats shows latency histograms"),
+    'providers': ("image_providers", SCRIPT_DIR, "send one prompt to several image providers side by side"),
+    'freepik': ("freepik_jobs", SCRIPT_DIR, "generate images with Freepik Mystic, polling all tasks together"),
+    'fake-freepik': ("fake_freepik_server", SCRIPT_DIR, "run a local fake of the Freepik Mystic API"),
+    'hero': ("generate_reimagined_cover_image", SCRIPT_DIR, "generate the cover hero image"),
+    'cover': ("create_cover_page_next_level", SCRIPT_DIR, "composite the next-level cover page"),
+    'cover-v1': ("create_cover_page", SCRIPT_DIR, "composite the original cover page"),
+    'cover-v2': ("create_cover_page_v2", SCRIPT_DIR, "composite the refined v2 cover page"),
+    'refine': ("refine_cover", SCRIPT_DIR, "search cover variants until one passes validation"),
+    'prescore': ("cover_prescore", SCRIPT_DIR, "score cover images locally (contrast, palette, sharpness)"),
+    'palette': ("palette_analyzer", SCRIPT_DIR, "check images against a brand palette"),
+    'encode': ("image_encoding", SCRIPT_DIR, "compare encode time and size of the image encoding profiles"),
+    'validate': ("validate_cover_page", SCRIPT_DIR, "validate the final cover with the vision rubric"),
+    'zoom': ("generate_zoom_backgrounds", SCRIPT_DIR, "generate the DALL-E Zoom backgrounds"),
+    'zoom-branded': ("generate_branded_zoom_background", SCRIPT_DIR, "generate a branded AI Zoom background"),
+    'zoom-nano': ("generate_branded_zoom_nano_banana", SCRIPT_DIR, "generate a branded Zoom background via OpenRouter"),
+    'usage': ("usage_ledger", SCRIPT_DIR, "report API usage and estimated cost per run, script or asset"),
+    'bench': ("bench_assets", SCRIPT_DIR, "benchmark the compositors and document builders offline"),
+    'startup-bench': ("bench_startup", SCRIPT_DIR, "measure CLI startup and per-script import time"),
+}
+
+
+def run_command(name, argv):
+    """Run a subcommand's script as __main__ with argv as its arguments."""
+    import runpy
+
+    module, directory, _ = COMMANDS[name]
+    for path in (SCRIPT_DIR, directory):
+        if str(path) not in sys.path:
+            sys.path.insert(0, str(path))
+
+    sys.argv = [sys.argv[0], *argv]  # argv[0] becomes the script's path while it runs
+    runpy.run_module(module, run_name="__main__", alter_sys=True)
+
+
+def main(argv=None):
+    """Main execution."""
+    width = max(len(name) for name in COMMANDS)
+    parser = argparse.ArgumentParser(
+        description="Run any of the brand asset scripts.",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="commands:\n" + "\n".join(f"  {name:<{width}}  {help_text}"
+                                        for name, (_, _, help_text) in COMMANDS.items()),
+    )
+    parser.add_argument("--profile", action="store_true", help="print per-stage wall/CPU time and memory at exit")
+    parser.add_argument("--profile-memory", action="store_true",
+                        help="like --profile, also tracing Python allocations (slower)")
+    parser.add_argument("--trace", metavar="PATH", help="write stage timings as a Chrome trace JSON")
+    parser.add_argument("command", choices=COMMANDS, metavar="command", help="script to run (see below)")
+    parser.add_argument("args", nargs=argparse.REMAINDER, help="arguments passed to the script")
+    args = parser.parse_args(argv)
+
+    # Read by stage_timing when the script imports it
+    if args.profile or args.profile_memory:
+        os.environ['ASSET_PROFILE'] = 'memory' if args.profile_memory else '1'
+    if args.trace:
+        os.environ['ASSET_TRACE'] = args.trace
+
+    run_command(args.command, args.args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""
+Fast local pre-scorer for cover candidates
+
+Rejects obviously failing variants in milliseconds before they are sent to
+the paid vision validator. Checks, all NumPy/PIL and offline:
+
+- text contrast: WCAG AA for each text element against the pixels behind it
+- palette adherence: share of the page close to a brand color
+- sharpness: variance of the Laplacian
+- safe area: text kept inside the print margins
+
+Usage:
+    python cover_prescore.py ../assets/branding-guide/cover_page_next_level.png
+"""
+import sys
+import numpy as np
+from pathlib import Path
+from PIL import Image
+
+from brand import REIMAGINED
+from text_contrast import check_contrast
+
+# Brand palette checked for adherence
+BRAND_PALETTE = {name: REIMAGINED[name].rgb for name in ('navy', 'gold', 'electric_blue')}
+
+# Thresholds for rejection (text must also meet WCAG AA)
+MIN_PALETTE_SHARE = 0.35     # share of pixels near a brand color
+PALETTE_DISTANCE = 80        # RGB distance that counts as "near"
+MIN_SHARPNESS = 20.0         # Laplacian variance on the analysis image
+SAFE_MARGIN = 0.02           # fraction of width/height kept clear of text
+
+# Pages are analysed at about this width; text contrast uses full resolution
+ANALYSIS_WIDTH = 320
+
+
+def palette_share(pixels, palette=BRAND_PALETTE, distance=PALETTE_DISTANCE):
+    """Share of pixels within distance (RGB) of any palette color."""
+    flat = pixels.reshape(-1, 3).astype(np.int32)
+    colors = np.array(list(palette.values()), dtype=np.int32)
+    nearest = ((flat[:, None, :] - colors[None, :, :]) ** 2).sum(axis=2).min(axis=1)
+    return float((nearest <= distance ** 2).mean())
+
+
+def sharpness(gray):
+    """Variance of a 4-neighbour Laplacian."""
+    g = gray.astype(np.float32)
+    lap = -4 * g[1:-1, 1:-1] + g[:-2, 1:-1] + g[2:, 1:-1] + g[1:-1, :-2] + g[1:-1, 2:]
+    return float(lap.var())
+
+
+def safe_area_violations(size, layout, margin=SAFE_MARGIN):
+    """Text elements whose bbox crosses the margin on any side."""
+    width, height = size
+    mx, my = width * margin, height * margin
+    return [el['text'] for el in layout
+            if el['bbox'][0] < mx or el['bbox'][1] < my
+            or el['bbox'][2] > width - mx or el['bbox'][3] > height - my]
+
+
+def prescore(image, layout=()):
+    """Score a candidate locally.
+
+    Args:
+        image: PIL image or path
+        layout: text elements [{'text', 'bbox', 'fill'}] as recorded by render_cover
+
+    Returns:
+        dict with score (0-100), passed, reasons and the raw metrics
+    """
+    if not isinstance(image, Image.Image):
+        image = Image.open(image)
+    if image.mode != 'RGB':
+        image = image.convert('RGB')
+
+    small = image.reduce(max(1, image.width // ANALYSIS_WIDTH))
+    small_pixels = np.asarray(small)
+
+    metrics = {
+        'palette_share': palette_share(small_pixels),
+        'sharpness': sharpness(np.asarray(small.convert('L'))),
+        'safe_area_violations': safe_area_violations(image.size, layout),
+    }
+    contrast = check_contrast(image, layout) if layout else []
+    metrics['text_contrast'] = {r['text']: r['ratio'] for r in contrast}
+
+    reasons = []
+    low_contrast = [r for r in contrast if not r['aa']]
+    if low_contrast:
+        reasons.append("text below WCAG AA: " + ", ".join(f"'{r['text'][:30]}' {r['ratio']:.1f}:1" for r in low_contrast))
+    if metrics['palette_share'] < MIN_PALETTE_SHARE:
+        reasons.append(f"off-palette: {metrics['palette_share']:.0%} of page near brand colors")
+    if metrics['sharpness'] < MIN_SHARPNESS:
+        reasons.append(f"soft image: sharpness {metrics['sharpness']:.1f}")
+    if metrics['safe_area_violations']:
+        reasons.append("text outside safe area: " + ", ".join(metrics['safe_area_violations']))
+
+    # Blend the metrics into a rough 0-100 score for ranking candidates
+    ratios = [r for r in metrics['text_contrast'].values() if r is not None]
+    contrast_part = min(1.0, min(ratios) / 7.0) if ratios else 1.0
+    palette_part = min(1.0, metrics['palette_share'] / 0.7)
+    sharp_part = min(1.0, metrics['sharpness'] / (MIN_SHARPNESS * 5))
+    safe_part = 0.0 if metrics['safe_area_violations'] else 1.0
+    score = round(100 * (0.4 * contrast_part + 0.25 * palette_part + 0.2 * sharp_part + 0.15 * safe_part))
+
+    return {'score': score, 'passed': not reasons, 'reasons': reasons, 'metrics': metrics}
+
+
+if __name__ == "__main__":
+    for path in sys.argv[1:] or [Path(__file__).parent.parent / "assets" / "branding-guide" / "cover_page_next_level.png"]:
+        result = prescore(path)
+        print(f"{path}: {result['score']}/100 {'PASS' if result['passed'] else 'REJECT'}")
+        for reason in result['reasons']:
+            print(f"  - {reason}")
@@ -6,13 +6,16 @@ import os
 from PIL import Image, ImageDraw, ImageFont, ImageFilter, ImageEnhance
 from pathlib import Path
 
-def create_cover_page():
+from brand import REIMAGINED
+from image_encoding import save_image
+
+def create_cover_page(hero_image_path=None, output_path=None):
     """Create cover page composite image"""
 
-    # Paths
+    # Paths (defaults: the hero and cover in assets/branding-guide)
     assets_dir = Path(__file__).parent.parent / "assets" / "branding-guide"
-    hero_image_path = assets_dir / "cover_hero_image_1.png"
-    output_path = assets_dir / "cover_page_final.png"
+    hero_image_path = hero_image_path or assets_dir / "cover_hero_image_1.png"
+    output_path = output_path or assets_dir / "cover_page_final.png"
 
     # Load hero image
     print("Loading hero image...")
@@ -37,7 +40,7 @@ def create_cover_page():
     gradient = Image.new('RGBA', target_size, color=(0, 0, 0, 0))
     draw_gradient = ImageDraw.Draw(gradient)
 
-    navy_rgb = (11, 29, 58)  # #0B1D3A
+    navy_rgb = REIMAGINED.navy.rgb
     for y in range(target_size[1] // 3):  # Top third
         alpha = int(255 * 0.4 * (1 - y / (target_size[1] // 3)))  # Fade from 40% to 0%
         draw_gradient.rectangle(
@@ -53,11 +56,11 @@ def create_cover_page():
     draw = ImageDraw.Draw(hero_with_gradient)
 
     # Define colors
-    white = (255, 255, 255, 255)
-    gold = (255, 211, 58, 255)  # #FFD33A
-    electric_blue = (0, 217, 255, 255)  # #00D9FF
-    white_90 = (255, 255, 255, 230)
-    white_70 = (255, 255, 255, 179)
+    white = REIMAGINED.white.rgba()
+    gold = REIMAGINED.gold.rgba()
+    electric_blue = REIMAGINED.electric_blue.rgba()
+    white_90 = REIMAGINED.white.rgba(230)
+    white_70 = REIMAGINED.white.rgba(179)
 
     # Font sizes (scaled for 300 DPI)
     logo_size = 350  # 96pt @ 300 DPI
@@ -185,7 +188,7 @@ def create_cover_page():
 
     # Save
     print(f"Saving cover page to {output_path}...")
-    final_image.save(output_path, 'PNG', quality=95, dpi=(300, 300))
+    save_image(final_image, output_path, 'final', dpi=300)
 
     print(f"\nCover page created successfully!")
     print(f"File: {output_path}")
@@ -1,182 +1,302 @@
 """
 ReimagineED Branding Guide - NEXT LEVEL Cover Page
 Ultra-premium Madison Avenue quality with sophisticated design techniques
+
+The look is driven by COVER_PARAMS so variants can be rendered cheaply:
+the resized hero, enhanced hero and static overlays are cached per process,
+and text shadows/glows are blurred only around the text they belong to.
+
+Every coordinate, font size, blur radius and offset is specified at full
+size (TARGET_SIZE) and multiplied by the render scale, so a --preview draft
+at PREVIEW_SCALE and the final export come from the same layout.
+
+Usage:
+    python create_cover_page_next_level.py
+    python create_cover_page_next_level.py --preview        # quick draft
 """
+import argparse
 import os
 from PIL import Image, ImageDraw, ImageFont, ImageFilter, ImageEnhance
 from pathlib import Path
+from functools import lru_cache
 import math
 
-def create_next_level_cover():
-    """Create the ultimate cover page - next level elegance and impact"""
+from brand import REIMAGINED
+from image_encoding import PROFILES as ENCODING_PROFILES, describe, save_image, wait_background
+from stage_timing import stage, stages
+from text_contrast import check_contrast, print_contrast_report, record_text
+
+# Paths
+ASSETS_DIR = Path(__file__).parent.parent / "assets" / "branding-guide"
+HERO_IMAGE_PATH = ASSETS_DIR / "cover_hero_image_1.png"
+OUTPUT_PATH = ASSETS_DIR / "cover_page_next_level.png"
+
+# Target: 8.5" x 11" at 300 DPI
+TARGET_SIZE = (2550, 3300)
+DPI = 300
+
+# Render scale of --preview drafts
+PREVIEW_SCALE = 0.35
+
+# Premium color palette
+NAVY_RGB = REIMAGINED.navy.rgb
+GOLD_RGB = REIMAGINED.gold.rgb
+ELECTRIC_BLUE_RGB = REIMAGINED.electric_blue.rgb
+PURPLE_RGB = REIMAGINED.purple.rgb
+
+WHITE = (255, 255, 255, 255)
+GOLD = (*GOLD_RGB, 255)
+ELECTRIC_BLUE = (*ELECTRIC_BLUE_RGB, 255)
+WHITE_95 = (255, 255, 255, 242)
+WHITE_80 = (255, 255, 255, 204)
+BLACK_SHADOW = (0, 0, 0, 180)
+
+# Tunable look of the cover (the refinement loop searches around these values)
+COVER_PARAMS = {
+    'brightness': 0.4,      # hero darkening for text contrast (0.4 = 60% darker)
+    'contrast': 1.5,        # 50% more contrast
+    'saturation': 1.2,      # 20% more vibrant
+    'navy_gradient': 0.75,  # peak opacity of the top navy gradient
+    'gold_gradient': 0.15,  # peak opacity of the bottom gold gradient
+    'logo_size': 420,
+    'tagline_size': 100,
+    'mission_size': 75,
+    'pillars_size': 48,
+    'doc_title_size': 58,
+    'glow_intensity': 12,
+}
+
+# ==================== LAYOUT SCALE ====================
+
+def page_size(scale=1.0):
+    """Pixel size of the page at a render scale."""
+    return (round(TARGET_SIZE[0] * scale), round(TARGET_SIZE[1] * scale))
+
+
+def px(value, scale):
+    """A full-size pixel measure (offset, size, radius) at a render scale."""
+    return max(1, int(value * scale))
+
+# ==================== CACHED LAYERS ====================
+# Cached images are shared between renders and must not be modified in place.
+# Layers are keyed by pixel size; their details scale with size / TARGET_SIZE.
+
+@lru_cache(maxsize=2)
+def load_hero(hero_path, size=TARGET_SIZE):
+    """Hero resized to the page and sharpened (Pass 1)."""
+    hero = Image.open(hero_path)
+    if hero.mode != 'RGB':
+        hero = hero.convert('RGB')
+    hero = hero.resize(size, Image.Resampling.LANCZOS)
+    scale = size[0] / TARGET_SIZE[0]
+    return hero.filter(ImageFilter.UnsharpMask(radius=2 * scale, percent=150, threshold=3))
 
-    # Paths
-    assets_dir = Path(__file__).parent.parent / "assets" / "branding-guide"
-    hero_image_path = assets_dir / "cover_hero_image_1.png"
-    output_path = assets_dir / "cover_page_next_level.png"
 
-    print("=" * 70)
-    print("CREATING NEXT LEVEL COVER PAGE")
-    print("=" * 70)
+@lru_cache(maxsize=8)
+def enhance_hero(hero_path, brightness, contrast, saturation, size=TARGET_SIZE):
+    """Darken, add contrast and boost color (Passes 2-4)."""
+    hero = ImageEnhance.Brightness(load_hero(hero_path, size)).enhance(brightness)
+    hero = ImageEnhance.Contrast(hero).enhance(contrast)
+    hero = ImageEnhance.Color(hero).enhance(saturation)
+    return hero.convert('RGBA')
 
-    # Load and prepare hero image
-    print("\n[1/10] Loading hero image...")
-    hero = Image.open(hero_image_path)
-    if hero.mode != 'RGB':
-        hero = hero.convert('RGB')
 
-    # Target: 8.5" x 11" at 300 DPI
-    target_size = (2550, 3300)
-    print(f"[2/10] Resizing to {target_size[0]}x{target_size[1]}...")
-    hero = hero.resize(target_size, Image.Resampling.LANCZOS)
+@lru_cache(maxsize=8)
+def gradient_overlay(navy_strength, gold_strength, size=TARGET_SIZE):
+    """Navy fade from the top and subtle gold fade into the bottom."""
+    overlay = Image.new('RGBA', size, (0, 0, 0, 0))
+    draw = ImageDraw.Draw(overlay)
+    half = size[1] // 2
 
-    # NEXT LEVEL: Triple enhancement pass
-    print("[3/10] Applying professional image enhancements...")
+    # Top-to-middle: Navy gradient (strong)
+    for y in range(half):
+        alpha = int(255 * navy_strength * (1 - y / half))
+        draw.rectangle([(0, y), (size[0], y + 1)], fill=(*NAVY_RGB, alpha))
 
-    # Pass 1: Sharpness
-    hero = hero.filter(ImageFilter.UnsharpMask(radius=2, percent=150, threshold=3))
+    # Bottom accent: Subtle gold gradient
+    for y in range(half, size[1]):
+        alpha = int(255 * gold_strength * ((y - half) / half))
+        draw.rectangle([(0, y), (size[0], y + 1)], fill=(*GOLD_RGB, alpha))
 
-    # Pass 2: Darken for text contrast (60%)
-    enhancer = ImageEnhance.Brightness(hero)
-    hero = enhancer.enhance(0.4)  # 60% darker
+    return overlay
 
-    # Pass 3: Increase contrast dramatically
-    contrast_enhancer = ImageEnhance.Contrast(hero)
-    hero = contrast_enhancer.enhance(1.5)  # 50% more contrast
 
-    # Pass 4: Color saturation boost
-    color_enhancer = ImageEnhance.Color(hero)
-    hero = color_enhancer.enhance(1.2)  # 20% more vibrant
+@lru_cache(maxsize=2)
+def grid_overlay(size=TARGET_SIZE):
+    """Subtle electric blue grid on the right half."""
+    overlay = Image.new('RGBA', size, (0, 0, 0, 0))
+    draw = ImageDraw.Draw(overlay)
+    scale = size[0] / TARGET_SIZE[0]
 
-    # NEXT LEVEL: Sophisticated gradient overlay system
-    print("[4/10] Creating sophisticated gradient system...")
-    hero_rgba = hero.convert('RGBA')
+    grid_color = (*ELECTRIC_BLUE_RGB, 15)  # very subtle
+    grid_spacing = px(100, scale)
+    for x in range(size[0] // 2, size[0], grid_spacing):
+        draw.line([(x, 0), (x, size[1])], fill=grid_color, width=1)
+    for y in range(0, size[1], grid_spacing):
+        draw.line([(size[0] // 2, y), (size[0], y)], fill=grid_color, width=1)
 
-    # Multi-layer gradient for depth
-    gradient_overlay = Image.new('RGBA', target_size, (0, 0, 0, 0))
-    gradient_draw = ImageDraw.Draw(gradient_overlay)
+    return overlay
 
-    navy_rgb = (11, 29, 58)
-    gold_rgb = (255, 211, 58)
 
-    # Top-to-middle: Navy gradient (strong)
-    for y in range(target_size[1] // 2):
-        alpha = int(255 * 0.75 * (1 - y / (target_size[1] // 2)))
-        gradient_draw.rectangle([(0, y), (target_size[0], y + 1)], fill=(*navy_rgb, alpha))
+@lru_cache(maxsize=2)
+def geometry_overlay(size=TARGET_SIZE):
+    """Gold hexagon, electric blue circle and purple accent hexagon."""
+    overlay = Image.new('RGBA', size, (0, 0, 0, 0))
+    draw = ImageDraw.Draw(overlay)
+    scale = size[0] / TARGET_SIZE[0]
+    step = px(5, scale)
 
-    # Bottom accent: Subtle gold gradient
-    for y in range(target_size[1] // 2, target_size[1]):
-        alpha = int(255 * 0.15 * ((y - target_size[1] // 2) / (target_size[1] // 2)))
-        gradient_draw.rectangle([(0, y), (target_size[0], y + 1)], fill=(*gold_rgb, alpha))
+    # Large elegant hexagon (gold) with gradient fill
+    hex_x, hex_y, hex_size = int(size[0] * 0.75), int(size[1] * 0.25), px(280, scale)
+    for i in range(hex_size, 0, -step):
+        alpha = int(70 * (i / hex_size))
+        draw.regular_polygon((hex_x, hex_y, i), n_sides=6, rotation=30, fill=(*GOLD_RGB, alpha))
 
-    # Composite
-    hero_with_gradient = Image.alpha_composite(hero_rgba, gradient_overlay)
+    # Circle (electric blue)
+    circle_x, circle_y, circle_radius = int(size[0] * 0.80), int(size[1] * 0.55), px(200, scale)
+    for i in range(circle_radius, 0, -step):
+        alpha = int(60 * (i / circle_radius))
+        draw.ellipse([circle_x - i, circle_y - i, circle_x + i, circle_y + i], fill=(*ELECTRIC_BLUE_RGB, alpha))
 
-    # NEXT LEVEL: Create sophisticated tech pattern overlay
-    print("[5/10] Adding premium tech pattern overlay...")
-    pattern_overlay = Image.new('RGBA', target_size, (0, 0, 0, 0))
-    pattern_draw = ImageDraw.Draw(pattern_overlay)
-
-    # Subtle grid lines (right side only)
-    grid_color = (0, 217, 255, 15)  # Electric blue, very subtle
-    grid_spacing = 100
-    for x in range(target_size[0] // 2, target_size[0], grid_spacing):
-        pattern_draw.line([(x, 0), (x, target_size[1])], fill=grid_color, width=1)
-    for y in range(0, target_size[1], grid_spacing):
-        pattern_draw.line([(target_size[0] // 2, y), (target_size[0], y)], fill=grid_color, width=1)
-
-    hero_with_gradient = Image.alpha_composite(hero_with_gradient, pattern_overlay)
-
-    # Create main drawing context
-    draw = ImageDraw.Draw(hero_with_gradient)
-
-    # Premium color palette
-    white = (255, 255, 255, 255)
-    gold = (255, 211, 58, 255)
-    electric_blue = (0, 217, 255, 255)
-    white_95 = (255, 255, 255, 242)
-    white_80 = (255, 255, 255, 204)
-    black_shadow = (0, 0, 0, 180)
+    # Small accent hexagon (purple)
+    hex2_x, hex2_y, hex2_size = int(size[0] * 0.68), int(size[1] * 0.70), px(180, scale)
+    for i in range(hex2_size, 0, -step):
+        alpha = int(50 * (i / hex2_size))
+        draw.regular_polygon((hex2_x, hex2_y, i), n_sides=6, rotation=0, fill=(*PURPLE_RGB, alpha))
 
-    # NEXT LEVEL: Premium font sizing
-    logo_size = 420  # Even larger
-    tagline_size = 100
-    mission_size = 75
-    pillars_size = 48
-    doc_title_size = 58
+    return overlay
 
-    # Load fonts
+
+@lru_cache(maxsize=2)
+def bottom_band(size=TARGET_SIZE):
+    """Dark navy band that covers any unwanted text from the hero image."""
+    top = int(size[1] * 0.83)
+    band = Image.new('RGBA', (size[0], size[1] - top), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(band)
+    for y in range(top, size[1]):
+        progress = (y - top) / (size[1] - top)
+        alpha = int(200 + (55 * progress))
+        draw.rectangle([(0, y - top), (size[0], y - top + 1)], fill=(*NAVY_RGB, alpha))
+    return top, band
+
+
+@lru_cache(maxsize=None)
+def load_font(font_file, size):
     try:
-        logo_font = ImageFont.truetype("arialbd.ttf", logo_size)
-        tagline_font = ImageFont.truetype("arial.ttf", tagline_size)
-        mission_font = ImageFont.truetype("arial.ttf", mission_size)
-        pillars_font = ImageFont.truetype("courbd.ttf", pillars_size)
-        doc_title_font = ImageFont.truetype("arial.ttf", doc_title_size)
-    except:
-        logo_font = ImageFont.load_default()
-        tagline_font = ImageFont.load_default()
-        mission_font = ImageFont.load_default()
-        pillars_font = ImageFont.load_default()
-        doc_title_font = ImageFont.load_default()
-
-    # NEXT LEVEL: Professional shadow system
-    def draw_text_with_premium_shadow(xy, text, font, fill, shadow_color=black_shadow, shadow_offset=6, blur=True):
-        """Draw text with professional multi-layer shadow"""
-        x, y = xy
-
-        # Create temporary layer for shadow with blur
-        if blur:
-            shadow_layer = Image.new('RGBA', target_size, (0, 0, 0, 0))
-            shadow_draw = ImageDraw.Draw(shadow_layer)
-            shadow_draw.text((x + shadow_offset, y + shadow_offset), text, font=font, fill=shadow_color)
-            shadow_layer = shadow_layer.filter(ImageFilter.GaussianBlur(radius=4))
-            hero_with_gradient.alpha_composite(shadow_layer)
-        else:
-            draw.text((x + shadow_offset, y + shadow_offset), text, font=font, fill=shadow_color)
-
-        # Draw main text
-        draw.text((x, y), text, font=font, fill=fill)
-
-    # NEXT LEVEL: Multi-layer glow effect
-    def draw_text_with_glow(xy, text, font, fill, glow_color, glow_intensity=10):
-        """Create professional glow effect"""
-        x, y = xy
-
-        # Create glow layer
-        glow_layer = Image.new('RGBA', target_size, (0, 0, 0, 0))
-        glow_draw = ImageDraw.Draw(glow_layer)
-
-        # Multiple glow passes
-        for i in range(glow_intensity, 0, -2):
-            alpha = int(255 * (i / glow_intensity) * 0.3)
-            glow_draw.text((x, y), text, font=font, fill=(*glow_color[:3], alpha))
-
-        # Blur the glow
-        glow_layer = glow_layer.filter(ImageFilter.GaussianBlur(radius=15))
-        hero_with_gradient.alpha_composite(glow_layer)
-
-        # Draw main text
-        draw.text((x, y), text, font=font, fill=fill)
-
-    print("[6/10] Adding premium logo with effects...")
+        return ImageFont.truetype(font_file, size)
+    except OSError:
+        return ImageFont.load_default()
+
+# ==================== TEXT EFFECTS ====================
+
+def _blurred_text(canvas, xy, text, font, fill, radius, passes=None):
+    """Composite blurred text onto canvas, blurring only the area around the text."""
+    draw = ImageDraw.Draw(canvas)
+    left, top, right, bottom = draw.textbbox(xy, text, font=font)
+    pad = radius * 6  # beyond the reach of the blur kernel
+    box = (max(0, left - pad), max(0, top - pad),
+           min(canvas.width, right + pad), min(canvas.height, bottom + pad))
+    if box[0] >= box[2] or box[1] >= box[3]:
+        return
+
+    layer = Image.new('RGBA', (box[2] - box[0], box[3] - box[1]), (0, 0, 0, 0))
+    layer_draw = ImageDraw.Draw(layer)
+    for pass_fill in passes or [fill]:
+        layer_draw.text((xy[0] - box[0], xy[1] - box[1]), text, font=font, fill=pass_fill)
+    canvas.alpha_composite(layer.filter(ImageFilter.GaussianBlur(radius=radius)), dest=box[:2])
+
+
+def draw_text_with_premium_shadow(canvas, xy, text, font, fill, shadow_color=BLACK_SHADOW, shadow_offset=6, blur=True,
+                                  blur_radius=4):
+    """Draw text with professional multi-layer shadow"""
+    x, y = xy
+    if blur:
+        _blurred_text(canvas, (x + shadow_offset, y + shadow_offset), text, font, shadow_color, radius=blur_radius)
+    else:
+        ImageDraw.Draw(canvas).text((x + shadow_offset, y + shadow_offset), text, font=font, fill=shadow_color)
+
+    # Draw main text
+    ImageDraw.Draw(canvas).text((x, y), text, font=font, fill=fill)
+
+
+def draw_text_with_glow(canvas, xy, text, font, fill, glow_color, glow_intensity=10, radius=15):
+    """Create professional glow effect"""
+    # Multiple glow passes, blurred together
+    passes = [(*glow_color[:3], int(255 * (i / glow_intensity) * 0.3)) for i in range(glow_intensity, 0, -2)]
+    _blurred_text(canvas, xy, text, font, fill, radius=radius, passes=passes)
+
+    # Draw main text
+    ImageDraw.Draw(canvas).text(xy, text, font=font, fill=fill)
+
+# ==================== RENDERING ====================
+
+def render_cover(hero_path=HERO_IMAGE_PATH, verbose=False, layout=None, scale=1.0, **params):
+    """Render the cover with COVER_PARAMS overridden by params; returns an RGB image.
+
+    scale renders the same layout at a fraction of TARGET_SIZE (1.0 = print).
+    If layout is a list, each text element is recorded in it (see
+    text_contrast.record_text) for contrast and safe-area checks.
+    """
+    p = {**COVER_PARAMS, **params}
+    log = print if verbose else (lambda *args: None)
+    steps = stages("cover")
+    target_size = page_size(scale)
+
+    steps.next("hero")
+    log("[1/10] Loading hero image...")
+    log(f"[2/10] Resizing to {target_size[0]}x{target_size[1]}...")
+    log("[3/10] Applying professional image enhancements...")
+    hero = enhance_hero(str(hero_path), p['brightness'], p['contrast'], p['saturation'], target_size)
+
+    # NEXT LEVEL: Sophisticated gradient overlay system
+    steps.next("gradients")
+    log("[4/10] Creating sophisticated gradient system...")
+    canvas = Image.alpha_composite(hero, gradient_overlay(p['navy_gradient'], p['gold_gradient'], target_size))
+
+    # NEXT LEVEL: Create sophisticated tech pattern overlay
+    steps.next("grid")
+    log("[5/10] Adding premium tech pattern overlay...")
+    canvas = Image.alpha_composite(canvas, grid_overlay(target_size))
+
+    draw = ImageDraw.Draw(canvas)
+
+    # NEXT LEVEL: Premium font sizing
+    steps.next("fonts")
+    logo_size = px(p['logo_size'], scale)
+    logo_font = load_font("arialbd.ttf", logo_size)
+    tagline_font = load_font("arial.ttf", px(p['tagline_size'], scale))
+    mission_font = load_font("arial.ttf", px(p['mission_size'], scale))
+    pillars_font = load_font("courbd.ttf", px(p['pillars_size'], scale))
+    doc_title_font = load_font("arial.ttf", px(p['doc_title_size'], scale))
+
+    steps.next("logo")
+    log("[6/10] Adding premium logo with effects...")
     logo_x = int(target_size[0] * 0.08)
     logo_y = int(target_size[1] * 0.10)
 
     # "REIMAGINE" in white with premium shadow
-    draw_text_with_premium_shadow((logo_x, logo_y), "REIMAGINE", logo_font, white, shadow_offset=8)
+    draw_text_with_premium_shadow(canvas, (logo_x, logo_y), "REIMAGINE", logo_font, WHITE,
+                                  shadow_offset=px(8, scale), blur_radius=px(4, scale))
+    record_text(layout, draw, (logo_x, logo_y), "REIMAGINE", logo_font, WHITE, bold=True)
 
     # "ED" in GLOWING gold with premium effects
     ed_y = logo_y + int(logo_size * 0.85)
-    draw_text_with_glow((logo_x, ed_y), "ED", logo_font, gold, gold_rgb, glow_intensity=12)
+    draw_text_with_glow(canvas, (logo_x, ed_y), "ED", logo_font, GOLD, GOLD_RGB,
+                        glow_intensity=int(p['glow_intensity']), radius=px(15, scale))
+    record_text(layout, draw, (logo_x, ed_y), "ED", logo_font, GOLD, bold=True)
 
-    print("[7/10] Adding sophisticated tagline...")
+    steps.next("tagline")
+    log("[7/10] Adding sophisticated tagline...")
     tagline_y = ed_y + int(logo_size * 1.2)
     tagline_text = "Empowering Educators, Innovating Futures"
 
     # Premium shadow for tagline
-    draw_text_with_premium_shadow((logo_x, tagline_y), tagline_text, tagline_font, electric_blue, shadow_offset=5)
+    draw_text_with_premium_shadow(canvas, (logo_x, tagline_y), tagline_text, tagline_font, ELECTRIC_BLUE,
+                                  shadow_offset=px(5, scale), blur_radius=px(4, scale))
+    record_text(layout, draw, (logo_x, tagline_y), tagline_text, tagline_font, ELECTRIC_BLUE)
 
-    print("[8/10] Adding refined mission statement...")
+    steps.next("mission")
+    log("[8/10] Adding refined mission statement...")
     mission_y = int(target_size[1] * 0.50)
     mission_text = "Leading the AI Revolution in Education"
 
@@ -185,23 +305,26 @@ def create_next_level_cover():
     mission_width = mission_bbox[2] - mission_bbox[0]
     mission_height = mission_bbox[3] - mission_bbox[1]
 
-    box_padding = 40
+    box_padding = px(40, scale)
     box_left = logo_x - box_padding
     box_top = mission_y - box_padding
     box_right = logo_x + mission_width + box_padding
     box_bottom = mission_y + mission_height + box_padding
 
     # Create gradient box background
-    for i in range(box_top, box_bottom, 2):
+    row = px(2, scale)
+    for i in range(box_top, box_bottom, row):
         alpha_gradient = 220 - int(20 * ((i - box_top) / (box_bottom - box_top)))
-        draw.rectangle([(box_left, i), (box_right, i+2)], fill=(*navy_rgb, alpha_gradient))
+        draw.rectangle([(box_left, i), (box_right, i+row)], fill=(*NAVY_RGB, alpha_gradient))
 
     # Gold accent line at bottom of box
-    draw.rectangle([(box_left, box_bottom - 4), (box_right, box_bottom)], fill=gold)
+    draw.rectangle([(box_left, box_bottom - px(4, scale)), (box_right, box_bottom)], fill=GOLD)
 
-    draw.text((logo_x, mission_y), mission_text, font=mission_font, fill=white_95)
+    draw.text((logo_x, mission_y), mission_text, font=mission_font, fill=WHITE_95)
+    record_text(layout, draw, (logo_x, mission_y), mission_text, mission_font, WHITE_95)
 
-    print("[9/10] Adding elegant brand pillars...")
+    steps.next("pillars")
+    log("[9/10] Adding elegant brand pillars...")
     pillars_y = int(target_size[1] * 0.88)
     pillars_text = "AI LITERACY  •  WORKFORCE DEVELOPMENT  •  EQUITY  •  INNOVATION  •  COMMUNITY"
 
@@ -210,77 +333,69 @@ def create_next_level_cover():
     pillars_width = pillars_bbox[2] - pillars_bbox[0]
     pillars_x = (target_size[0] - pillars_width) // 2
 
-    draw_text_with_premium_shadow((pillars_x, pillars_y), pillars_text, pillars_font, gold, shadow_offset=4, blur=True)
-
-    print("[10/10] Adding premium geometric elements...")
-    # Sophisticated geometric shapes
-    geom_overlay = Image.new('RGBA', target_size, (0, 0, 0, 0))
-    geom_draw = ImageDraw.Draw(geom_overlay)
+    draw_text_with_premium_shadow(canvas, (pillars_x, pillars_y), pillars_text, pillars_font, GOLD,
+                                  shadow_offset=px(4, scale), blur=True, blur_radius=px(4, scale))
+    record_text(layout, draw, (pillars_x, pillars_y), pillars_text, pillars_font, GOLD, bold=True)
 
-    # Large elegant hexagon (gold)
-    hex_x = int(target_size[0] * 0.75)
-    hex_y = int(target_size[1] * 0.25)
-    hex_size = 280
+    steps.next("geometry and band")
+    log("[10/10] Adding premium geometric elements...")
+    canvas = Image.alpha_composite(canvas, geometry_overlay(target_size))
 
-    # Draw hexagon with gradient fill
-    for i in range(hex_size, 0, -5):
-        alpha = int(70 * (i / hex_size))
-        geom_draw.regular_polygon((hex_x, hex_y, i), n_sides=6, rotation=30, fill=(*gold_rgb, alpha))
+    # Dark band at bottom to cover any unwanted text from hero image
+    band_top, band = bottom_band(target_size)
+    canvas.paste(band, (0, band_top))
 
-    # Circle (electric blue)
-    circle_x = int(target_size[0] * 0.80)
-    circle_y = int(target_size[1] * 0.55)
-    circle_radius = 200
-
-    for i in range(circle_radius, 0, -5):
-        alpha = int(60 * (i / circle_radius))
-        geom_draw.ellipse([circle_x - i, circle_y - i, circle_x + i, circle_y + i],
-                         fill=(0, 217, 255, alpha))
-
-    # Small accent hexagon (purple)
-    hex2_x = int(target_size[0] * 0.68)
-    hex2_y = int(target_size[1] * 0.70)
-    hex2_size = 180
-    purple_rgb = (123, 47, 255)
+    # Document title (last, on top)
+    draw = ImageDraw.Draw(canvas)
+    doc_title_y = int(target_size[1] * 0.95)
+    draw.text((logo_x, doc_title_y), "BRAND GUIDE 2025", font=doc_title_font, fill=WHITE_80)
+    record_text(layout, draw, (logo_x, doc_title_y), "BRAND GUIDE 2025", doc_title_font, WHITE_80)
 
-    for i in range(hex2_size, 0, -5):
-        alpha = int(50 * (i / hex2_size))
-        geom_draw.regular_polygon((hex2_x, hex2_y, i), n_sides=6, rotation=0, fill=(*purple_rgb, alpha))
+    # Final conversion
+    final_image = canvas.convert('RGB')
 
-    # Composite geometry
-    hero_with_gradient = Image.alpha_composite(hero_with_gradient, geom_overlay)
+    # NEXT LEVEL: Final polish pass
+    steps.next("unsharp mask")
+    final_image = final_image.filter(ImageFilter.UnsharpMask(radius=1 * scale, percent=100, threshold=2))
+    steps.end()
+    return final_image
 
-    # Recreate draw context after composite
-    draw = ImageDraw.Draw(hero_with_gradient)
 
-    # Add dark overlay at bottom to cover any unwanted text from hero image
-    bottom_overlay_y = int(target_size[1] * 0.83)
-    for y in range(bottom_overlay_y, target_size[1]):
-        # Strong darkening overlay that fully covers any text
-        progress = (y - bottom_overlay_y) / (target_size[1] - bottom_overlay_y)
-        alpha = int(200 + (55 * progress))
-        draw.rectangle([(0, y), (target_size[0], y + 1)], fill=(*navy_rgb, alpha))
+def create_next_level_cover(output_path=OUTPUT_PATH, hero_path=HERO_IMAGE_PATH, scale=1.0, encoding=None,
+                            archive=False, **params):
+    """Create the ultimate cover page - next level elegance and impact
 
-    # Document title (last, on top)
-    doc_title_y = int(target_size[1] * 0.95)
-    draw.text((logo_x, doc_title_y), "BRAND GUIDE 2025", font=doc_title_font, fill=white_80)
+    scale below 1.0 renders a draft of the same layout (see --preview).
+    encoding is an image_encoding profile; drafts default to 'draft', full
+    renders to 'final'. With archive, a 'final' PNG is re-encoded with the
+    archival profile on a background worker and replaced in place; the caller
+    must wait_background() before exiting.
+    """
+    output_path = Path(output_path)
+    dpi = DPI * scale
 
-    # Final conversion
-    final_image = hero_with_gradient.convert('RGB')
+    print("=" * 70)
+    print("CREATING NEXT LEVEL COVER PAGE" + (f" (PREVIEW {scale:.0%})" if scale != 1.0 else ""))
+    print("=" * 70)
 
-    # NEXT LEVEL: Final polish pass
-    final_image = final_image.filter(ImageFilter.UnsharpMask(radius=1, percent=100, threshold=2))
+    layout = []
+    final_image = render_cover(hero_path, verbose=True, layout=layout, scale=scale, **params)
+    with stage("cover: contrast check"):
+        print_contrast_report(check_contrast(final_image, layout, dpi=dpi))
 
-    # Save with maximum quality
     print(f"\nSaving next-level cover page...")
-    final_image.save(output_path, 'PNG', quality=100, dpi=(300, 300), optimize=False)
+    with stage("cover: encode"):
+        encoded = save_image(final_image, output_path, encoding or ('final' if scale == 1.0 else 'draft'), dpi=dpi)
+    output_path = Path(encoded['path'])
+    if archive and encoded['profile'] == 'final':
+        save_image(final_image, output_path, 'archival', dpi=dpi, background=True)
 
     print("\n" + "=" * 70)
     print("NEXT LEVEL COVER PAGE CREATED")
     print("=" * 70)
     print(f"File: {output_path}")
     print(f"Size: {final_image.size}")
-    print(f"File size: {output_path.stat().st_size / 1024 / 1024:.2f} MB")
+    print(f"Encoded: {describe(encoded)}")
     print("\nPremium features applied:")
     print("  - Triple-pass image enhancement")
     print("  - Sophisticated multi-layer gradients")
@@ -296,6 +411,32 @@ def create_next_level_cover():
 
     return output_path
 
+def main():
+    """Main execution."""
+    parser = argparse.ArgumentParser(description="Composite the next-level cover page.")
+    parser.add_argument("--preview", action="store_true",
+                        help=f"quick draft at {PREVIEW_SCALE:.0%} scale, saved next to the cover as *_preview.png")
+    parser.add_argument("--scale", type=float, default=None, help="render scale (default: 1.0, or the preview scale)")
+    parser.add_argument("--hero", default=str(HERO_IMAGE_PATH), help="hero image")
+    parser.add_argument("--output", default=None, help="output image (suffix follows the encoding)")
+    parser.add_argument("--encoding", choices=list(ENCODING_PROFILES), default=None,
+                        help="image_encoding profile (default: final, or draft for previews)")
+    args = parser.parse_args()
+
+    scale = args.scale or (PREVIEW_SCALE if args.preview else 1.0)
+    output_path = args.output or (OUTPUT_PATH.with_name(f"{OUTPUT_PATH.stem}_preview.png") if scale != 1.0
+                                  else OUTPUT_PATH)
+
+    cover_path = create_next_level_cover(output_path, args.hero, scale=scale, encoding=args.encoding, archive=True)
+    with stage("cover: archival encode"):
+        for report in wait_background():
+            print(f"\nArchived: {describe(report)}")
+    if scale == 1.0:
+        print("\nReady for validation!")
+    else:
+        print("\nPreview only - render without --preview for the print file.")
+    return cover_path
+
+
 if __name__ == "__main__":
-    cover_path = create_next_level_cover()
-    print("\nReady for validation!")
+    main()
@@ -10,13 +10,17 @@ import os
 from PIL import Image, ImageDraw, ImageFont, ImageFilter, ImageEnhance
 from pathlib import Path
 
-def create_cover_page_v2():
+from brand import REIMAGINED
+from image_encoding import save_image
+from text_contrast import check_contrast, print_contrast_report, record_text
+
+def create_cover_page_v2(hero_image_path=None, output_path=None):
     """Create refined cover page - aiming for 90+ score"""
 
-    # Paths
+    # Paths (defaults: the hero and cover in assets/branding-guide)
     assets_dir = Path(__file__).parent.parent / "assets" / "branding-guide"
-    hero_image_path = assets_dir / "cover_hero_image_1.png"
-    output_path = assets_dir / "cover_page_v2.png"
+    hero_image_path = hero_image_path or assets_dir / "cover_hero_image_1.png"
+    output_path = output_path or assets_dir / "cover_page_v2.png"
 
     # Load hero image
     print("Loading hero image...")
@@ -49,7 +53,7 @@ def create_cover_page_v2():
     gradient = Image.new('RGBA', target_size, color=(0, 0, 0, 0))
     draw_gradient = ImageDraw.Draw(gradient)
 
-    navy_rgb = (11, 29, 58)
+    navy_rgb = REIMAGINED.navy.rgb
     for y in range(target_size[1] // 2):  # Top HALF instead of third
         alpha = int(255 * 0.6 * (1 - y / (target_size[1] // 2)))  # 60% opacity at top
         draw_gradient.rectangle(
@@ -63,13 +67,14 @@ def create_cover_page_v2():
 
     # Create drawing context
     draw = ImageDraw.Draw(hero_with_gradient)
+    layout = []  # text elements, for the contrast report
 
     # Colors
-    white = (255, 255, 255, 255)
-    gold = (255, 211, 58, 255)
-    electric_blue = (0, 217, 255, 255)
-    white_90 = (255, 255, 255, 230)
-    white_70 = (255, 255, 255, 179)
+    white = REIMAGINED.white.rgba()
+    gold = REIMAGINED.gold.rgba()
+    electric_blue = REIMAGINED.electric_blue.rgba()
+    white_90 = REIMAGINED.white.rgba(230)
+    white_70 = REIMAGINED.white.rgba(179)
     black_shadow = (0, 0, 0, 128)  # For text shadows
 
     # Font sizes
@@ -109,6 +114,7 @@ def create_cover_page_v2():
 
     # "REIMAGINE" in white with shadow
     draw_text_with_shadow((logo_x, logo_y), "REIMAGINE", logo_font, white, shadow_offset=6)
+    record_text(layout, draw, (logo_x, logo_y), "REIMAGINE", logo_font, white, bold=True)
 
     # "ED" in GLOWING gold
     ed_y = logo_y + int(logo_size * 0.80)
@@ -121,6 +127,7 @@ def create_cover_page_v2():
 
     # Final "ED" text
     draw.text((logo_x, ed_y), "ED", font=logo_font, fill=gold)
+    record_text(layout, draw, (logo_x, ed_y), "ED", logo_font, gold, bold=True)
 
     # 2. TAGLINE - with glow
     print("Adding enhanced tagline...")
@@ -138,6 +145,7 @@ def create_cover_page_v2():
         )
 
     draw.text((logo_x, tagline_y), tagline_text, font=tagline_font, fill=electric_blue)
+    record_text(layout, draw, (logo_x, tagline_y), tagline_text, tagline_font, electric_blue, bold=True)
 
     # 3. MISSION STATEMENT - STREAMLINED & CONCISE
     print("Adding streamlined mission statement...")
@@ -160,11 +168,12 @@ def create_cover_page_v2():
             logo_x + mission_width + box_padding,
             mission_y + mission_height + box_padding
         ],
-        fill=(11, 29, 58, 200)  # Navy with 78% opacity
+        fill=REIMAGINED.navy.rgba(200)  # Navy with 78% opacity
     )
 
     # Draw mission text
     draw.text((logo_x, mission_y), mission_text, font=mission_font, fill=white)
+    record_text(layout, draw, (logo_x, mission_y), mission_text, mission_font, white)
 
     # 4. BRAND PILLARS - More prominent
     print("Adding brand pillars...")
@@ -177,11 +186,13 @@ def create_cover_page_v2():
     pillars_x = (target_size[0] - pillars_width) // 2
 
     draw_text_with_shadow((pillars_x, pillars_y), pillars_text, pillars_font, gold, shadow_offset=3)
+    record_text(layout, draw, (pillars_x, pillars_y), pillars_text, pillars_font, gold, bold=True)
 
     # 5. DOCUMENT TITLE
     print("Adding document title...")
     doc_title_y = int(target_size[1] * 0.94)
     draw.text((logo_x, doc_title_y), "BRAND GUIDE 2025", font=doc_title_font, fill=white_70)
+    record_text(layout, draw, (logo_x, doc_title_y), "BRAND GUIDE 2025", doc_title_font, white_70)
 
     # 6. BOLD TECH ELEMENTS - More prominent
     print("Adding enhanced tech elements...")
@@ -216,7 +227,7 @@ def create_cover_page_v2():
     hex2_size = 200
     hex2_x = tech_x_start + 100
     hex2_y = int(target_size[1] * 0.65)
-    purple = (123, 47, 255)  # #7B2FFF
+    purple = REIMAGINED.purple.rgb
     tech_draw.regular_polygon(
         (hex2_x, hex2_y, hex2_size),
         n_sides=6,
@@ -233,9 +244,12 @@ def create_cover_page_v2():
     # FINAL ENHANCEMENT: Slight sharpening pass
     final_image = final_image.filter(ImageFilter.SHARPEN)
 
+    # Measure legibility on the finished pixels
+    print_contrast_report(check_contrast(final_image, layout))
+
     # Save
     print(f"Saving refined cover page to {output_path}...")
-    final_image.save(output_path, 'PNG', quality=100, dpi=(300, 300))
+    save_image(final_image, output_path, 'final', dpi=300)
 
     print(f"\nCover page V2 created successfully!")
     print(f"File: {output_path}")
@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+"""
+Episode Asset Pipeline for The Right Path Podcast
+
+One command per episode: fills the opening/closing scripts with the episode's
+data, renders the social artwork, brands a Zoom background and exports show
+notes. Steps run as a dependency graph (independent steps in parallel) and are
+skipped when their code, episode data and input files are unchanged.
+
+Manifest: CSV or JSON with the fields number, title, guest, quote
+(same format as assets/branding-guide/episode_artwork.py).
+
+Usage:
+    python episode_pipeline.py episodes.csv --episode 12
+    python episode_pipeline.py episodes.csv              # every episode
+"""
+import sys
+import argparse
+from pathlib import Path
+from datetime import datetime
+from functools import lru_cache
+
+from PIL import Image, ImageDraw, ImageFont
+
+from brand import RIGHT_PATH
+from task_graph import TaskGraph, module_files
+
+# Paths
+SCRIPT_DIR = Path(__file__).parent
+ASSETS_DIR = SCRIPT_DIR.parent / "assets"
+PODCAST_SCRIPTS = ASSETS_DIR / "scripts" / "podcast-scripts.md"
+EPISODES_DIR = ASSETS_DIR / "episodes"
+ZOOM_BASE = ASSETS_DIR / "zoom-backgrounds" / "02_abstract_flow.png"
+LOGO_PATH = ASSETS_DIR / "the-right-path-logo.png"
+
+# The social template renderer lives next to the brand guide PDF generator
+sys.path.insert(0, str(ASSETS_DIR / "branding-guide"))
+from episode_artwork import BACKGROUNDS, TEMPLATE_TYPES, load_manifest, render_episode_artwork
+
+# Code the steps call into, so layout, branding or script-filling edits re-render
+# the episode assets (see step_code)
+ARTWORK_SCRIPT = ASSETS_DIR / "branding-guide" / "episode_artwork.py"
+ZOOM_SCRIPT = SCRIPT_DIR / "generate_branded_zoom_background.py"
+PIPELINE_SCRIPT = Path(__file__)
+
+# Episode-specific lines added to the standing scripts
+EPISODE_INTRO = 'Today, in episode {number}, "{title}", we\'re joined by {guest}.'
+EPISODE_INTRO_NO_GUEST = 'Today, in episode {number}: "{title}".'
+EPISODE_OUTRO = "A special thank you to {guest} for joining us on this episode."
+
+# Zoom caption strip
+CAPTION_BG = RIGHT_PATH.purple.rgba(220)
+CAPTION_TEXT = (255, 255, 255)
+
+# =============================================================================
+# STEPS
+# =============================================================================
+
+def read_script_sections(scripts_path):
+    """Return {heading: paragraphs} for the '## ' sections of the podcast scripts file."""
+    sections = {}
+    current = None
+    for block in Path(scripts_path).read_text(encoding='utf-8').split('\n\n'):
+        block = block.strip()
+        if block.startswith('## '):
+            current = block[3:].strip()
+            sections[current] = []
+        elif current and block and block != '---' and not block.startswith('*'):
+            sections[current].append(block)
+    return sections
+
+
+def fill_scripts(episode, scripts_path, output_path):
+    """Write the opening and closing scripts personalized for one episode."""
+    sections = read_script_sections(scripts_path)
+
+    def fill(text):
+        for field, value in episode.items():
+            text = text.replace(f"{{{field}}}", value)
+        return text
+
+    opening = [fill(p) for p in sections.get('Opening Script', [])]
+    closing = [fill(p) for p in sections.get('Closing Script', [])]
+    opening.append((EPISODE_INTRO if episode['guest'] else EPISODE_INTRO_NO_GUEST).format(**episode))
+    if episode['guest']:
+        closing.insert(0, EPISODE_OUTRO.format(**episode))
+
+    lines = [f"# The Right Path Podcast — Episode {episode['number']}: {episode['title']}", ""]
+    lines += ["## Opening Script", ""] + [p + "\n" for p in opening]
+    lines += ["## Closing Script", ""] + [p + "\n" for p in closing]
+
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    output_path.write_text("\n".join(lines), encoding='utf-8')
+    return str(output_path)
+
+
+def brand_zoom_background(episode, base_path, output_path, caption_bg=CAPTION_BG, caption_text=CAPTION_TEXT):
+    """Apply the logo lockup to a Zoom background and caption it with the episode title."""
+    from generate_branded_zoom_background import add_branding
+
+    background = add_branding(Image.open(base_path).convert("RGB")).convert("RGBA")
+
+    try:
+        font = ImageFont.truetype("C:/Windows/Fonts/georgia.ttf", 40)
+    except OSError:
+        font = ImageFont.load_default(40)
+
+    caption = f"Episode {episode['number']}: {episode['title']}"
+    overlay = Image.new('RGBA', background.size, (0, 0, 0, 0))
+    draw = ImageDraw.Draw(overlay)
+    text_bbox = draw.textbbox((0, 0), caption, font=font)
+    strip_top = background.height - 40 - (text_bbox[3] - text_bbox[1]) - 40
+    draw.rounded_rectangle(
+        [40, strip_top, 40 + (text_bbox[2] - text_bbox[0]) + 60, background.height - 40],
+        radius=15,
+        fill=caption_bg
+    )
+    draw.text((70, strip_top + 20 - text_bbox[1]), caption, font=font, fill=caption_text)
+
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    Image.alpha_composite(background, overlay).convert("RGB").save(output_path, "PNG")
+    return str(output_path)
+
+
+def export_show_notes(episode, script_path, artwork_paths, zoom_path, output_path):
+    """Write markdown show notes that link the episode's generated assets."""
+    output_path = Path(output_path)
+    intro = episode_intro(script_path)
+
+    lines = [f"# Episode {episode['number']}: {episode['title']}", ""]
+    if episode['guest']:
+        lines += [f"**Guest:** {episode['guest']}", ""]
+    if episode['quote']:
+        lines += [f"> {episode['quote']}", ""]
+    if intro:
+        lines += [intro, ""]
+
+    lines += ["## Episode Assets", ""]
+    for path in list(artwork_paths) + [zoom_path]:
+        path = Path(path)
+        lines.append(f"- [{path.stem.replace('_', ' ').title()}]({path.relative_to(output_path.parent).as_posix()})")
+    lines += ["", "*The Right Path Podcast — AI in Action. Educate. Employ. Empower.*", ""]
+
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    output_path.write_text("\n".join(lines), encoding='utf-8')
+    return str(output_path)
+
+
+def episode_intro(script_path):
+    """Return the episode introduction line from a filled script, if any."""
+    paragraphs = [p.strip() for p in Path(script_path).read_text(encoding='utf-8').split('\n\n')]
+    return next((p for p in paragraphs if p.startswith('Today, in episode')), '')
+
+
+def render_artwork(template_type, episode, output_path, frame_key):
+    """Render one social card; frame_key ties the cache entry to the template frame's content."""
+    return render_episode_artwork(template_type, episode, output_path)
+
+# =============================================================================
+# PIPELINE
+# =============================================================================
+
+@lru_cache(maxsize=None)
+def step_code(script):
+    """script and the local modules it imports; walked when tasks are added, not on import."""
+    return tuple(module_files(script, search=[SCRIPT_DIR]))
+
+
+def episode_dir(episode, root=EPISODES_DIR):
+    return Path(root) / f"episode_{episode['number']}"
+
+
+def add_episode_tasks(graph, episode, root=EPISODES_DIR):
+    """Register every step for one episode; returns the show notes path."""
+    out = episode_dir(episode, root)
+    prefix = f"ep{episode['number']}"
+
+    script_path = out / "script.md"
+    graph.add(f"{prefix}:script", fill_scripts,
+              args=(episode, str(PODCAST_SCRIPTS), str(script_path)),
+              inputs=[PODCAST_SCRIPTS, *step_code(PIPELINE_SCRIPT)], outputs=[script_path])
+
+    artwork_paths = []
+    for template_type in TEMPLATE_TYPES:
+        artwork_path = out / "artwork" / f"{template_type}.png"
+        graph.add(f"{prefix}:artwork:{template_type}", render_artwork,
+                  args=(template_type, episode, str(artwork_path), BACKGROUNDS.key(template_type)),
+                  inputs=step_code(ARTWORK_SCRIPT), outputs=[artwork_path])
+        artwork_paths.append(artwork_path)
+
+    zoom_path = out / "zoom_background.png"
+    graph.add(f"{prefix}:zoom", brand_zoom_background,
+              args=(episode, str(ZOOM_BASE), str(zoom_path), CAPTION_BG, CAPTION_TEXT),
+              inputs=[ZOOM_BASE, LOGO_PATH, *step_code(ZOOM_SCRIPT)], outputs=[zoom_path])
+
+    notes_path = out / "show_notes.md"
+    graph.add(f"{prefix}:show_notes", export_show_notes,
+              args=(episode, str(script_path), [str(p) for p in artwork_paths], str(zoom_path), str(notes_path)),
+              deps=[f"{prefix}:script", f"{prefix}:zoom"] + [f"{prefix}:artwork:{t}" for t in TEMPLATE_TYPES],
+              inputs=[script_path, *step_code(PIPELINE_SCRIPT)], outputs=[notes_path])
+    return notes_path
+
+
+def main():
+    """Main execution."""
+    parser = argparse.ArgumentParser(description="Produce every asset for one or more podcast episodes.")
+    parser.add_argument("manifest", help="CSV or JSON episode manifest (number, title, guest, quote)")
+    parser.add_argument("--episode", action="append", help="episode number to build (repeatable; default: all)")
+    parser.add_argument("--output", default=str(EPISODES_DIR), help="episodes output directory")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: CPU count)")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("The Right Path Podcast - Episode Pipeline")
+    print("=" * 60)
+
+    episodes = load_manifest(args.manifest)
+    if args.episode:
+        episodes = [ep for ep in episodes if ep['number'] in args.episode]
+    if not episodes:
+        print("No matching episodes in manifest")
+        return None
+
+    start = datetime.now()
+    graph = TaskGraph(Path(args.output) / ".pipeline_cache.json")
+    notes = [add_episode_tasks(graph, episode, args.output) for episode in episodes]
+    status = graph.run(max_workers=args.workers)
+
+    elapsed = (datetime.now() - start).total_seconds()
+    counts = {s: list(status.values()).count(s) for s in ('ran', 'cached', 'failed', 'blocked')}
+    print("\n" + "=" * 60)
+    print(f"Done in {elapsed:.1f}s: {counts['ran']} ran, {counts['cached']} cached, "
+          f"{counts['failed']} failed, {counts['blocked']} blocked")
+    for path in notes:
+        print(f"  Show notes: {path}")
+    print("=" * 60)
+
+    return notes
+
+
+if __name__ == "__main__":
+    main()
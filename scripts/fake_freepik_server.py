@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for the Freepik Mystic API
+
+Serves the three calls freepik_jobs makes, so the job client can be run and
+timed offline:
+
+    POST /v1/ai/mystic              create a task     -> {"data": {"task_id", "status"}}
+    GET  /v1/ai/mystic/<task_id>    task status       -> IN_PROGRESS until `delay` has passed,
+                                                         then COMPLETED with a "generated" URL
+    GET  /files/<task_id>.png       the generated image (a PNG tinted from the prompt)
+
+Requests without an x-freepik-api-key header get 401. With --rate-limit N,
+every Nth status request is answered 429 with Retry-After: 1. Tasks live in
+memory, so a server restart forgets them (polling them then gives 404).
+
+Usage:
+    python fake_freepik_server.py --port 8765 --delay 5
+    FREEPIK_API_URL=http://127.0.0.1:8765/v1/ai/mystic FREEPIK_API_KEY=x python freepik_jobs.py "a prompt"
+"""
+import io
+import json
+import time
+import uuid
+import hashlib
+import argparse
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from PIL import Image, ImageDraw
+
+API_PATH = "/v1/ai/mystic"
+IMAGE_SIZE = (640, 360)
+
+
+class FakeFreepikServer(ThreadingHTTPServer):
+    """In-memory Mystic task store; counts calls so clients can be checked."""
+
+    daemon_threads = True
+
+    def __init__(self, address, delay=3.0, rate_limit=0):
+        super().__init__(address, FakeFreepikHandler)
+        self.delay = delay
+        self.rate_limit = rate_limit
+        self.tasks = {}
+        self.counts = {'created': 0, 'polls': 0, 'downloads': 0, 'rate_limited': 0}
+        self.lock = threading.Lock()
+
+    @property
+    def base_url(self):
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+
+class FakeFreepikHandler(BaseHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass  # keep client output readable
+
+    def _send_json(self, status, body, headers=None):
+        payload = json.dumps(body).encode('utf-8')
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _authorized(self):
+        if self.headers.get("x-freepik-api-key"):
+            return True
+        self._send_json(401, {"message": "Invalid API key"})
+        return False
+
+    def do_POST(self):
+        if self.path.rstrip('/') != API_PATH:
+            return self._send_json(404, {"message": "Not found"})
+        if not self._authorized():
+            return
+        body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b'{}')
+        if not body.get("prompt"):
+            return self._send_json(400, {"message": "prompt is required"})
+
+        server = self.server
+        task_id = str(uuid.uuid4())
+        with server.lock:
+            server.tasks[task_id] = {'prompt': body["prompt"], 'created': time.monotonic()}
+            server.counts['created'] += 1
+        self._send_json(200, {"data": {"task_id": task_id, "status": "CREATED", "generated": []}})
+
+    def do_GET(self):
+        server = self.server
+        if self.path.startswith("/files/"):
+            return self._send_image(self.path[len("/files/"):].removesuffix(".png"))
+        if not self.path.startswith(API_PATH + "/"):
+            return self._send_json(404, {"message": "Not found"})
+        if not self._authorized():
+            return
+
+        with server.lock:
+            server.counts['polls'] += 1
+            limited = server.rate_limit and server.counts['polls'] % server.rate_limit == 0
+            if limited:
+                server.counts['rate_limited'] += 1
+        if limited:
+            return self._send_json(429, {"message": "Too many requests"}, {"Retry-After": "1"})
+
+        task_id = self.path[len(API_PATH) + 1:]
+        task = server.tasks.get(task_id)
+        if task is None:
+            return self._send_json(404, {"message": "Task not found"})
+        if time.monotonic() - task['created'] < server.delay:
+            return self._send_json(200, {"data": {"task_id": task_id, "status": "IN_PROGRESS", "generated": []}})
+        self._send_json(200, {"data": {"task_id": task_id, "status": "COMPLETED",
+                                       "generated": [f"{server.base_url}/files/{task_id}.png"]}})
+
+    def _send_image(self, task_id):
+        task = self.server.tasks.get(task_id)
+        if task is None:
+            return self._send_json(404, {"message": "Not found"})
+        tint = hashlib.sha1(task['prompt'].encode('utf-8')).digest()[:3]
+        image = Image.new('RGB', IMAGE_SIZE, tuple(tint))
+        ImageDraw.Draw(image).text((20, 20), task['prompt'][:60], fill=(255, 255, 255))
+        buffer = io.BytesIO()
+        image.save(buffer, 'PNG')
+        with self.server.lock:
+            self.server.counts['downloads'] += 1
+
+        self.send_response(200)
+        self.send_header("Content-Type", "image/png")
+        self.send_header("Content-Length", str(buffer.tell()))
+        self.end_headers()
+        self.wfile.write(buffer.getvalue())
+
+
+def start_fake_server(port=0, delay=3.0, rate_limit=0):
+    """Serve on a background thread; returns (server, Mystic API URL)."""
+    server = FakeFreepikServer(("127.0.0.1", port), delay=delay, rate_limit=rate_limit)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, server.base_url + API_PATH
+
+
+def main():
+    """Main execution."""
+    parser = argparse.ArgumentParser(description="Run a local fake of the Freepik Mystic API.")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--delay", type=float, default=3.0, help="seconds until a task completes")
+    parser.add_argument("--rate-limit", type=int, default=0, help="answer every Nth status poll with 429")
+    args = parser.parse_args()
+
+    server = FakeFreepikServer(("127.0.0.1", args.port), delay=args.delay, rate_limit=args.rate_limit)
+    print(f"Fake Freepik API at {server.base_url}{API_PATH} (Ctrl+C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        print(f"Served: {server.counts}")
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,357 @@
+#!/usr/bin/env python3
+"""
+Freepik Mystic job client
+
+Mystic works asynchronously: a POST creates a task and the image can be
+fetched once polling reports it COMPLETED. Instead of creating one task and
+sleeping between polls, the client submits every prompt at once and watches
+all pending tasks from one loop:
+
+- each task is polled on its own schedule, backing off while its status is
+  unchanged, and the first poll is timed from how long recent tasks took
+  (remembered between runs)
+- rate limits (429) and server errors are retried after Retry-After or the
+  task's backoff
+- a finished image is downloaded on a worker thread as soon as it is seen,
+  while the others keep polling
+
+Task IDs are written to TASKS_PATH the moment they are created, so an
+interrupted run can resume polling (--resume, or generate() with the same
+jobs) instead of paying for new generations.
+
+Usage:
+    python freepik_jobs.py "prompt one" "prompt two" --output-dir ../assets/branding-guide/freepik
+    python freepik_jobs.py --resume
+    python freepik_jobs.py --fake "test prompt" "another"      # offline, against fake_freepik_server
+"""
+import os
+import re
+import sys
+import json
+import time
+import argparse
+import threading
+from pathlib import Path
+from statistics import median
+from concurrent.futures import ThreadPoolExecutor
+
+from media_ingest import save_media
+from usage_ledger import record as record_usage
+
+# Paths
+SCRIPT_DIR = Path(__file__).parent
+BRANDING_DIR = SCRIPT_DIR.parent / "assets" / "branding-guide"
+TASKS_PATH = BRANDING_DIR / ".freepik_tasks.json"
+OUTPUT_DIR = BRANDING_DIR / "freepik"
+
+API_URL = os.environ.get('FREEPIK_API_URL', "https://api.freepik.com/v1/ai/mystic")
+
+# Request body defaults for every Mystic task
+MYSTIC_OPTIONS = {
+    "resolution": "2k",
+    "aspect_ratio": "widescreen_16_9",
+    "styling": {"style": "photo"},
+}
+
+# Polling schedule (seconds)
+FIRST_POLL = 2.0         # before any completion time has been observed
+MIN_POLL = 1.0
+MAX_POLL = 15.0
+BACKOFF = 1.5            # interval growth while a task's status is unchanged
+EARLY_FACTOR = 0.8       # first poll at this share of the typical completion time
+MAX_ERRORS = 5           # consecutive failed polls before a task is given up
+
+REQUEST_TIMEOUT = 30
+DEFAULT_TIMEOUT = 300
+
+# Task states that need no more polling
+FINISHED = ('DOWNLOADED', 'FAILED')
+
+
+def _task_data(body):
+    """The task object of a Mystic response ({'data': {...}}; older responses carried a list)."""
+    data = body.get('data', body) if isinstance(body, dict) else {}
+    if isinstance(data, list):
+        data = data[0] if data else {}
+    return data
+
+
+def _generated_source(data):
+    """First generated image of a task as a URL or data URL, or None."""
+    generated = data.get('generated') or [data.get('base64') or data.get('url')]
+    source = generated[0] if generated else None
+    if isinstance(source, dict):
+        source = source.get('base64') or source.get('url')
+    return source or None
+
+
+def _retry_after(response):
+    try:
+        return float(response.headers.get('Retry-After', ''))
+    except ValueError:
+        return None
+
+
+class FreepikJobs:
+    """Submits Mystic tasks and polls them together; state persists in tasks_path."""
+
+    def __init__(self, api_key, api_url=API_URL, tasks_path=TASKS_PATH, session=None, max_workers=4):
+        if session is None:
+            import requests
+            session = requests.Session()
+        self.session = session
+        self.api_url = api_url.rstrip('/')
+        self.tasks_path = Path(tasks_path)
+        self.headers = {"x-freepik-api-key": api_key, "Content-Type": "application/json"}
+        self.max_workers = max_workers
+        self.lock = threading.Lock()
+        self.state = self._load()
+        self.stats = {'submitted': 0, 'polls': 0, 'retries': 0, 'downloaded': 0}
+
+    # ==================== STATE ====================
+
+    def _load(self):
+        if self.tasks_path.exists():
+            with open(self.tasks_path, encoding='utf-8') as f:
+                return json.load(f)
+        return {'tasks': {}, 'durations': []}
+
+    def _save(self):
+        """Persist the task table (callers hold self.lock)."""
+        self.tasks_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self.tasks_path.with_suffix('.tmp')
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.state, f, indent=2, sort_keys=True)
+        os.replace(temp_path, self.tasks_path)
+
+    def _update(self, task_id, **fields):
+        with self.lock:
+            self.state['tasks'][task_id].update(fields)
+            self._save()
+
+    def pending(self):
+        """IDs of tasks still waiting for a result."""
+        return [task_id for task_id, task in self.state['tasks'].items() if task['status'] not in FINISHED]
+
+    def typical_duration(self):
+        """Median submit-to-complete time of recent tasks, or None before any completed."""
+        durations = self.state['durations']
+        return median(durations) if durations else None
+
+    # ==================== API CALLS ====================
+
+    def submit(self, prompt, output_path, **options):
+        """Create a Mystic task for prompt; returns its task ID."""
+        body = {"prompt": prompt, **MYSTIC_OPTIONS, **options}
+        response = self.session.post(self.api_url, headers=self.headers, json=body, timeout=REQUEST_TIMEOUT)
+        if response.status_code != 200:
+            raise RuntimeError(f"Freepik API error {response.status_code}: {response.text[:200]}")
+        data = _task_data(response.json())
+
+        task_id = data.get('task_id') or f"inline-{time.time_ns()}"
+        task = {'prompt': prompt, 'output': str(output_path), 'status': data.get('status', 'CREATED'),
+                'submitted': time.time()}
+        with self.lock:
+            self.state['tasks'][task_id] = task
+            self._save()
+            self.stats['submitted'] += 1
+
+        # Some responses carry the image straight away
+        source = _generated_source(data)
+        if source:
+            self._download(task_id, source)
+        return task_id
+
+    def _poll(self, task_id):
+        """One status request; returns (status, image source or None, retry delay or None)."""
+        self.stats['polls'] += 1
+        response = self.session.get(f"{self.api_url}/{task_id}", headers=self.headers, timeout=REQUEST_TIMEOUT)
+        if response.status_code == 404:
+            return 'FAILED', None, None
+        if response.status_code == 429 or response.status_code >= 500:
+            self.stats['retries'] += 1
+            return None, None, _retry_after(response)
+        response.raise_for_status()
+        data = _task_data(response.json())
+        return data.get('status', 'IN_PROGRESS'), _generated_source(data), None
+
+    def _download(self, task_id, source):
+        task = self.state['tasks'][task_id]
+        save_media(source, task['output'], session=self.session, timeout=REQUEST_TIMEOUT)
+        duration = time.time() - task['submitted']
+        record_usage('freepik', 'mystic', Path(task['output']).stem, seconds=duration, images=1,
+                     nbytes=os.path.getsize(task['output']))
+        with self.lock:
+            task['status'] = 'DOWNLOADED'
+            durations = self.state['durations']
+            durations.append(round(duration, 2))
+            del durations[:-20]
+            self._save()
+            self.stats['downloaded'] += 1
+        print(f"  Downloaded: {task['output']}")
+
+    # ==================== POLLING LOOP ====================
+
+    def wait(self, task_ids=None, timeout=DEFAULT_TIMEOUT, cancel=None):
+        """Poll tasks until each is downloaded or failed, or timeout passes.
+
+        Returns {task_id: output path, or None if it failed or is still pending}.
+        Tasks still pending at the timeout stay in the task file for a later run.
+        Setting cancel (a threading.Event) stops polling early and marks the
+        pending tasks FAILED, so a later --resume does not fetch them.
+        """
+        cancel = cancel or threading.Event()
+        task_ids = list(task_ids if task_ids is not None else self.pending())
+        tasks = self.state['tasks']
+        deadline = time.monotonic() + timeout
+        typical = self.typical_duration()
+
+        # Next poll time and current interval per task
+        schedule = {}
+        now, wall_now = time.monotonic(), time.time()
+        for task_id in task_ids:
+            if tasks[task_id]['status'] in FINISHED:
+                continue
+            age = wall_now - tasks[task_id]['submitted']
+            first = max(MIN_POLL, EARLY_FACTOR * typical - age) if typical else FIRST_POLL
+            schedule[task_id] = [now + first, FIRST_POLL, 0]   # due, interval, consecutive errors
+
+        downloads = []
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            while schedule and time.monotonic() < deadline and not cancel.is_set():
+                task_id, (due, interval, errors) = min(schedule.items(), key=lambda item: item[1][0])
+                if cancel.wait(max(0.0, min(due, deadline) - time.monotonic())) or time.monotonic() >= deadline:
+                    break
+
+                try:
+                    status, source, retry_after = self._poll(task_id)
+                except Exception as e:
+                    errors += 1
+                    print(f"  [{task_id[:8]}] poll failed ({errors}/{MAX_ERRORS}): {e}")
+                    if errors >= MAX_ERRORS:
+                        self._update(task_id, status='FAILED', error=str(e))
+                        del schedule[task_id]
+                        continue
+                    status, source, retry_after = None, None, None
+
+                if status == 'COMPLETED' and source:
+                    self._update(task_id, status='COMPLETED')
+                    downloads.append(pool.submit(self._download, task_id, source))
+                    del schedule[task_id]
+                elif status == 'FAILED':
+                    self._update(task_id, status='FAILED')
+                    record_usage('freepik', 'mystic', Path(tasks[task_id]['output']).stem,
+                                 seconds=time.time() - tasks[task_id]['submitted'], error='generation failed')
+                    print(f"  [{task_id[:8]}] generation failed")
+                    del schedule[task_id]
+                else:
+                    if status and status != tasks[task_id]['status']:
+                        self._update(task_id, status=status)
+                        interval = FIRST_POLL      # progress: look again soon
+                    else:
+                        interval = min(interval * BACKOFF, MAX_POLL)
+                    wait_for = retry_after if retry_after is not None else interval
+                    schedule[task_id] = [time.monotonic() + wait_for, interval, errors if status is None else 0]
+
+            for future in downloads:
+                try:
+                    future.result()
+                except Exception as e:
+                    print(f"  Download failed: {e}")
+
+        if schedule and cancel.is_set():
+            for task_id in schedule:
+                self._update(task_id, status='FAILED', error='cancelled')
+        elif schedule:
+            print(f"  {len(schedule)} task(s) still pending; run again with --resume to keep polling")
+        return {task_id: tasks[task_id]['output'] if tasks[task_id]['status'] == 'DOWNLOADED' else None
+                for task_id in task_ids}
+
+    def generate(self, jobs, timeout=DEFAULT_TIMEOUT, **options):
+        """Generate [(prompt, output_path), ...] concurrently; returns {output_path: path or None}.
+
+        Jobs already submitted for the same prompt and output are resumed, not
+        resubmitted; jobs whose image was already downloaded are skipped.
+        """
+        jobs = list(jobs)
+        known = {(task['prompt'], task['output']): task_id for task_id, task in self.state['tasks'].items()
+                 if task['status'] != 'FAILED'}
+        task_ids, to_submit = {}, []
+        for prompt, output_path in jobs:
+            task_id = known.get((prompt, str(output_path)))
+            if task_id and (self.state['tasks'][task_id]['status'] != 'DOWNLOADED' or Path(output_path).exists()):
+                task_ids[str(output_path)] = task_id
+            else:
+                to_submit.append((prompt, output_path))
+
+        if task_ids:
+            print(f"  Resuming {len(task_ids)} task(s) from {self.tasks_path.name}")
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            futures = {str(path): pool.submit(self.submit, prompt, path, **options) for prompt, path in to_submit}
+        for path, future in futures.items():
+            try:
+                task_ids[path] = future.result()
+            except Exception as e:
+                print(f"  Submit failed for {Path(path).name}: {e}")
+        print(f"  Submitted {len(futures)} task(s), polling {len(task_ids)}")
+
+        results = self.wait(task_ids.values(), timeout=timeout)
+        return {str(path): results.get(task_ids.get(str(path))) for _, path in jobs}
+
+
+def output_name(prompt, index):
+    """File name for a prompt: index plus the prompt's first words."""
+    slug = re.sub(r'[^a-z0-9]+', '-', prompt.lower()).strip('-')[:40].rstrip('-')
+    return f"{index:02d}_{slug or 'image'}.png"
+
+
+def main():
+    """Main execution."""
+    parser = argparse.ArgumentParser(description="Generate images with Freepik Mystic, polling all tasks together.")
+    parser.add_argument("prompts", nargs="*", help="prompts to generate, one image each")
+    parser.add_argument("--output-dir", default=str(OUTPUT_DIR), help="where images are saved")
+    parser.add_argument("--resume", action="store_true", help="keep polling the pending tasks of an earlier run")
+    parser.add_argument("--timeout", type=float, default=DEFAULT_TIMEOUT, help="seconds to keep polling")
+    parser.add_argument("--tasks", default=str(TASKS_PATH), help="task file (default: %(default)s)")
+    parser.add_argument("--fake", action="store_true", help="run against a local fake_freepik_server")
+    parser.add_argument("--fake-delay", type=float, default=3.0, help="seconds the fake server takes per image")
+    args = parser.parse_args()
+
+    api_url, api_key = API_URL, os.getenv("FREEPIK_API_KEY")
+    if args.fake:
+        from fake_freepik_server import start_fake_server
+        server, api_url = start_fake_server(delay=args.fake_delay)
+        api_key = "fake-key"
+    if not api_key:
+        print("Error: FREEPIK_API_KEY not set")
+        sys.exit(1)
+    if not args.prompts and not args.resume:
+        parser.error("give prompts to generate, or --resume")
+
+    print("=" * 60)
+    print("Freepik Mystic Jobs")
+    print("=" * 60)
+
+    start = time.perf_counter()
+    jobs = FreepikJobs(api_key, api_url, tasks_path=args.tasks)
+    if args.resume:
+        print(f"  Resuming {len(jobs.pending())} pending task(s)")
+        results = jobs.wait(timeout=args.timeout)
+    else:
+        output_dir = Path(args.output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        results = jobs.generate([(prompt, output_dir / output_name(prompt, i + 1))
+                                 for i, prompt in enumerate(args.prompts)], timeout=args.timeout)
+
+    done = sum(1 for path in results.values() if path)
+    print("\n" + "=" * 60)
+    print(f"{done}/{len(results)} image(s) in {time.perf_counter() - start:.1f} s "
+          f"({jobs.stats['submitted']} submitted, {jobs.stats['polls']} polls, {jobs.stats['retries']} retried)")
+    print("=" * 60)
+    if args.fake:
+        server.shutdown()
+    return results
+
+
+if __name__ == "__main__":
+    main()
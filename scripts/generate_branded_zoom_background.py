@@ -2,25 +2,32 @@
 """Generate a branded Zoom background with logo and text overlay."""
 
 import os
-import requests
-from openai import OpenAI
+import argparse
 from pathlib import Path
 from PIL import Image, ImageDraw, ImageFont, ImageFilter
-import io
+
+from brand import RIGHT_PATH
+from image_encoding import PROFILES as ENCODING_PROFILES, describe, save_image, wait_background
+from image_providers import DallEProvider, ImageRequest
+from stage_timing import stage, stages
 
 # Paths
 SCRIPT_DIR = Path(__file__).parent
 ASSETS_DIR = SCRIPT_DIR.parent / "assets"
 OUTPUT_DIR = ASSETS_DIR / "zoom-backgrounds"
 LOGO_PATH = ASSETS_DIR / "the-right-path-logo.png"
+BACKGROUND_PATH = OUTPUT_DIR / "05_ai_tech_background.png"
 DOWNLOADS_DIR = Path("C:/Users/MarieLexisDad/Downloads")
 
-# Brand colors
-PURPLE = (107, 45, 139)  # #6B2D8B
-CHARCOAL = (44, 44, 44)  # #2C2C2C
+# Zoom background size; branding measures are given at this size and scaled
+ZOOM_SIZE = (1920, 1080)
+
+# Render scale of --preview drafts
+PREVIEW_SCALE = 0.5
 
-# Initialize OpenAI client
-client = OpenAI()
+# Brand colors
+PURPLE = RIGHT_PATH.purple.rgb
+CHARCOAL = RIGHT_PATH.charcoal.rgb
 
 def generate_background():
     """Generate a clean branded background."""
@@ -36,28 +43,30 @@ def generate_background():
     16:9 aspect ratio. Modern, innovative, educational technology aesthetic.
     No text, no logos, just abstract AI/tech design elements."""
 
-    response = client.images.generate(
-        model="dall-e-3",
-        prompt=prompt,
-        size="1792x1024",
-        quality="hd",
-        n=1
-    )
-
-    image_url = response.data[0].url
-    image_response = requests.get(image_url)
-    return Image.open(io.BytesIO(image_response.content))
+    result = DallEProvider().generate(ImageRequest(prompt, size=ZOOM_SIZE), BACKGROUND_PATH)
+    if not result.ok:
+        raise RuntimeError(f"Background generation failed: {result.error}")
+    print(f"Saved unbranded background: {result.path} (re-brand it with --background)")
+    return Image.open(result.path)
 
-def add_branding(background):
+def add_branding(background, scale=1.0):
     """Overlay logo and text on the background with white background box in top right."""
     print("Adding logo and text...")
+    steps = stages("zoom")
 
-    # Resize background to exact 1920x1080
-    background = background.resize((1920, 1080), Image.LANCZOS)
+    def px(value):
+        """Full-size measure at this scale."""
+        return max(1, int(value * scale))
 
+    steps.next("resize")
+    # Resize background to exact 1920x1080 (times scale for previews)
+    width, height = round(ZOOM_SIZE[0] * scale), round(ZOOM_SIZE[1] * scale)
+    background = background.resize((width, height), Image.LANCZOS)
+
+    steps.next("logo")
     # Load and resize logo (20% larger: 120 * 1.2 = 144)
     logo = Image.open(LOGO_PATH).convert("RGBA")
-    logo_size = 144
+    logo_size = px(144)
     logo = logo.resize((logo_size, logo_size), Image.LANCZOS)
 
     # Remove white background from logo - make white pixels transparent
@@ -71,12 +80,13 @@ def add_branding(background):
             new_logo_data.append(pixel)
     logo.putdata(new_logo_data)
 
+    steps.next("text layout")
     # Try to use a nice font
     try:
-        font = ImageFont.truetype("C:/Windows/Fonts/georgia.ttf", 50)
+        font = ImageFont.truetype("C:/Windows/Fonts/georgia.ttf", px(50))
     except:
         try:
-            font = ImageFont.truetype("C:/Windows/Fonts/times.ttf", 50)
+            font = ImageFont.truetype("C:/Windows/Fonts/times.ttf", px(50))
         except:
             font = ImageFont.load_default()
 
@@ -88,20 +98,22 @@ def add_branding(background):
     text_height = text_bbox[3] - text_bbox[1]
 
     # Position in top right with padding
-    padding = 40
-    total_width = logo_size + 15 + text_width
+    padding = px(40)
+    gap = px(15)
+    total_width = logo_size + gap + text_width
 
     # Calculate positions (top right corner)
-    logo_x = 1920 - padding - total_width
+    logo_x = width - padding - total_width
     logo_y = padding
-    text_x = logo_x + logo_size + 15
+    text_x = logo_x + logo_size + gap
     text_y = logo_y + (logo_size // 2) - (text_height // 2)
 
+    steps.next("frosted glass")
     # Create frosted glass effect behind logo and text
     background = background.convert("RGBA")
 
     # Larger padding for frosted glass area
-    bg_padding = 30
+    bg_padding = px(30)
     bg_left = int(logo_x - bg_padding)
     bg_top = int(logo_y - bg_padding)
     bg_right = int(logo_x + total_width + bg_padding)
@@ -111,7 +123,7 @@ def add_branding(background):
     frost_region = background.crop((bg_left, bg_top, bg_right, bg_bottom))
 
     # Apply strong Gaussian blur for frosted effect
-    frost_region = frost_region.filter(ImageFilter.GaussianBlur(radius=15))
+    frost_region = frost_region.filter(ImageFilter.GaussianBlur(radius=px(15)))
 
     # Create semi-transparent white overlay for the frost
     frost_overlay = Image.new('RGBA', frost_region.size, (255, 255, 255, 180))
@@ -122,14 +134,15 @@ def add_branding(background):
     # Paste frosted region back
     background.paste(frost_region, (bg_left, bg_top))
 
+    steps.next("border and composite")
     # Add subtle border/glow around the frosted area
     overlay = Image.new('RGBA', background.size, (0, 0, 0, 0))
     overlay_draw = ImageDraw.Draw(overlay)
     overlay_draw.rounded_rectangle(
         [bg_left, bg_top, bg_right, bg_bottom],
-        radius=20,
+        radius=px(20),
         outline=(255, 255, 255, 100),
-        width=2
+        width=px(2)
     )
     background = Image.alpha_composite(background, overlay)
 
@@ -142,28 +155,64 @@ def add_branding(background):
 
     # Convert back to RGB for saving as PNG
     background = background.convert("RGB")
+    steps.end()
     return background
 
+
+def positive_float(value):
+    """argparse type for a float greater than zero."""
+    number = float(value)
+    if not number > 0:  # also rejects nan
+        raise argparse.ArgumentTypeError(f"must be greater than 0, got {value}")
+    return number
+
+
 def main():
+    """Main execution."""
+    parser = argparse.ArgumentParser(description="Generate Branded Zoom Background.")
+    parser.add_argument("--background", help="brand an existing image instead of generating one")
+    parser.add_argument("--preview", action="store_true",
+                        help=f"quick draft at {PREVIEW_SCALE:.0%} scale, saved as *_preview.png (output folder only)")
+    parser.add_argument("--scale", type=positive_float, default=None, help="render scale (default: 1.0, or the preview scale)")
+    parser.add_argument("--encoding", choices=list(ENCODING_PROFILES), default=None,
+                        help="image_encoding profile (default: final, or draft for previews)")
+    args = parser.parse_args()
+    scale = args.scale if args.scale is not None else (PREVIEW_SCALE if args.preview else 1.0)
+    encoding = args.encoding or ('final' if scale == 1.0 else 'draft')
+
     print("=" * 60)
-    print("Generating Branded Zoom Background")
+    print("Generating Branded Zoom Background" + (f" (PREVIEW {scale:.0%})" if scale != 1.0 else ""))
     print("=" * 60)
 
+    # Ensure output directory exists
+    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+
     # Generate background
-    background = generate_background()
+    with stage("zoom: generate background"):
+        background = Image.open(args.background) if args.background else generate_background()
 
     # Add branding
-    final_image = add_branding(background)
+    final_image = add_branding(background, scale=scale)
 
     # Save to zoom-backgrounds folder
-    output_path = OUTPUT_DIR / "05_ai_tech_branded.png"
-    final_image.save(output_path, "PNG", quality=95)
-    print(f"Saved: {output_path}")
-
-    # Also save to Downloads
-    downloads_path = DOWNLOADS_DIR / "05_ai_tech_branded.png"
-    final_image.save(downloads_path, "PNG", quality=95)
-    print(f"Saved: {downloads_path}")
+    output_path = OUTPUT_DIR / ("05_ai_tech_branded.png" if scale == 1.0 else "05_ai_tech_branded_preview.png")
+    with stage("zoom: encode"):
+        encoded = save_image(final_image, output_path, encoding)
+    output_path = encoded['path']
+    print(f"Saved: {output_path} ({describe(encoded)})")
+    if encoding == 'final':
+        # Smallest lossless PNG of the same pixels, replacing the file once done
+        save_image(final_image, output_path, 'archival', background=True)
+
+    # Also save to Downloads (final renders only)
+    if scale == 1.0:
+        downloads_path = DOWNLOADS_DIR / "05_ai_tech_branded.png"
+        downloads_path = save_image(final_image, downloads_path, encoding)['path']
+        print(f"Saved: {downloads_path}")
+
+    with stage("zoom: archival encode"):
+        for report in wait_background():
+            print(f"Archived: {describe(report)}")
 
     print("\n" + "=" * 60)
     print("Done!")
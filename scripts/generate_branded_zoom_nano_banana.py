@@ -2,36 +2,48 @@
 """Generate a branded Zoom background using Nano Banana (Gemini 2.5 Flash Image) via OpenRouter."""
 
 import os
+import argparse
 import sys
-import requests
-import base64
 from pathlib import Path
 from PIL import Image, ImageDraw, ImageFont
 from dotenv import load_dotenv
-import io
+
+from brand import RIGHT_PATH
+from image_encoding import PROFILES as ENCODING_PROFILES, describe, save_image, wait_background
+from hedging import DEFAULT_DEADLINE, hedged_generate
+from image_providers import PROVIDERS, GeminiProvider, ImageRequest
+from stage_timing import stage, stages
 
 # Load environment variables
 load_dotenv()
 
 OPENROUTER_API_KEY = os.getenv('OPENROUTER_API_KEY')
-if not OPENROUTER_API_KEY:
-    print("Error: OPENROUTER_API_KEY not found in .env file")
-    sys.exit(1)
 
 # Paths
 SCRIPT_DIR = Path(__file__).parent
 ASSETS_DIR = SCRIPT_DIR.parent / "assets"
 OUTPUT_DIR = ASSETS_DIR / "zoom-backgrounds"
 LOGO_PATH = ASSETS_DIR / "the-right-path-logo.png"
+BACKGROUND_PATH = OUTPUT_DIR / "05_ai_tech_background_nano_banana.png"
 DOWNLOADS_DIR = Path("C:/Users/MarieLexisDad/Downloads")
 
+# Zoom background size; branding measures are given at this size and scaled
+ZOOM_SIZE = (1920, 1080)
+
+# Render scale of --preview drafts
+PREVIEW_SCALE = 0.5
+
 # Brand colors
-PURPLE = (107, 45, 139)  # #6B2D8B
-CHARCOAL = (44, 44, 44)  # #2C2C2C
+PURPLE = RIGHT_PATH.purple.rgb
+CHARCOAL = RIGHT_PATH.charcoal.rgb
 
 
-def generate_nano_banana_background():
-    """Generate background using Nano Banana (Gemini 2.5 Flash Image) via OpenRouter"""
+def generate_nano_banana_background(deadline=DEFAULT_DEADLINE, hedge_provider=None):
+    """Generate background using Nano Banana (Gemini 2.5 Flash Image) via OpenRouter.
+
+    A slow call is hedged with a second one (on hedge_provider if given) and the
+    whole generation is abandoned after deadline seconds.
+    """
     print("Generating background with Nano Banana (Gemini 2.5 Flash Image)...")
 
     prompt = """Create a professional virtual meeting background with an AI and technology theme.
@@ -53,77 +65,46 @@ Composition:
 Style: Clean, professional, tech-forward. Think Apple keynote or Microsoft Ignite presentation backgrounds.
 NO TEXT, NO LOGOS - just abstract AI/tech design elements."""
 
-    url = "https://openrouter.ai/api/v1/chat/completions"
-
-    headers = {
-        "Authorization": f"Bearer {OPENROUTER_API_KEY}",
-        "Content-Type": "application/json",
-        "HTTP-Referer": "https://therightpathpodcast.com",
-        "X-Title": "The Right Path Podcast Zoom Background Generator"
-    }
-
-    payload = {
-        "model": "google/gemini-2.5-flash-image",
-        "modalities": ["image", "text"],
-        "messages": [{
-            "role": "user",
-            "content": prompt
-        }]
-    }
-
-    try:
-        response = requests.post(url, headers=headers, json=payload, timeout=120)
-        response.raise_for_status()
-
-        result = response.json()
-
-        # Extract images from response
-        images = result['choices'][0]['message'].get('images', [])
-
-        if not images:
-            print("No images returned from API")
-            return None
-
-        img_data = images[0]
-
-        # Handle different response formats
-        if isinstance(img_data, dict):
-            if 'image_url' in img_data:
-                img_url = img_data['image_url'].get('url', '')
-            else:
-                img_url = img_data.get('url', '')
-
-            # Decode base64 image
-            if img_url and img_url.startswith('data:image'):
-                base64_data = img_url.split(',')[1]
-                img_bytes = base64.b64decode(base64_data)
-                return Image.open(io.BytesIO(img_bytes))
-
-        return None
-
-    except Exception as e:
-        print(f"Error: {e}")
+    provider = GeminiProvider(api_key=OPENROUTER_API_KEY, app_url="https://therightpathpodcast.com",
+                              app_title="The Right Path Podcast Zoom Background Generator")
+    result = hedged_generate(ImageRequest(prompt, size=ZOOM_SIZE), provider, BACKGROUND_PATH,
+                             hedge_provider, deadline=deadline)
+    if not result.ok:
+        print(f"Error: {result.error}")
         return None
+    hedged = f", hedged, {result.provider} won" if result.meta['hedged'] else ""
+    print(f"Saved unbranded background: {result.path} ({result.meta['elapsed']:.1f} s{hedged}; "
+          f"re-brand it with --background)")
+    return Image.open(result.path)
 
 
-def add_branding(background):
+def add_branding(background, scale=1.0):
     """Overlay logo and text on the background with white background box."""
     print("Adding logo and text...")
+    steps = stages("zoom")
 
-    # Resize background to exact 1920x1080
-    background = background.resize((1920, 1080), Image.LANCZOS)
+    def px(value):
+        """Full-size measure at this scale."""
+        return max(1, int(value * scale))
 
+    steps.next("resize")
+    # Resize background to exact 1920x1080 (times scale for previews)
+    width, height = round(ZOOM_SIZE[0] * scale), round(ZOOM_SIZE[1] * scale)
+    background = background.resize((width, height), Image.LANCZOS)
+
+    steps.next("logo")
     # Load and resize logo (20% larger: 120 * 1.2 = 144)
     logo = Image.open(LOGO_PATH).convert("RGBA")
-    logo_size = 144
+    logo_size = px(144)
     logo = logo.resize((logo_size, logo_size), Image.LANCZOS)
 
+    steps.next("text layout")
     # Try to use a nice font
     try:
-        font = ImageFont.truetype("C:/Windows/Fonts/georgia.ttf", 50)
+        font = ImageFont.truetype("C:/Windows/Fonts/georgia.ttf", px(50))
     except:
         try:
-            font = ImageFont.truetype("C:/Windows/Fonts/times.ttf", 50)
+            font = ImageFont.truetype("C:/Windows/Fonts/times.ttf", px(50))
         except:
             font = ImageFont.load_default()
 
@@ -135,20 +116,22 @@ def add_branding(background):
     text_height = text_bbox[3] - text_bbox[1]
 
     # Position in top right with padding
-    padding = 40
-    total_width = logo_size + 15 + text_width
+    padding = px(40)
+    gap = px(15)
+    total_width = logo_size + gap + text_width
 
     # Calculate positions (top right corner)
-    logo_x = 1920 - padding - total_width
+    logo_x = width - padding - total_width
     logo_y = padding
-    text_x = logo_x + logo_size + 15
+    text_x = logo_x + logo_size + gap
     text_y = logo_y + (logo_size // 2) - (text_height // 2)
 
+    steps.next("logo box")
     # Draw white rounded rectangle background behind logo and text
     background = background.convert("RGBA")
 
     # Create white background rectangle with padding
-    bg_padding = 20
+    bg_padding = px(20)
     bg_left = logo_x - bg_padding
     bg_top = logo_y - bg_padding
     bg_right = logo_x + total_width + bg_padding
@@ -159,11 +142,12 @@ def add_branding(background):
     overlay_draw = ImageDraw.Draw(overlay)
     overlay_draw.rounded_rectangle(
         [bg_left, bg_top, bg_right, bg_bottom],
-        radius=15,
+        radius=px(15),
         fill=(255, 255, 255, 245)  # White, nearly opaque
     )
     background = Image.alpha_composite(background, overlay)
 
+    steps.next("composite")
     # Paste logo onto background
     background.paste(logo, (logo_x, logo_y), logo)
 
@@ -173,36 +157,78 @@ def add_branding(background):
 
     # Convert back to RGB for saving as PNG
     background = background.convert("RGB")
+    steps.end()
     return background
 
 
+def positive_float(value):
+    """argparse type for a float greater than zero."""
+    number = float(value)
+    if not number > 0:  # also rejects nan
+        raise argparse.ArgumentTypeError(f"must be greater than 0, got {value}")
+    return number
+
+
 def main():
+    """Main execution."""
+    parser = argparse.ArgumentParser(description="Generate Branded Zoom Background with Nano Banana.")
+    parser.add_argument("--background", help="brand an existing image instead of generating one")
+    parser.add_argument("--preview", action="store_true",
+                        help=f"quick draft at {PREVIEW_SCALE:.0%} scale, saved as *_preview.png (output folder only)")
+    parser.add_argument("--scale", type=positive_float, default=None, help="render scale (default: 1.0, or the preview scale)")
+    parser.add_argument("--encoding", choices=list(ENCODING_PROFILES), default=None,
+                        help="image_encoding profile (default: final, or draft for previews)")
+    parser.add_argument("--deadline", type=float, default=DEFAULT_DEADLINE,
+                        help=f"seconds to allow for generation, hedged calls included (default: {DEFAULT_DEADLINE})")
+    parser.add_argument("--hedge-provider", choices=list(PROVIDERS), default=None,
+                        help="provider for the hedged call when Nano Banana is slow (default: Nano Banana again)")
+    args = parser.parse_args()
+    scale = args.scale if args.scale is not None else (PREVIEW_SCALE if args.preview else 1.0)
+    encoding = args.encoding or ('final' if scale == 1.0 else 'draft')
+
     print("=" * 60)
-    print("Generating Branded Zoom Background with Nano Banana")
+    print("Generating Branded Zoom Background with Nano Banana" + (f" (PREVIEW {scale:.0%})" if scale != 1.0 else ""))
     print("=" * 60)
 
+    if not args.background and not OPENROUTER_API_KEY:
+        print("Error: OPENROUTER_API_KEY not found in .env file")
+        sys.exit(1)
+
     # Ensure output directory exists
     OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 
     # Generate background
-    background = generate_nano_banana_background()
+    with stage("zoom: generate background"):
+        hedge_provider = PROVIDERS[args.hedge_provider]() if args.hedge_provider else None
+        background = (Image.open(args.background) if args.background
+                      else generate_nano_banana_background(args.deadline, hedge_provider))
 
     if background is None:
         print("Failed to generate background image")
         return None
 
     # Add branding
-    final_image = add_branding(background)
+    final_image = add_branding(background, scale=scale)
 
     # Save to zoom-backgrounds folder
-    output_path = OUTPUT_DIR / "05_ai_tech_branded_nano_banana.png"
-    final_image.save(output_path, "PNG", quality=95)
-    print(f"Saved: {output_path}")
-
-    # Also save to Downloads
-    downloads_path = DOWNLOADS_DIR / "05_ai_tech_branded_nano_banana.png"
-    final_image.save(downloads_path, "PNG", quality=95)
-    print(f"Saved: {downloads_path}")
+    output_path = OUTPUT_DIR / ("05_ai_tech_branded_nano_banana.png" if scale == 1.0 else "05_ai_tech_branded_nano_banana_preview.png")
+    with stage("zoom: encode"):
+        encoded = save_image(final_image, output_path, encoding)
+    output_path = encoded['path']
+    print(f"Saved: {output_path} ({describe(encoded)})")
+    if encoding == 'final':
+        # Smallest lossless PNG of the same pixels, replacing the file once done
+        save_image(final_image, output_path, 'archival', background=True)
+
+    # Also save to Downloads (final renders only)
+    if scale == 1.0:
+        downloads_path = DOWNLOADS_DIR / "05_ai_tech_branded_nano_banana.png"
+        downloads_path = save_image(final_image, downloads_path, encoding)['path']
+        print(f"Saved: {downloads_path}")
+
+    with stage("zoom: archival encode"):
+        for report in wait_background():
+            print(f"Archived: {describe(report)}")
 
     print("\n" + "=" * 60)
     print("Done!")
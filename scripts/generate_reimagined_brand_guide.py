@@ -8,17 +8,12 @@ Usage:
 
 import os
 import sys
-import time
-import requests
 from pathlib import Path
 from io import BytesIO
 
-# PDF processing
-import fitz  # PyMuPDF
-
 # Word document generation
 from docx import Document
-from docx.shared import Inches, Pt, RGBColor, Cm, Emu
+from docx.shared import Inches, Pt, Cm, Emu
 from docx.enum.text import WD_ALIGN_PARAGRAPH, WD_LINE_SPACING
 from docx.enum.table import WD_TABLE_ALIGNMENT
 from docx.enum.style import WD_STYLE_TYPE
@@ -28,6 +23,9 @@ from docx.oxml import parse_xml
 
 from PIL import Image
 
+from brand import DOCUMENT_FONTS, REIMAGINED, SIZES, SPACING
+from stage_timing import stage, stages
+
 # =============================================================================
 # CONFIGURATION
 # =============================================================================
@@ -41,15 +39,10 @@ EXTRACTED_IMAGES_DIR = BASE_DIR / "assets" / "branding-guide" / "extracted_image
 LOGOS_DIR = BASE_DIR / "assets" / "branding-guide" / "generated_logos"
 
 # Brand Colors
-COLORS = {
-    'navy': RGBColor(11, 29, 58),        # #0B1D3A
-    'gold': RGBColor(255, 211, 58),      # #FFD33A
-    'electric_blue': RGBColor(0, 217, 255),  # #00D9FF
-    'purple': RGBColor(123, 47, 255),    # #7B2FFF
-    'coral': RGBColor(255, 107, 107),    # #FF6B6B
-    'white': RGBColor(255, 255, 255),
-    'charcoal': RGBColor(51, 51, 51),    # #333333
-}
+COLORS = {name: color.docx for name, color in REIMAGINED.items()}
+
+# Document fonts
+FONTS = DOCUMENT_FONTS['reimagined']
 
 # =============================================================================
 # IMAGE EXTRACTION
@@ -57,6 +50,8 @@ COLORS = {
 
 def extract_images_from_pdf(pdf_path: Path, output_dir: Path) -> dict:
     """Extract images from PDF, skipping page 6 (Leadership Team)."""
+    import fitz  # PyMuPDF
+
     output_dir.mkdir(parents=True, exist_ok=True)
     images = {}
 
@@ -104,103 +99,48 @@ def extract_images_from_pdf(pdf_path: Path, output_dir: Path) -> dict:
 # LOGO GENERATION (Freepik API)
 # =============================================================================
 
-def generate_logo_freepik(output_path: Path) -> str:
-    """Generate tech-forward ReimagineED logo via Freepik Mystic API."""
+LOGO_PROMPT = """
+Modern tech-forward wordmark logo design for "ReimagineED" education technology brand.
+Clean minimalist typography with the word "REIMAGINE" in bold navy blue (#0B1D3A) geometric sans-serif font,
+followed by "ED" in bright gold (#FFD33A) with a subtle digital glow effect.
+Professional brand identity style, white background, suitable for corporate presentations.
+No icons or symbols, pure typography wordmark. High resolution, clean vector-style edges.
+Modern tech company aesthetic like Slack or Notion branding.
+""".strip()
+
+
+def generate_logo_freepik(output_path: Path, variants: int = 1) -> str:
+    """Generate tech-forward ReimagineED logo via Freepik Mystic API.
+
+    variants > 1 generates that many concepts at once (saved as <name>_2.png,
+    ...); the path of the first is returned. Interrupted runs resume the
+    tasks recorded in freepik_jobs.TASKS_PATH.
+    """
     api_key = os.getenv("FREEPIK_API_KEY")
 
     if not api_key:
         print("Warning: FREEPIK_API_KEY not set. Using placeholder for logo.")
         return None
 
-    output_path.parent.mkdir(parents=True, exist_ok=True)
+    from freepik_jobs import FreepikJobs
 
-    prompt = """
-    Modern tech-forward wordmark logo design for "ReimagineED" education technology brand.
-    Clean minimalist typography with the word "REIMAGINE" in bold navy blue (#0B1D3A) geometric sans-serif font,
-    followed by "ED" in bright gold (#FFD33A) with a subtle digital glow effect.
-    Professional brand identity style, white background, suitable for corporate presentations.
-    No icons or symbols, pure typography wordmark. High resolution, clean vector-style edges.
-    Modern tech company aesthetic like Slack or Notion branding.
-    """
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    outputs = [output_path] + [output_path.with_name(f"{output_path.stem}_{i}{output_path.suffix}")
+                               for i in range(2, variants + 1)]
 
-    print("Generating logo via Freepik Mystic API...")
+    print(f"Generating {len(outputs)} logo(s) via Freepik Mystic API...")
 
     try:
-        # Create generation task
-        response = requests.post(
-            "https://api.freepik.com/v1/ai/mystic",
-            headers={
-                "x-freepik-api-key": api_key,
-                "Content-Type": "application/json"
-            },
-            json={
-                "prompt": prompt.strip(),
-                "resolution": "2k",
-                "aspect_ratio": "widescreen_16_9",
-                "styling": {
-                    "style": "photo"
-                }
-            },
-            timeout=30
-        )
-
-        if response.status_code != 200:
-            print(f"API Error: {response.status_code} - {response.text}")
-            return None
-
-        result = response.json()
-
-        # Check if we got immediate results or need to poll
-        if "data" in result and result["data"]:
-            # Direct result
-            image_url = result["data"][0].get("base64") or result["data"][0].get("url")
-            if image_url:
-                if image_url.startswith("data:"):
-                    # Base64 encoded
-                    import base64
-                    image_data = base64.b64decode(image_url.split(",")[1])
-                else:
-                    # URL
-                    img_response = requests.get(image_url, timeout=30)
-                    image_data = img_response.content
-
-                with open(output_path, "wb") as f:
-                    f.write(image_data)
-                print(f"Logo saved to: {output_path}")
-                return str(output_path)
-
-        # Need to poll for result
-        task_id = result.get("task_id")
-        if task_id:
-            print(f"Task created: {task_id}. Polling for completion...")
-
-            for _ in range(30):  # Max 60 seconds
-                time.sleep(2)
-                status_response = requests.get(
-                    f"https://api.freepik.com/v1/ai/mystic/{task_id}",
-                    headers={"x-freepik-api-key": api_key},
-                    timeout=30
-                )
-                status = status_response.json()
-
-                if status.get("status") == "COMPLETED":
-                    image_url = status.get("generated", [None])[0]
-                    if image_url:
-                        img_response = requests.get(image_url, timeout=30)
-                        with open(output_path, "wb") as f:
-                            f.write(img_response.content)
-                        print(f"Logo saved to: {output_path}")
-                        return str(output_path)
-                elif status.get("status") == "FAILED":
-                    print(f"Logo generation failed: {status}")
-                    return None
-
-                print(f"  Status: {status.get('status', 'unknown')}")
-
+        results = FreepikJobs(api_key).generate([(LOGO_PROMPT, path) for path in outputs], timeout=120)
     except Exception as e:
         print(f"Logo generation error: {e}")
+        return None
 
-    return None
+    if not results.get(str(output_path)):
+        return None
+    print(f"Logo saved to: {output_path}")
+    return str(output_path)
 
 
 # =============================================================================
@@ -356,46 +296,46 @@ class ReimagineEDBrandGuide:
             cover_title = styles.add_style('CoverTitle', WD_STYLE_TYPE.PARAGRAPH)
         except ValueError:
             cover_title = styles['CoverTitle']
-        cover_title.font.name = 'Arial'
-        cover_title.font.size = Pt(48)
+        cover_title.font.name = FONTS['heading']
+        cover_title.font.size = Pt(SIZES['cover_title'])
         cover_title.font.bold = True
         cover_title.font.color.rgb = COLORS['navy']
         cover_title.paragraph_format.alignment = WD_ALIGN_PARAGRAPH.CENTER
-        cover_title.paragraph_format.space_after = Pt(6)
+        cover_title.paragraph_format.space_after = Pt(SPACING['title'])
 
         # Section Header
         try:
             section_header = styles.add_style('SectionHeader', WD_STYLE_TYPE.PARAGRAPH)
         except ValueError:
             section_header = styles['SectionHeader']
-        section_header.font.name = 'Arial'
-        section_header.font.size = Pt(28)
+        section_header.font.name = FONTS['heading']
+        section_header.font.size = Pt(SIZES['section'])
         section_header.font.bold = True
         section_header.font.color.rgb = COLORS['navy']
-        section_header.paragraph_format.space_before = Pt(0)
-        section_header.paragraph_format.space_after = Pt(18)
+        section_header.paragraph_format.space_before = Pt(SPACING['none'])
+        section_header.paragraph_format.space_after = Pt(SPACING['lg'])
 
         # Subheader
         try:
             subheader = styles.add_style('Subheader', WD_STYLE_TYPE.PARAGRAPH)
         except ValueError:
             subheader = styles['Subheader']
-        subheader.font.name = 'Arial'
-        subheader.font.size = Pt(16)
+        subheader.font.name = FONTS['heading']
+        subheader.font.size = Pt(SIZES['subheader'])
         subheader.font.bold = True
         subheader.font.color.rgb = COLORS['electric_blue']
-        subheader.paragraph_format.space_before = Pt(18)
-        subheader.paragraph_format.space_after = Pt(8)
+        subheader.paragraph_format.space_before = Pt(SPACING['lg'])
+        subheader.paragraph_format.space_after = Pt(SPACING['sm'])
 
         # Body Text
         try:
             body = styles.add_style('BrandBody', WD_STYLE_TYPE.PARAGRAPH)
         except ValueError:
             body = styles['BrandBody']
-        body.font.name = 'Arial'
-        body.font.size = Pt(11)
+        body.font.name = FONTS['body']
+        body.font.size = Pt(SIZES['body'])
         body.font.color.rgb = COLORS['charcoal']
-        body.paragraph_format.space_after = Pt(10)
+        body.paragraph_format.space_after = Pt(SPACING['paragraph'])
         body.paragraph_format.line_spacing = 1.4
 
         # Pillar Title
@@ -403,12 +343,12 @@ class ReimagineEDBrandGuide:
             pillar = styles.add_style('PillarTitle', WD_STYLE_TYPE.PARAGRAPH)
         except ValueError:
             pillar = styles['PillarTitle']
-        pillar.font.name = 'Arial'
-        pillar.font.size = Pt(12)
+        pillar.font.name = FONTS['heading']
+        pillar.font.size = Pt(SIZES['item'])
         pillar.font.bold = True
         pillar.font.color.rgb = COLORS['navy']
-        pillar.paragraph_format.space_before = Pt(12)
-        pillar.paragraph_format.space_after = Pt(4)
+        pillar.paragraph_format.space_before = Pt(SPACING['md'])
+        pillar.paragraph_format.space_after = Pt(SPACING['xs'])
 
     def _add_page_header(self, text: str):
         """Add section header."""
@@ -452,7 +392,7 @@ class ReimagineEDBrandGuide:
                     cap_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
                     run = cap_para.add_run(caption)
                     run.font.italic = True
-                    run.font.size = Pt(9)
+                    run.font.size = Pt(SIZES['caption'])
                     run.font.color.rgb = COLORS['charcoal']
                 return True
             except Exception as e:
@@ -475,15 +415,15 @@ class ReimagineEDBrandGuide:
 
         # "REIMAGINE" in navy
         run1 = title.add_run("REIMAGINE")
-        run1.font.name = 'Arial'
-        run1.font.size = Pt(52)
+        run1.font.name = FONTS['heading']
+        run1.font.size = Pt(SIZES['cover_wordmark'])
         run1.font.bold = True
         run1.font.color.rgb = COLORS['navy']
 
         # "ED" in gold
         run2 = title.add_run("ED")
-        run2.font.name = 'Arial'
-        run2.font.size = Pt(52)
+        run2.font.name = FONTS['heading']
+        run2.font.size = Pt(SIZES['cover_wordmark'])
         run2.font.bold = True
         run2.font.color.rgb = COLORS['gold']
 
@@ -491,8 +431,8 @@ class ReimagineEDBrandGuide:
         tagline = self.doc.add_paragraph()
         tagline.alignment = WD_ALIGN_PARAGRAPH.CENTER
         run = tagline.add_run("The Disruptor in AI Education")
-        run.font.name = 'Arial'
-        run.font.size = Pt(18)
+        run.font.name = FONTS['heading']
+        run.font.size = Pt(SIZES['tagline'])
         run.font.color.rgb = COLORS['electric_blue']
 
         self.doc.add_paragraph()
@@ -506,8 +446,8 @@ class ReimagineEDBrandGuide:
         subtitle = self.doc.add_paragraph()
         subtitle.alignment = WD_ALIGN_PARAGRAPH.CENTER
         run = subtitle.add_run("Brand Style Guide")
-        run.font.name = 'Arial'
-        run.font.size = Pt(16)
+        run.font.name = FONTS['heading']
+        run.font.size = Pt(SIZES['subheader'])
         run.font.bold = True
         run.font.color.rgb = COLORS['navy']
 
@@ -519,15 +459,15 @@ class ReimagineEDBrandGuide:
         footer = self.doc.add_paragraph()
         footer.alignment = WD_ALIGN_PARAGRAPH.CENTER
         run = footer.add_run("The Right Path Educational Consulting Inc.")
-        run.font.name = 'Arial'
-        run.font.size = Pt(11)
+        run.font.name = FONTS['body']
+        run.font.size = Pt(SIZES['body'])
         run.font.color.rgb = COLORS['charcoal']
 
         version = self.doc.add_paragraph()
         version.alignment = WD_ALIGN_PARAGRAPH.CENTER
         run = version.add_run("Version 2.0 | 2025")
-        run.font.name = 'Arial'
-        run.font.size = Pt(10)
+        run.font.name = FONTS['body']
+        run.font.size = Pt(SIZES['small'])
         run.font.color.rgb = COLORS['charcoal']
 
         self.doc.add_page_break()
@@ -563,11 +503,11 @@ class ReimagineEDBrandGuide:
             title_cell = row.cells[0]
             title_cell.width = Inches(5.0)
             p = title_cell.paragraphs[0]
-            p.paragraph_format.space_before = Pt(8)
-            p.paragraph_format.space_after = Pt(8)
+            p.paragraph_format.space_before = Pt(SPACING['sm'])
+            p.paragraph_format.space_after = Pt(SPACING['sm'])
             run = p.add_run(title)
-            run.font.name = 'Arial'
-            run.font.size = Pt(12)
+            run.font.name = FONTS['heading']
+            run.font.size = Pt(SIZES['item'])
             run.font.color.rgb = COLORS['navy']
 
             # Page number cell
@@ -575,11 +515,11 @@ class ReimagineEDBrandGuide:
             page_cell.width = Inches(1.5)
             p = page_cell.paragraphs[0]
             p.alignment = WD_ALIGN_PARAGRAPH.RIGHT
-            p.paragraph_format.space_before = Pt(8)
-            p.paragraph_format.space_after = Pt(8)
+            p.paragraph_format.space_before = Pt(SPACING['sm'])
+            p.paragraph_format.space_after = Pt(SPACING['sm'])
             run = p.add_run(f"Page {page}")
-            run.font.name = 'Arial'
-            run.font.size = Pt(11)
+            run.font.name = FONTS['body']
+            run.font.size = Pt(SIZES['body'])
             run.font.color.rgb = COLORS['charcoal']
 
         self.doc.add_page_break()
@@ -868,7 +808,7 @@ Below these sizes, legibility is compromised. For smaller applications, use the
         example_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
         run = example_para.add_run(content['example'])
         run.font.italic = True
-        run.font.size = Pt(14)
+        run.font.size = Pt(SIZES['quote'])
         run.font.color.rgb = COLORS['navy']
 
         self.doc.add_page_break()
@@ -1044,7 +984,7 @@ Transforming education through AI leadership""")
         footer = self.doc.add_paragraph()
         footer.alignment = WD_ALIGN_PARAGRAPH.CENTER
         run = footer.add_run("© 2025 The Right Path Educational Consulting Inc. All rights reserved.")
-        run.font.size = Pt(9)
+        run.font.size = Pt(SIZES['caption'])
         run.font.color.rgb = COLORS['charcoal']
 
     # =========================================================================
@@ -1057,75 +997,93 @@ Transforming education through AI leadership""")
         self.logo_path = logo_path
 
         print("Building document pages...")
+        steps = stages("guide")
 
         # Page 1: Cover
         print("  Page 1: Cover")
+        steps.next("Cover")
         self.create_cover_page()
 
         # Page 2: Table of Contents
         print("  Page 2: Table of Contents")
+        steps.next("Table of Contents")
         self.create_toc_page()
 
         # Page 3: Vision Statement
         print("  Page 3: Vision Statement")
+        steps.next("Vision Statement")
         self.create_vision_page()
 
         # Page 4: Mission Statement
         print("  Page 4: Mission Statement")
+        steps.next("Mission Statement")
         self.create_mission_page()
 
         # Page 5: Brand Evolution
         print("  Page 5: Brand Evolution")
+        steps.next("Brand Evolution")
         self.create_brand_evolution_page()
 
         # Page 6: Thought Leadership
         print("  Page 6: Thought Leadership")
+        steps.next("Thought Leadership")
         self.create_thought_leadership_page()
 
         # Page 7: Logo System
         print("  Page 7: Logo System")
+        steps.next("Logo System")
         self.create_logo_page()
 
         # Page 8: Color Palette
         print("  Page 8: Color Palette")
+        steps.next("Color Palette")
         self.create_color_palette_page()
 
         # Page 9: Typography
         print("  Page 9: Typography System")
+        steps.next("Typography System")
         self.create_typography_page()
 
         # Page 10: Imagery Guidelines
         print("  Page 10: Imagery Guidelines")
+        steps.next("Imagery Guidelines")
         self.create_imagery_page()
 
         # Page 11: Voice & Tone
         print("  Page 11: Voice & Tone")
+        steps.next("Voice & Tone")
         self.create_voice_tone_page()
 
         # Page 12: Visual Language
         print("  Page 12: Visual Language")
+        steps.next("Visual Language")
         self.create_visual_language_page()
 
         # Page 13: Brand Applications
         print("  Page 13: Brand Applications")
+        steps.next("Brand Applications")
         self.create_brand_applications_page()
 
         # Page 14: Do's & Don'ts
         print("  Page 14: Do's & Don'ts")
+        steps.next("Do's & Don'ts")
         self.create_dos_donts_page()
 
         # Page 15: Social Media
         print("  Page 15: Social Media Guidelines")
+        steps.next("Social Media Guidelines")
         self.create_social_media_page()
 
         # Resources page removed per user request
 
+        steps.end()
         print("Document build complete.")
 
     def save(self, output_path: Path):
         """Save the document."""
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        self.doc.save(str(output_path))
+        with stage("guide: save"):
+            self.doc.save(str(output_path))
         print(f"Document saved: {output_path}")
         return output_path
 
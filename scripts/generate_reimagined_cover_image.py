@@ -2,27 +2,24 @@
 Generate ReimagineED Cover Hero Image using Nano Banana (Gemini 2.5 Flash Image)
 """
 import os
-import base64
-import requests
 from pathlib import Path
 from dotenv import load_dotenv
 
+from hedging import DEFAULT_DEADLINE, hedged_generate
+from image_providers import GeminiProvider, ImageRequest
+
 # Load environment variables
 load_dotenv(Path(__file__).parent.parent.parent / '.env', override=True)
 
 OPENROUTER_API_KEY = os.getenv('OPENROUTER_API_KEY')
 
-def generate_reimagined_cover_image():
-    """Generate hero image for ReimagineED branding guide cover"""
+OUTPUT_DIR = Path(__file__).parent.parent / "assets" / "branding-guide"
 
-    url = "https://openrouter.ai/api/v1/chat/completions"
+def generate_reimagined_cover_image(deadline=DEFAULT_DEADLINE):
+    """Generate hero image for ReimagineED branding guide cover (slow calls are hedged)"""
 
-    headers = {
-        "Authorization": f"Bearer {OPENROUTER_API_KEY}",
-        "Content-Type": "application/json",
-        "HTTP-Referer": "https://alexandriasdesign.com",
-        "X-Title": "ReimagineED Branding Guide"
-    }
+    provider = GeminiProvider(api_key=OPENROUTER_API_KEY, app_url="https://alexandriasdesign.com",
+                              app_title="ReimagineED Branding Guide")
 
     # Hero image prompt for cover page
     prompt = """Create a stunning, professional hero image for a cutting-edge AI education podcast brand called 'ReimagineED'.
@@ -52,79 +49,29 @@ TECHNICAL:
 - Professional color grading
 - Suitable for large-format printing and digital use"""
 
-    payload = {
-        "model": "google/gemini-2.5-flash-image",
-        "messages": [
-            {
-                "role": "user",
-                "content": prompt
-            }
-        ],
-        "modalities": ["image", "text"]  # CRITICAL for image generation
-    }
-
     print("Generating ReimagineED cover hero image...")
-    print(f"Using model: google/gemini-2.5-flash-image")
-
-    try:
-        response = requests.post(url, headers=headers, json=payload, timeout=120)
-        response.raise_for_status()
-
-        result = response.json()
-
-        # Extract images from nested structure
-        images = result['choices'][0]['message'].get('images', [])
-
-        if not images:
-            print("No images generated")
-            return None
-
-        # Create output directory
-        output_dir = Path(__file__).parent.parent / "assets" / "branding-guide"
-        output_dir.mkdir(parents=True, exist_ok=True)
-
-        # Save each generated image
-        saved_files = []
-        for i, img_data in enumerate(images):
-            # Handle nested dictionary structure
-            if isinstance(img_data, dict):
-                if 'image_url' in img_data:
-                    img_url = img_data['image_url'].get('url', '')
-                else:
-                    img_url = img_data.get('url', '')
+    print(f"Using model: {provider.model} (deadline {deadline:.0f} s)")
 
-                if img_url and img_url.startswith('data:image'):
-                    # Extract base64 data
-                    base64_data = img_url.split(',')[1]
-
-                    # Decode and save
-                    img_bytes = base64.b64decode(base64_data)
-
-                    output_path = output_dir / f"cover_hero_image_{i+1}.png"
-
-                    with open(output_path, 'wb') as f:
-                        f.write(img_bytes)
-
-                    saved_files.append(output_path)
-                    print(f"Saved: {output_path} ({len(img_bytes):,} bytes)")
+    result = hedged_generate(ImageRequest(prompt, size=(1024, 1024)), provider,
+                             OUTPUT_DIR / "cover_hero_image_1.png", deadline=deadline)
+    if not result.ok:
+        print(f"Request failed: {result.error}")
+        return None
 
-        # Print usage stats
-        usage = result.get('usage', {})
-        print(f"\nToken Usage:")
-        print(f"   Total: {usage.get('total_tokens', 0):,}")
-        print(f"   Prompt: {usage.get('prompt_tokens', 0):,}")
-        print(f"   Completion: {usage.get('completion_tokens', 0):,}")
+    output_path = Path(result.path)
+    print(f"Saved: {output_path} ({output_path.stat().st_size:,} bytes)"
+          + (" [hedged]" if result.meta['hedged'] else ""))
 
-        return saved_files
+    # Print usage stats
+    usage = result.meta.get('usage', {})
+    print(f"\nToken Usage:")
+    print(f"   Total: {usage.get('total_tokens', 0):,}")
+    print(f"   Prompt: {usage.get('prompt_tokens', 0):,}")
+    print(f"   Completion: {usage.get('completion_tokens', 0):,}")
+    if usage.get('cost') is not None:
+        print(f"   Cost: ${usage['cost']:.4f}")
 
-    except requests.exceptions.RequestException as e:
-        print(f"Request failed: {e}")
-        if hasattr(e, 'response') and e.response:
-            print(f"   Response: {e.response.text}")
-        return None
-    except Exception as e:
-        print(f"Error: {e}")
-        return None
+    return [output_path]
 
 if __name__ == "__main__":
     print("=" * 60)
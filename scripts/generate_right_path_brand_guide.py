@@ -9,16 +9,12 @@ Usage:
 import os
 import sys
 import time
-import requests
 from pathlib import Path
 from io import BytesIO
 
-# PDF processing
-import fitz  # PyMuPDF
-
 # Word document generation
 from docx import Document
-from docx.shared import Inches, Pt, RGBColor, Cm, Emu
+from docx.shared import Inches, Pt, Cm, Emu
 from docx.enum.text import WD_ALIGN_PARAGRAPH, WD_LINE_SPACING
 from docx.enum.table import WD_TABLE_ALIGNMENT
 from docx.enum.style import WD_STYLE_TYPE
@@ -28,6 +24,9 @@ from docx.oxml import parse_xml
 
 from PIL import Image
 
+from brand import DOCUMENT_FONTS, RIGHT_PATH, SIZES, SPACING
+from stage_timing import stage, stages
+
 # =============================================================================
 # CONFIGURATION
 # =============================================================================
@@ -41,16 +40,10 @@ EXTRACTED_IMAGES_DIR = BASE_DIR / "assets" / "branding-guide" / "extracted_image
 LOGOS_DIR = BASE_DIR / "assets"
 
 # Brand Colors - NEW: White/Purple palette
-COLORS = {
-    'white': RGBColor(255, 255, 255),           # #FFFFFF - Primary background
-    'purple': RGBColor(107, 45, 139),           # #6B2D8B - Primary accent
-    'light_purple': RGBColor(139, 77, 171),     # #8B4DAB - Secondary accent
-    'dark_purple': RGBColor(74, 29, 97),        # #4A1D61 - Dark accent
-    'charcoal': RGBColor(44, 44, 44),           # #2C2C2C - Body text
-    'gray_600': RGBColor(107, 107, 107),        # #6B6B6B - Secondary text
-    'gray_200': RGBColor(229, 229, 229),        # #E5E5E5 - Borders
-    'off_white': RGBColor(250, 250, 250),       # #FAFAFA - Subtle background
-}
+COLORS = {name: color.docx for name, color in RIGHT_PATH.items()}
+
+# Document fonts
+FONTS = DOCUMENT_FONTS['right_path']
 
 # =============================================================================
 # IMAGE EXTRACTION
@@ -58,6 +51,8 @@ COLORS = {
 
 def extract_images_from_pdf(pdf_path: Path, output_dir: Path) -> dict:
     """Extract images from PDF, skipping page 6 (Leadership Team)."""
+    import fitz  # PyMuPDF
+
     output_dir.mkdir(parents=True, exist_ok=True)
     images = {}
 
@@ -254,46 +249,46 @@ class RightPathBrandGuide:
             cover_title = styles.add_style('CoverTitle', WD_STYLE_TYPE.PARAGRAPH)
         except ValueError:
             cover_title = styles['CoverTitle']
-        cover_title.font.name = 'Georgia'  # Fallback for Crimson Pro
-        cover_title.font.size = Pt(48)
+        cover_title.font.name = FONTS['heading']  # Fallback for Crimson Pro
+        cover_title.font.size = Pt(SIZES['cover_title'])
         cover_title.font.bold = True
         cover_title.font.color.rgb = COLORS['purple']
         cover_title.paragraph_format.alignment = WD_ALIGN_PARAGRAPH.CENTER
-        cover_title.paragraph_format.space_after = Pt(6)
+        cover_title.paragraph_format.space_after = Pt(SPACING['title'])
 
         # Section Header - Purple accent
         try:
             section_header = styles.add_style('SectionHeader', WD_STYLE_TYPE.PARAGRAPH)
         except ValueError:
             section_header = styles['SectionHeader']
-        section_header.font.name = 'Georgia'
-        section_header.font.size = Pt(28)
+        section_header.font.name = FONTS['heading']
+        section_header.font.size = Pt(SIZES['section'])
         section_header.font.bold = True
         section_header.font.color.rgb = COLORS['purple']
-        section_header.paragraph_format.space_before = Pt(0)
-        section_header.paragraph_format.space_after = Pt(18)
+        section_header.paragraph_format.space_before = Pt(SPACING['none'])
+        section_header.paragraph_format.space_after = Pt(SPACING['lg'])
 
         # Subheader - Light purple accent
         try:
             subheader = styles.add_style('Subheader', WD_STYLE_TYPE.PARAGRAPH)
         except ValueError:
             subheader = styles['Subheader']
-        subheader.font.name = 'Georgia'
-        subheader.font.size = Pt(16)
+        subheader.font.name = FONTS['heading']
+        subheader.font.size = Pt(SIZES['subheader'])
         subheader.font.bold = True
         subheader.font.color.rgb = COLORS['purple']
-        subheader.paragraph_format.space_before = Pt(18)
-        subheader.paragraph_format.space_after = Pt(8)
+        subheader.paragraph_format.space_before = Pt(SPACING['lg'])
+        subheader.paragraph_format.space_after = Pt(SPACING['sm'])
 
         # Body Text - DM Sans style (using Calibri as fallback)
         try:
             body = styles.add_style('BrandBody', WD_STYLE_TYPE.PARAGRAPH)
         except ValueError:
             body = styles['BrandBody']
-        body.font.name = 'Calibri'  # Fallback for DM Sans
-        body.font.size = Pt(11)
+        body.font.name = FONTS['body']  # Fallback for DM Sans
+        body.font.size = Pt(SIZES['body'])
         body.font.color.rgb = COLORS['charcoal']
-        body.paragraph_format.space_after = Pt(10)
+        body.paragraph_format.space_after = Pt(SPACING['paragraph'])
         body.paragraph_format.line_spacing = 1.5
 
         # Pillar Title
@@ -301,12 +296,12 @@ class RightPathBrandGuide:
             pillar = styles.add_style('PillarTitle', WD_STYLE_TYPE.PARAGRAPH)
         except ValueError:
             pillar = styles['PillarTitle']
-        pillar.font.name = 'Georgia'
-        pillar.font.size = Pt(12)
+        pillar.font.name = FONTS['heading']
+        pillar.font.size = Pt(SIZES['item'])
         pillar.font.bold = True
         pillar.font.color.rgb = COLORS['purple']
-        pillar.paragraph_format.space_before = Pt(12)
-        pillar.paragraph_format.space_after = Pt(4)
+        pillar.paragraph_format.space_before = Pt(SPACING['md'])
+        pillar.paragraph_format.space_after = Pt(SPACING['xs'])
 
     def _add_page_header(self, text: str):
         """Add section header."""
@@ -350,7 +345,7 @@ class RightPathBrandGuide:
                     cap_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
                     run = cap_para.add_run(caption)
                     run.font.italic = True
-                    run.font.size = Pt(9)
+                    run.font.size = Pt(SIZES['caption'])
                     run.font.color.rgb = COLORS['gray_600']
                 return True
             except Exception as e:
@@ -372,8 +367,8 @@ class RightPathBrandGuide:
         title.alignment = WD_ALIGN_PARAGRAPH.CENTER
 
         run1 = title.add_run("THE RIGHT PATH")
-        run1.font.name = 'Georgia'
-        run1.font.size = Pt(48)
+        run1.font.name = FONTS['heading']
+        run1.font.size = Pt(SIZES['cover_title'])
         run1.font.bold = True
         run1.font.color.rgb = COLORS['purple']
 
@@ -381,8 +376,8 @@ class RightPathBrandGuide:
         podcast_line = self.doc.add_paragraph()
         podcast_line.alignment = WD_ALIGN_PARAGRAPH.CENTER
         run2 = podcast_line.add_run("PODCAST")
-        run2.font.name = 'Georgia'
-        run2.font.size = Pt(36)
+        run2.font.name = FONTS['heading']
+        run2.font.size = Pt(SIZES['cover_subtitle'])
         run2.font.bold = True
         run2.font.color.rgb = COLORS['charcoal']
 
@@ -390,8 +385,8 @@ class RightPathBrandGuide:
         tagline = self.doc.add_paragraph()
         tagline.alignment = WD_ALIGN_PARAGRAPH.CENTER
         run = tagline.add_run("AI in Action. Educate. Employ. Empower.")
-        run.font.name = 'Georgia'
-        run.font.size = Pt(18)
+        run.font.name = FONTS['heading']
+        run.font.size = Pt(SIZES['tagline'])
         run.font.italic = True
         run.font.color.rgb = COLORS['purple']
 
@@ -406,8 +401,8 @@ class RightPathBrandGuide:
         subtitle = self.doc.add_paragraph()
         subtitle.alignment = WD_ALIGN_PARAGRAPH.CENTER
         run = subtitle.add_run("Brand Style Guide")
-        run.font.name = 'Georgia'
-        run.font.size = Pt(16)
+        run.font.name = FONTS['heading']
+        run.font.size = Pt(SIZES['subheader'])
         run.font.bold = True
         run.font.color.rgb = COLORS['charcoal']
 
@@ -419,15 +414,15 @@ class RightPathBrandGuide:
         footer = self.doc.add_paragraph()
         footer.alignment = WD_ALIGN_PARAGRAPH.CENTER
         run = footer.add_run("The Right Path Educational Consulting Inc.")
-        run.font.name = 'Calibri'
-        run.font.size = Pt(11)
+        run.font.name = FONTS['body']
+        run.font.size = Pt(SIZES['body'])
         run.font.color.rgb = COLORS['gray_600']
 
         version = self.doc.add_paragraph()
         version.alignment = WD_ALIGN_PARAGRAPH.CENTER
         run = version.add_run("Version 3.0 | 2025")
-        run.font.name = 'Calibri'
-        run.font.size = Pt(10)
+        run.font.name = FONTS['body']
+        run.font.size = Pt(SIZES['small'])
         run.font.color.rgb = COLORS['gray_600']
 
         self.doc.add_page_break()
@@ -462,11 +457,11 @@ class RightPathBrandGuide:
             title_cell = row.cells[0]
             title_cell.width = Inches(5.0)
             p = title_cell.paragraphs[0]
-            p.paragraph_format.space_before = Pt(8)
-            p.paragraph_format.space_after = Pt(8)
+            p.paragraph_format.space_before = Pt(SPACING['sm'])
+            p.paragraph_format.space_after = Pt(SPACING['sm'])
             run = p.add_run(title)
-            run.font.name = 'Georgia'
-            run.font.size = Pt(12)
+            run.font.name = FONTS['heading']
+            run.font.size = Pt(SIZES['item'])
             run.font.color.rgb = COLORS['charcoal']
 
             # Page number cell
@@ -474,11 +469,11 @@ class RightPathBrandGuide:
             page_cell.width = Inches(1.5)
             p = page_cell.paragraphs[0]
             p.alignment = WD_ALIGN_PARAGRAPH.RIGHT
-            p.paragraph_format.space_before = Pt(8)
-            p.paragraph_format.space_after = Pt(8)
+            p.paragraph_format.space_before = Pt(SPACING['sm'])
+            p.paragraph_format.space_after = Pt(SPACING['sm'])
             run = p.add_run(f"Page {page}")
-            run.font.name = 'Calibri'
-            run.font.size = Pt(11)
+            run.font.name = FONTS['body']
+            run.font.size = Pt(SIZES['body'])
             run.font.color.rgb = COLORS['gray_600']
 
         self.doc.add_page_break()
@@ -756,7 +751,7 @@ Below these sizes, use the full wordmark instead.""")
         example_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
         run = example_para.add_run(content['example'])
         run.font.italic = True
-        run.font.size = Pt(14)
+        run.font.size = Pt(SIZES['quote'])
         run.font.color.rgb = COLORS['purple']
 
         self.doc.add_page_break()
@@ -855,7 +850,7 @@ Below these sizes, use the full wordmark instead.""")
         footer = self.doc.add_paragraph()
         footer.alignment = WD_ALIGN_PARAGRAPH.CENTER
         run = footer.add_run("© 2025 The Right Path Educational Consulting Inc. All rights reserved.")
-        run.font.size = Pt(9)
+        run.font.size = Pt(SIZES['caption'])
         run.font.color.rgb = COLORS['gray_600']
 
     # =========================================================================
@@ -868,69 +863,86 @@ Below these sizes, use the full wordmark instead.""")
         self.logo_path = logo_path
 
         print("Building document pages...")
+        steps = stages("guide")
 
         # Page 1: Cover
         print("  Page 1: Cover")
+        steps.next("Cover")
         self.create_cover_page()
 
         # Page 2: Table of Contents
         print("  Page 2: Table of Contents")
+        steps.next("Table of Contents")
         self.create_toc_page()
 
         # Pages 3-4: Vision Statement
         print("  Pages 3-4: Vision Statement")
+        steps.next("Vision Statement")
         self.create_vision_page()
 
         # Pages 5-6: Mission Statement
         print("  Pages 5-6: Mission Statement")
+        steps.next("Mission Statement")
         self.create_mission_page()
 
         # Pages 7-8: Brand Evolution
         print("  Pages 7-8: Brand Evolution")
+        steps.next("Brand Evolution")
         self.create_brand_evolution_page()
 
         # Pages 9-10: Thought Leadership
         print("  Pages 9-10: Thought Leadership")
+        steps.next("Thought Leadership")
         self.create_thought_leadership_page()
 
         # Pages 11-12: Logo System
         print("  Pages 11-12: Logo System")
+        steps.next("Logo System")
         self.create_logo_page()
 
         # Pages 13-14: Color Palette
         print("  Pages 13-14: Color Palette")
+        steps.next("Color Palette")
         self.create_color_palette_page()
 
         # Pages 15-16: Typography
         print("  Pages 15-16: Typography System")
+        steps.next("Typography System")
         self.create_typography_page()
 
         # Pages 17-18: Imagery Guidelines
         print("  Pages 17-18: Imagery Guidelines")
+        steps.next("Imagery Guidelines")
         self.create_imagery_page()
 
         # Page 19: Voice & Tone
         print("  Page 19: Voice & Tone")
+        steps.next("Voice & Tone")
         self.create_voice_tone_page()
 
         # Page 20: Visual Language
         print("  Page 20: Visual Language")
+        steps.next("Visual Language")
         self.create_visual_language_page()
 
         # Page 21: Brand Applications
         print("  Page 21: Brand Applications")
+        steps.next("Brand Applications")
         self.create_brand_applications_page()
 
         # Page 22: Do's & Don'ts
         print("  Page 22: Do's & Don'ts")
+        steps.next("Do's & Don'ts")
         self.create_dos_donts_page()
 
+        steps.end()
         print("Document build complete.")
 
     def save(self, output_path: Path):
         """Save the document."""
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        self.doc.save(str(output_path))
+        with stage("guide: save"):
+            self.doc.save(str(output_path))
         print(f"Document saved: {output_path}")
         return output_path
 
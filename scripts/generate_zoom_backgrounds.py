@@ -1,17 +1,34 @@
 #!/usr/bin/env python3
-"""Generate Zoom background images for The Right Path Podcast using OpenAI DALL-E API."""
+"""Generate Zoom background images for The Right Path Podcast using OpenAI DALL-E API.
+
+Each background is journaled (run_journal.py), so a re-run only generates
+the ones that are missing, failed or whose prompt changed:
+
+    python generate_zoom_backgrounds.py                 # resume
+    python generate_zoom_backgrounds.py --status        # show the journal
+    python generate_zoom_backgrounds.py --force --only 02_abstract_flow
+"""
 
 import os
-import requests
-from openai import OpenAI
+import argparse
 from pathlib import Path
 
+from image_providers import DallEProvider, ImageRequest
+from run_journal import RETRIES, RunJournal, print_journal, run_batch
+
 # Output directory
 OUTPUT_DIR = Path(__file__).parent.parent / "assets" / "zoom-backgrounds"
-OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+JOURNAL_PATH = OUTPUT_DIR / ".generation_journal.jsonl"
+
+# DALL-E request settings (part of each journaled item, so changing them regenerates)
+IMAGE_PARAMS = {
+    'model': "dall-e-3",
+    'size': "1792x1024",  # Closest to 16:9 available
+    'quality': "hd",
+}
 
-# Initialize OpenAI client
-client = OpenAI()
+# Shared by the worker threads; creates the OpenAI client on first use
+provider = DallEProvider(model=IMAGE_PARAMS['model'], quality=IMAGE_PARAMS['quality'])
 
 # Image prompts
 PROMPTS = {
@@ -48,45 +65,47 @@ def generate_image(name: str, prompt: str) -> str:
     print(f"Generating: {name}")
     print(f"{'='*60}")
 
-    response = client.images.generate(
-        model="dall-e-3",
-        prompt=prompt,
-        size="1792x1024",  # Closest to 16:9 available
-        quality="hd",
-        n=1
-    )
-
-    image_url = response.data[0].url
-    revised_prompt = response.data[0].revised_prompt
+    size = tuple(int(v) for v in IMAGE_PARAMS['size'].split('x'))
+    result = provider.generate(ImageRequest(prompt, size=size, name=name), OUTPUT_DIR / f"{name}.png")
+    if not result.ok:
+        raise RuntimeError(result.error)  # journaled and retried by run_batch
 
+    revised_prompt = result.meta.get('revised_prompt') or ""
     print(f"Revised prompt: {revised_prompt[:100]}...")
-
-    # Download the image
-    image_response = requests.get(image_url)
-    output_path = OUTPUT_DIR / f"{name}.png"
-
-    with open(output_path, "wb") as f:
-        f.write(image_response.content)
-
-    print(f"Saved: {output_path}")
-    return str(output_path)
+    print(f"Saved: {result.path}")
+    return result.path
 
 def main():
+    """Main execution."""
+    parser = argparse.ArgumentParser(description="Generate the Zoom backgrounds, resuming from the run journal.")
+    parser.add_argument("--only", nargs="+", choices=list(PROMPTS), metavar="NAME", help="backgrounds to generate")
+    parser.add_argument("--force", action="store_true", help="regenerate even if the journal shows them done")
+    parser.add_argument("--workers", type=int, default=2, help="concurrent API calls (default: 2)")
+    parser.add_argument("--retries", type=int, default=RETRIES, help=f"retries per image (default: {RETRIES})")
+    parser.add_argument("--status", action="store_true", help="show the journal and exit")
+    args = parser.parse_args()
+
+    journal = RunJournal(JOURNAL_PATH)
+    if args.status:
+        print_journal(journal)
+        return []
+
     print("="*60)
     print("The Right Path Podcast - Zoom Background Generator")
     print("="*60)
 
-    generated_files = []
+    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+    items = {name: {**IMAGE_PARAMS, 'prompt': prompt} for name, prompt in PROMPTS.items()
+             if not args.only or name in args.only}
+    results = run_batch(journal, items, lambda name, params: generate_image(name, params['prompt']),
+                        max_workers=args.workers, retries=args.retries, force=args.force)
+    journal.compact()
 
-    for name, prompt in PROMPTS.items():
-        try:
-            path = generate_image(name, prompt)
-            generated_files.append(path)
-        except Exception as e:
-            print(f"Error generating {name}: {e}")
+    generated_files = [path for path in results.values() if path]
+    failed = [name for name, path in results.items() if not path]
 
     print("\n" + "="*60)
-    print("Generation Complete!")
+    print("Generation Complete!" if not failed else f"{len(failed)} failed - run again to retry them")
     print("="*60)
     print(f"\nGenerated {len(generated_files)} images:")
     for f in generated_files:
@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+"""
+Hedged image requests with an overall deadline
+
+Most image calls finish within a few seconds of each other, but a few take far
+longer, and behind a flat timeout one stuck request holds up a whole run.
+hedged_generate() gives the call an overall deadline and, once the first
+attempt has run longer than usual, starts a duplicate (on the same provider or
+a second one). The first success is kept and the other attempt is cancelled.
+
+"Longer than usual" comes from a latency histogram per provider, kept in
+LATENCY_PATH across runs. The hedge starts when the attempt passes the
+provider's PERCENTILE latency. Until MIN_SAMPLES calls have been recorded,
+DEFAULT_HEDGE_AFTER is used instead. An attempt that fails before then is
+hedged at once.
+
+Usage:
+    result = hedged_generate(ImageRequest(prompt), GeminiProvider(), OUTPUT_DIR / "hero.png",
+                             hedge_provider=DallEProvider(), deadline=180)
+
+    python hedging.py "prompt" --provider gemini --hedge-provider dall-e --deadline 180
+    python hedging.py "prompt" --provider fake-flaky --runs 30      # offline
+    python hedging.py --stats
+"""
+import os
+import json
+import time
+import uuid
+import argparse
+import threading
+from pathlib import Path
+from bisect import bisect_left
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from image_providers import OUTPUT_DIR, PROVIDERS, Deadline, ImageRequest, ImageResult
+
+# Paths
+SCRIPT_DIR = Path(__file__).parent
+LATENCY_PATH = SCRIPT_DIR.parent / "assets" / ".provider_latency.json"
+
+DEFAULT_DEADLINE = 180       # seconds for the whole call, hedge included
+PERCENTILE = 0.9             # hedge once the first attempt is slower than this share of calls
+DEFAULT_HEDGE_AFTER = 45.0   # seconds, until a provider has MIN_SAMPLES recorded latencies
+MIN_SAMPLES = 5
+MAX_SAMPLES = 500            # counts are halved beyond this, so old runs fade out
+
+# Histogram bucket upper bounds (seconds): doubling every two buckets, 0.25 s to ~3 min
+BUCKETS = [round(0.25 * 2 ** (i / 2), 2) for i in range(20)]
+
+
+class LatencyHistogram:
+    """Call latencies of one provider in log-spaced buckets (the last one is open-ended)."""
+
+    def __init__(self, counts=None):
+        self.counts = list(counts) if counts else [0] * (len(BUCKETS) + 1)
+
+    @property
+    def total(self):
+        return sum(self.counts)
+
+    def add(self, seconds):
+        self.counts[bisect_left(BUCKETS, seconds)] += 1
+        if self.total > MAX_SAMPLES:
+            self.counts = [count // 2 for count in self.counts]
+
+    def percentile(self, q):
+        """Upper bound of the bucket holding the q-th latency (the last bound for the open bucket)."""
+        target, seen = q * self.total, 0
+        for bound, count in zip(BUCKETS, self.counts):
+            seen += count
+            if seen >= target:
+                return bound
+        return BUCKETS[-1]
+
+
+class LatencyStore:
+    """Latency histograms per provider name, persisted as JSON."""
+
+    def __init__(self, path=LATENCY_PATH):
+        self.path = Path(path)
+        self.lock = threading.Lock()
+        self.histograms = self._load()
+
+    def _load(self):
+        if not self.path.exists():
+            return {}
+        with open(self.path, encoding='utf-8') as f:
+            data = json.load(f)
+        # Histograms recorded with other buckets cannot be compared; start those over
+        return {name: LatencyHistogram(counts) for name, counts in data.get('histograms', {}).items()
+                if len(counts) == len(BUCKETS) + 1}
+
+    def _save(self):
+        """Persist every histogram (callers hold self.lock)."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self.path.with_suffix('.tmp')
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump({'buckets': BUCKETS,
+                       'histograms': {name: h.counts for name, h in self.histograms.items()}}, f, indent=2)
+        os.replace(temp_path, self.path)
+
+    def histogram(self, name):
+        return self.histograms.get(name) or LatencyHistogram()
+
+    def record(self, name, seconds):
+        with self.lock:
+            self.histograms.setdefault(name, LatencyHistogram()).add(seconds)
+            self._save()
+
+    def hedge_after(self, name, percentile=PERCENTILE):
+        """Seconds after which a call to provider name is hedged."""
+        histogram = self.histogram(name)
+        if histogram.total < MIN_SAMPLES:
+            return DEFAULT_HEDGE_AFTER
+        return histogram.percentile(percentile)
+
+
+# ==================== HEDGED CALLS ====================
+
+def _attempt_path(output_path, label):
+    """Private file per attempt and call, so a late loser can never overwrite a winner.
+
+    The random token keeps calls for the same output apart, e.g. the loser of
+    one run still finishing while the next run writes the same asset.
+    """
+    token = uuid.uuid4().hex[:8]
+    return output_path.with_name(f".{output_path.stem}.{label}.{token}{output_path.suffix}")
+
+
+def _record_latency(store, result):
+    """Record the latency of a finished attempt.
+
+    Cut-off attempts (cancelled, past the deadline) count at their time so far,
+    a lower bound, so cutting off slow calls does not make the provider look
+    faster than it is.
+    """
+    if result.ok or result.error in ('cancelled', 'deadline'):
+        store.record(result.provider, result.seconds)
+
+
+def hedged_generate(request, provider, output_path, hedge_provider=None, deadline=DEFAULT_DEADLINE,
+                    percentile=PERCENTILE, hedge_after=None, store=None):
+    """Generate request into output_path, hedging a slow first attempt.
+
+    Args:
+        request: ImageRequest
+        provider: ImageProvider for the first attempt
+        hedge_provider: ImageProvider for the duplicate (default: provider again)
+        deadline: seconds for the whole call; None for no limit
+        percentile: latency percentile of provider after which to hedge
+        hedge_after: fixed hedge delay in seconds instead of the histogram's
+        store: LatencyStore to read and record latencies (default: LATENCY_PATH)
+
+    Returns:
+        ImageResult of the winning attempt, with meta['hedged'] and
+        meta['elapsed'] added; on failure an ImageResult with the last error
+        ('deadline' when time ran out)
+    """
+    store = store or LatencyStore()
+    hedge_provider = hedge_provider or provider
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    if hedge_after is None:
+        hedge_after = store.hedge_after(provider.name, percentile)
+
+    overall = Deadline(deadline)
+    start = time.perf_counter()
+    pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="hedge")
+    attempts = {}   # future -> (provider, Deadline, label)
+
+    def launch(attempt_provider, label):
+        call = overall.child()
+        future = pool.submit(attempt_provider.generate, request, _attempt_path(output_path, label), call)
+        attempts[future] = (attempt_provider, call, label)
+        return future
+
+    pending = {launch(provider, 'primary')}
+    hedged, winner, errors = False, None, []
+    while pending and winner is None and not overall.expired:
+        timeout = overall.remaining()
+        if not hedged:
+            until_hedge = max(0.0, hedge_after - (time.perf_counter() - start))
+            timeout = until_hedge if timeout is None else min(timeout, until_hedge)
+        done, pending = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+
+        for future in done:
+            result = future.result()
+            _record_latency(store, result)
+            if result.ok and winner is None:
+                winner = result
+            elif result.ok:
+                # Both attempts finished in the same wait; drop the second file as settle() would
+                Path(result.path).unlink(missing_ok=True)
+            else:
+                errors.append(f"{attempts[future][2]} {result.provider}: {result.error}")
+
+        if not hedged and winner is None and not overall.expired and \
+                (not pending or time.perf_counter() - start >= hedge_after):
+            hedged = True
+            reason = "failed" if not pending else f"running {time.perf_counter() - start:.1f} s"
+            print(f"  [hedge] {provider.name} {reason}; starting {hedge_provider.name}")
+            pending.add(launch(hedge_provider, 'hedge'))
+
+    # Cancel the loser; if it still finishes, its file is dropped
+    def settle(future):
+        result = future.result()
+        _record_latency(store, result)
+        if result.ok:
+            Path(result.path).unlink(missing_ok=True)
+
+    for future in pending:
+        attempts[future][1].cancel()
+        future.add_done_callback(settle)
+    pool.shutdown(wait=False, cancel_futures=True)
+
+    elapsed = time.perf_counter() - start
+    if winner is None:
+        error = 'deadline' if overall.expired else errors[-1] if errors else 'no result'
+        return ImageResult(provider.name, request, error=error, seconds=elapsed,
+                           meta={'hedged': hedged, 'elapsed': elapsed, 'errors': errors})
+
+    os.replace(winner.path, output_path)
+    winner.path = str(output_path)
+    winner.meta.update(hedged=hedged, elapsed=elapsed)
+    return winner
+
+
+def print_latency(store, percentile=PERCENTILE):
+    """Latency histogram and hedge threshold of every recorded provider."""
+    if not store.histograms:
+        print("  No latencies recorded yet")
+    for name, histogram in sorted(store.histograms.items()):
+        p50, p90, p99 = (histogram.percentile(q) for q in (0.5, 0.9, 0.99))
+        print(f"\n  {name}: {histogram.total} call(s)  p50 {p50:.1f} s  p90 {p90:.1f} s  p99 {p99:.1f} s"
+              f"  -> hedge after {store.hedge_after(name, percentile):.1f} s")
+        peak = max(histogram.counts)
+        for i, count in enumerate(histogram.counts):
+            if count:
+                bound = f"<= {BUCKETS[i]:6.2f} s" if i < len(BUCKETS) else f" > {BUCKETS[-1]:6.2f} s"
+                print(f"    {bound}  {'#' * max(1, round(30 * count / peak)):<30} {count}")
+
+
+def main():
+    """Main execution."""
+    parser = argparse.ArgumentParser(description="Generate an image with a deadline, hedging slow calls.")
+    parser.add_argument("prompt", nargs='?', help="image prompt")
+    parser.add_argument("--provider", choices=list(PROVIDERS), default='gemini')
+    parser.add_argument("--hedge-provider", choices=list(PROVIDERS), default=None,
+                        help="provider for the hedged duplicate (default: the same provider)")
+    parser.add_argument("--deadline", type=float, default=DEFAULT_DEADLINE, help="seconds for the whole call")
+    parser.add_argument("--percentile", type=float, default=PERCENTILE, help="latency percentile to hedge at")
+    parser.add_argument("--hedge-after", type=float, default=None, help="fixed hedge delay in seconds")
+    parser.add_argument("--runs", type=int, default=1, help="repeat the call, e.g. to build up the histogram")
+    parser.add_argument("--output-dir", default=str(OUTPUT_DIR))
+    parser.add_argument("--latency-file", default=str(LATENCY_PATH))
+    parser.add_argument("--stats", action="store_true", help="only print the latency histograms")
+    args = parser.parse_args()
+
+    store = LatencyStore(args.latency_file)
+    if args.stats or not args.prompt:
+        print_latency(store, args.percentile)
+        return None
+
+    provider = PROVIDERS[args.provider]()
+    hedge_provider = PROVIDERS[args.hedge_provider]() if args.hedge_provider else provider
+    request = ImageRequest(args.prompt)
+
+    print("=" * 60)
+    print(f"Hedged Generation: {provider.name} -> {hedge_provider.name} (deadline {args.deadline:.0f} s)")
+    print("=" * 60)
+
+    results = []
+    for run in range(args.runs):
+        result = hedged_generate(request, provider, Path(args.output_dir) / f"{request.name}_hedged.png",
+                                 hedge_provider, deadline=args.deadline, percentile=args.percentile,
+                                 hedge_after=args.hedge_after, store=store)
+        outcome = result.path if result.ok else f"FAILED  {result.error}"
+        hedged = " (hedged)" if result.meta.get('hedged') else ""
+        print(f"  run {run + 1:>3}  {result.provider:<12} {result.meta['elapsed']:6.1f} s{hedged}  {outcome}")
+        results.append(result)
+
+    print_latency(store, args.percentile)
+    return results
+
+
+if __name__ == "__main__":
+    main()
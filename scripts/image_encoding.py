@@ -0,0 +1,277 @@
+#!/usr/bin/env python3
+"""
+Encoding profiles for rendered images
+
+Compositors save through save_image() with a named profile instead of
+hand-picking Pillow options (PNG ignores `quality`, so every output used to
+get the default zlib level):
+
+    draft     PNG, zlib level 1 - fastest, largest; previews and review copies
+    final     PNG, zlib level 6 - the standard deliverable
+    archival  PNG, optimize (level 9 + filter search) - smallest lossless,
+              several times slower, so it can run on a background worker
+              and replace a final PNG in place once done
+    web       WebP at the lowest quality that keeps SSIM >= TARGET_SSIM
+              (searched on a mosaic of sampled tiles, then encoded once)
+    web-avif  AVIF, same search; smaller than WebP but much slower to encode
+    print     CMYK TIFF (deflate) for print/PDF workflows; converted through
+              the ICC profile in ASSET_CMYK_ICC when set
+
+Each save returns a report with the encode time and file size, so CPU can be
+traded for bytes deliberately. Files are written to a temporary name and
+renamed, so a background encode never leaves a half-written file behind.
+Run this script on an image to compare the profiles side by side.
+
+Usage:
+    save_image(final_image, output_path, 'final', dpi=300)
+    save_image(final_image, output_path, 'archival', dpi=300, background=True)
+    ...
+    wait_background()   # before exiting; returns the background reports
+
+    python image_encoding.py ../assets/branding-guide/cover_page_next_level.png
+    python image_encoding.py cover.png --profile draft --profile web --output-dir out
+"""
+import io
+import os
+import time
+import argparse
+import tempfile
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+from PIL import Image, features
+
+# Profile name -> format, file suffix and Pillow save options
+PROFILES = {
+    'draft': {'format': 'PNG', 'suffix': '.png', 'options': {'compress_level': 1}},
+    'final': {'format': 'PNG', 'suffix': '.png', 'options': {'compress_level': 6}},
+    'archival': {'format': 'PNG', 'suffix': '.png', 'options': {'optimize': True}},
+    'web': {'format': 'WEBP', 'suffix': '.webp', 'options': {'method': 4}, 'target_ssim': True},
+    'web-avif': {'format': 'AVIF', 'suffix': '.avif', 'options': {'speed': 6}, 'target_ssim': True},
+    'print': {'format': 'TIFF', 'suffix': '.tif', 'options': {'compression': 'tiff_adobe_deflate'}, 'cmyk': True},
+}
+
+# Web profiles use the lowest quality whose luma SSIM reaches this
+TARGET_SSIM = 0.98
+WEB_QUALITY_RANGE = (50, 95)
+
+# The quality search runs on a SEARCH_GRID x SEARCH_GRID mosaic of tiles
+SEARCH_TILE = 256
+SEARCH_GRID = 4
+
+# Default print resolution
+PRINT_DPI = 300
+
+# ICC profile for RGB -> CMYK conversion (e.g. a printer's GRACoL or FOGRA profile)
+CMYK_ICC = os.environ.get('ASSET_CMYK_ICC') or None
+
+# Background encodes share one worker; Pillow releases the GIL while encoding
+_executor = None
+_pending = []
+
+
+def output_path_for(path, profile):
+    """path with the suffix of the profile's format."""
+    return Path(path).with_suffix(PROFILES[profile]['suffix'])
+
+# ==================== QUALITY MEASURE ====================
+
+def _box_mean(values, window):
+    """Mean over every window x window block (valid positions only), via an integral image."""
+    integral = np.pad(values, ((1, 0), (1, 0))).cumsum(axis=0).cumsum(axis=1)
+    total = (integral[window:, window:] - integral[:-window, window:]
+             - integral[window:, :-window] + integral[:-window, :-window])
+    return total / (window * window)
+
+
+def ssim(image_a, image_b, window=8):
+    """Mean structural similarity of two images' luma (1.0 = identical)."""
+    a = np.asarray(image_a.convert('L'), dtype=np.float64)
+    b = np.asarray(image_b.convert('L'), dtype=np.float64)
+    c1, c2 = (0.01 * 255) ** 2, (0.03 * 255) ** 2
+
+    mean_a, mean_b = _box_mean(a, window), _box_mean(b, window)
+    var_a = _box_mean(a * a, window) - mean_a ** 2
+    var_b = _box_mean(b * b, window) - mean_b ** 2
+    covariance = _box_mean(a * b, window) - mean_a * mean_b
+
+    ssim_map = (((2 * mean_a * mean_b + c1) * (2 * covariance + c2))
+                / ((mean_a ** 2 + mean_b ** 2 + c1) * (var_a + var_b + c2)))
+    return float(ssim_map.mean())
+
+# ==================== ENCODERS ====================
+
+def sample_tiles(image, tile=SEARCH_TILE, grid=SEARCH_GRID):
+    """Mosaic of grid x grid tiles spread evenly over the image (the image itself if it is small)."""
+    if image.width <= tile * grid or image.height <= tile * grid:
+        return image
+    mosaic = Image.new(image.mode, (tile * grid, tile * grid))
+    for row in range(grid):
+        for col in range(grid):
+            left = (image.width - tile) * col // (grid - 1)
+            top = (image.height - tile) * row // (grid - 1)
+            mosaic.paste(image.crop((left, top, left + tile, top + tile)), (col * tile, row * tile))
+    return mosaic
+
+
+def _search_quality(image, image_format, options, target_ssim):
+    """Lowest quality in WEB_QUALITY_RANGE whose encode of sample_tiles(image) reaches target_ssim.
+
+    Returns (quality, ssim on the sample); the top of the range if none does.
+    """
+    sample = sample_tiles(image)
+    low, high = WEB_QUALITY_RANGE
+    best = None
+    while low <= high:
+        quality = (low + high) // 2
+        buffer = io.BytesIO()
+        sample.save(buffer, image_format, quality=quality, **options)
+        score = ssim(sample, Image.open(buffer))
+        if score >= target_ssim:
+            best = (quality, score)
+            high = quality - 1
+        else:
+            low = quality + 1
+            if quality == WEB_QUALITY_RANGE[1]:
+                best = (quality, score)  # even the top of the range misses; ship it anyway
+    return best
+
+
+def to_cmyk(image):
+    """CMYK copy of an image, through CMYK_ICC when configured; returns (image, icc_bytes)."""
+    image = image.convert('RGB')
+    if not CMYK_ICC:
+        return image.convert('CMYK'), None
+
+    from PIL import ImageCms
+    cmyk_profile = ImageCms.getOpenProfile(CMYK_ICC)
+    converted = ImageCms.profileToProfile(image, ImageCms.createProfile('sRGB'), cmyk_profile,
+                                          renderingIntent=ImageCms.Intent.RELATIVE_COLORIMETRIC,
+                                          outputMode='CMYK')
+    return converted, cmyk_profile.tobytes()
+
+
+def _encode(image, path, profile, dpi, target_ssim):
+    settings = PROFILES[profile]
+    image_format = settings['format']
+    if image_format in ('WEBP', 'AVIF') and not features.check(image_format.lower()):
+        raise RuntimeError(f"This Pillow build cannot write {image_format}; use another profile")
+
+    report = {'profile': profile, 'format': image_format, 'path': str(path)}
+    temp_path = path.with_name(f".{path.name}.{profile}.tmp")
+    start = time.perf_counter()
+
+    if settings.get('target_ssim'):
+        if image.mode not in ('RGB', 'RGBA'):
+            image = image.convert('RGB')
+        report['quality'], report['ssim'] = _search_quality(image, image_format, settings['options'], target_ssim)
+        image.save(temp_path, image_format, quality=report['quality'], **settings['options'])
+    elif settings.get('cmyk'):
+        cmyk, icc = to_cmyk(image)
+        extra = {'icc_profile': icc} if icc else {}
+        dpi = dpi or PRINT_DPI
+        cmyk.save(temp_path, image_format, dpi=(dpi, dpi), **settings['options'], **extra)
+    else:
+        extra = {'dpi': (dpi, dpi)} if dpi else {}
+        image.save(temp_path, image_format, **settings['options'], **extra)
+    os.replace(temp_path, path)
+
+    report['seconds'] = time.perf_counter() - start
+    report['bytes'] = path.stat().st_size
+    return report
+
+
+def save_image(image, path, profile='final', dpi=None, target_ssim=TARGET_SSIM, background=False):
+    """Encode image to path (suffix set by the profile) and report how it went.
+
+    Args:
+        image: PIL image; when background is True it must not be modified afterwards
+        profile: key of PROFILES
+        dpi: resolution to record in the file (print defaults to PRINT_DPI)
+        background: encode on a worker thread and return a Future of the
+            report; wait_background() waits for all of them
+
+    Returns:
+        dict with profile, format, path, bytes and seconds (plus quality and
+        the sampled ssim for the web profiles)
+    """
+    if profile not in PROFILES:
+        raise ValueError(f"Unknown encoding profile {profile!r}; choose from {', '.join(PROFILES)}")
+    path = output_path_for(path, profile)
+
+    if background:
+        global _executor
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="encode")
+        future = _executor.submit(_encode, image, path, profile, dpi, target_ssim)
+        _pending.append(future)
+        return future
+    return _encode(image, path, profile, dpi, target_ssim)
+
+
+def wait_background():
+    """Wait for every background encode started so far and return their reports.
+
+    Scripts call this before exiting, so an encode error is raised instead of lost.
+    """
+    reports = [future.result() for future in _pending]
+    _pending.clear()
+    return reports
+
+
+def describe(report):
+    """One-line summary of a save_image report."""
+    line = (f"{report['profile']}: {Path(report['path']).name} "
+            f"{report['bytes'] / 1024 / 1024:.2f} MB in {report['seconds']:.2f} s")
+    if 'quality' in report:
+        line += f" (quality {report['quality']}, SSIM {report['ssim']:.3f})"
+    return line
+
+# ==================== PROFILE COMPARISON ====================
+
+def compare_profiles(image_path, profiles, output_dir):
+    """Encode one image with each profile; returns the reports."""
+    image = Image.open(image_path)
+    image.load()
+    stem = Path(output_dir) / Path(image_path).stem
+    reports = []
+    for profile in profiles:
+        try:
+            reports.append(save_image(image, f"{stem}_{profile}", profile))
+        except (RuntimeError, OSError) as e:
+            print(f"  {profile}: skipped ({e})")
+    return reports
+
+
+def main():
+    """Main execution."""
+    parser = argparse.ArgumentParser(description="Compare encode time and size of the encoding profiles.")
+    parser.add_argument("images", nargs="+", help="images to encode")
+    parser.add_argument("--profile", action="append", choices=list(PROFILES),
+                        help="profile to try (repeatable; default: all)")
+    parser.add_argument("--output-dir", help="keep the encoded files here (default: a temporary folder)")
+    args = parser.parse_args()
+    profiles = args.profile or list(PROFILES)
+
+    print("=" * 70)
+    print("Encoding Profile Comparison")
+    print("=" * 70)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        output_dir = Path(args.output_dir or temp_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        for image_path in args.images:
+            source_bytes = Path(image_path).stat().st_size
+            print(f"\n{image_path} ({source_bytes / 1024 / 1024:.2f} MB)")
+            print(f"  {'profile':<10} {'format':<6} {'size MB':>8} {'vs source':>10} {'encode s':>9}  notes")
+            for report in compare_profiles(image_path, profiles, output_dir):
+                notes = f"quality {report['quality']}, SSIM {report['ssim']:.3f}" if 'quality' in report else ""
+                print(f"  {report['profile']:<10} {report['format']:<6} {report['bytes'] / 1024 / 1024:8.2f} "
+                      f"{report['bytes'] / source_bytes:9.0%} {report['seconds']:9.2f}  {notes}")
+        if args.output_dir:
+            print(f"\nEncoded files: {output_dir}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,444 @@
+#!/usr/bin/env python3
+"""
+One interface for every image generation API
+
+Each provider turns an ImageRequest (prompt, target size, name) into an
+ImageResult (file path or error, seconds taken, provider metadata), hiding
+its own request and response format:
+
+    dall-e    OpenAI images.generate, nearest supported size, URL download
+    gemini    Gemini 2.5 Flash Image through OpenRouter chat completions
+    freepik   Freepik Mystic tasks (freepik_jobs), nearest aspect ratio
+    fake      local renderer with configurable delay/failures, for tests and dry runs
+
+Every call carries a Deadline: providers size each network timeout from the
+time it has left (never more than REQUEST_TIMEOUT per step) and stop at the
+next step once it is cancelled. Every provider instance limits how many of
+its calls run at once (max_concurrency), however many fan-outs share it.
+fan_out() sends requests to several providers concurrently and returns every
+result, or, with a deadline, whatever has finished by then (later calls are
+cancelled and reported as missed). For hedged calls see hedging.py. Every
+call is recorded in the usage ledger (usage_ledger.py).
+
+Usage:
+    results = fan_out([ImageRequest(prompt, size=(1920, 1080))],
+                      [DallEProvider(), GeminiProvider()], OUTPUT_DIR, deadline=90)
+
+    python image_providers.py "prompt" --provider dall-e --provider gemini --deadline 90
+    python image_providers.py "prompt" --provider fake --provider fake-slow    # offline
+"""
+import os
+import re
+import time
+import random
+import argparse
+import threading
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor, wait
+
+from media_ingest import DOWNLOAD_TIMEOUT, decode_data_url, download_to_file, save_media
+from usage_ledger import record as record_usage
+
+# Paths
+SCRIPT_DIR = Path(__file__).parent
+OUTPUT_DIR = SCRIPT_DIR.parent / "assets" / "provider-comparison"
+
+OPENROUTER_URL = "https://openrouter.ai/api/v1/chat/completions"
+REQUEST_TIMEOUT = 120    # longest single network step; a call's Deadline may cut it shorter
+
+
+def _slug(text, length=40):
+    return re.sub(r'[^a-z0-9]+', '-', text.lower()).strip('-')[:length].rstrip('-') or 'image'
+
+
+def _nearest_ratio(size, ratios):
+    """Key of ratios ({key: width / height}) closest to size's aspect ratio."""
+    aspect = size[0] / size[1]
+    return min(ratios, key=lambda key: abs(ratios[key] - aspect))
+
+
+class DeadlineExceeded(TimeoutError):
+    """The call's overall deadline passed."""
+
+
+class CallCancelled(Exception):
+    """The call was cancelled, e.g. as the losing side of a hedged request."""
+
+
+class Deadline:
+    """Overall time limit and cancel flag of one call (seconds=None: no limit)."""
+
+    def __init__(self, seconds=None):
+        self.expires = None if seconds is None else time.monotonic() + seconds
+        self.cancelled = threading.Event()
+
+    def child(self):
+        """A Deadline with the same expiry that can be cancelled on its own."""
+        child = Deadline()
+        child.expires = self.expires
+        return child
+
+    def cancel(self):
+        self.cancelled.set()
+
+    @property
+    def expired(self):
+        return self.expires is not None and time.monotonic() >= self.expires
+
+    def remaining(self, cap=None):
+        """Seconds left (at most cap, never negative); None when there is no limit and no cap."""
+        if self.expires is None:
+            return cap
+        left = max(0.0, self.expires - time.monotonic())
+        return left if cap is None else min(left, cap)
+
+    def check(self):
+        """Raise CallCancelled or DeadlineExceeded if the call should stop."""
+        if self.cancelled.is_set():
+            raise CallCancelled("cancelled")
+        if self.expired:
+            raise DeadlineExceeded("deadline")
+
+    def timeout(self, cap):
+        """Timeout for the next network step: the time left, at most cap; raises if there is none."""
+        self.check()
+        return self.remaining(cap)
+
+    def sleep(self, seconds):
+        """Sleep, waking early on cancel; raises if cancelled or expired meanwhile."""
+        self.cancelled.wait(self.remaining(seconds))
+        self.check()
+
+
+class ImageRequest:
+    """What to generate; providers map size to the nearest format they support."""
+
+    def __init__(self, prompt, size=(1920, 1080), name=None):
+        self.prompt = prompt
+        self.size = tuple(size)
+        self.name = name or _slug(prompt)
+
+    def __repr__(self):
+        return f"ImageRequest({self.name!r}, size={self.size})"
+
+
+class ImageResult:
+    """Outcome of one provider call; path is None when it failed or missed the deadline."""
+
+    def __init__(self, provider, request, path=None, error=None, seconds=None, meta=None):
+        self.provider = provider
+        self.request = request
+        self.path = path
+        self.error = error
+        self.seconds = seconds
+        self.meta = meta or {}
+
+    @property
+    def ok(self):
+        return self.path is not None
+
+    def __repr__(self):
+        outcome = self.path if self.ok else f"error={self.error!r}"
+        return f"ImageResult({self.provider!r}, {self.request.name!r}, {outcome})"
+
+
+class ImageProvider:
+    """Base class: subclasses implement _generate(request, output_path, deadline) -> (path, meta)."""
+
+    name = None
+    model = None
+    max_concurrency = 2
+    records_usage = True     # add each call to the usage ledger
+
+    def __init__(self, max_concurrency=None):
+        if max_concurrency is not None:
+            self.max_concurrency = max_concurrency
+        self._slots = threading.BoundedSemaphore(self.max_concurrency)
+
+    def generate(self, request, output_path, deadline=None):
+        """Generate request into output_path within deadline (a Deadline); never raises.
+
+        Errors are reported in the result: 'deadline' when the deadline passed
+        (also while waiting for a free slot), 'cancelled' after deadline.cancel().
+        """
+        deadline = deadline or Deadline()
+        start = time.perf_counter()
+        if not self._slots.acquire(timeout=deadline.remaining()):
+            return ImageResult(self.name, request, error='deadline', seconds=time.perf_counter() - start)
+        try:
+            deadline.check()
+            path, meta = self._generate(request, Path(output_path), deadline)
+            result = ImageResult(self.name, request, str(path), seconds=time.perf_counter() - start, meta=meta)
+        except CallCancelled:
+            result = ImageResult(self.name, request, error='cancelled', seconds=time.perf_counter() - start)
+        except Exception as e:
+            error = 'deadline' if deadline.expired else f"{type(e).__name__}: {e}"
+            result = ImageResult(self.name, request, error=error, seconds=time.perf_counter() - start)
+        finally:
+            self._slots.release()
+
+        if self.records_usage:
+            meta = result.meta
+            record_usage(self.name, self.model, request.name, seconds=result.seconds, usage=meta.get('usage'),
+                         images=int(result.ok), nbytes=os.path.getsize(result.path) if result.ok else 0,
+                         error=result.error, size=meta.get('size'), quality=meta.get('quality'))
+        return result
+
+    def _generate(self, request, output_path, deadline):
+        raise NotImplementedError
+
+    def __repr__(self):
+        return f"{type(self).__name__}(max_concurrency={self.max_concurrency})"
+
+# ==================== PROVIDERS ====================
+
+class DallEProvider(ImageProvider):
+    """OpenAI DALL-E 3."""
+
+    name = 'dall-e'
+    SIZES = {'1024x1024': 1.0, '1792x1024': 1792 / 1024, '1024x1792': 1024 / 1792}
+
+    def __init__(self, model="dall-e-3", quality="hd", client=None, max_concurrency=None):
+        super().__init__(max_concurrency)
+        self.model = model
+        self.quality = quality
+        self._client = client
+
+    @property
+    def client(self):
+        if self._client is None:
+            from openai import OpenAI
+            self._client = OpenAI()
+        return self._client
+
+    def _generate(self, request, output_path, deadline):
+        size = _nearest_ratio(request.size, self.SIZES)
+        # Without a limit the SDK retries on its own; within one, the deadline decides
+        client = self.client.with_options(timeout=deadline.timeout(REQUEST_TIMEOUT),
+                                          max_retries=0 if deadline.expires else 2)
+        response = client.images.generate(model=self.model, prompt=request.prompt, size=size,
+                                          quality=self.quality, n=1)
+        # The image is paid for from here on, so a cancelled call still saves it
+        # (and the usage ledger sees it); only the deadline cuts the download short
+        image = response.data[0]
+        if getattr(image, 'b64_json', None):
+            path = decode_data_url(f"data:image/png;base64,{image.b64_json}", output_path)
+        else:
+            path = download_to_file(image.url, output_path, timeout=deadline.remaining(DOWNLOAD_TIMEOUT))
+        return path, {'size': size, 'quality': self.quality, 'revised_prompt': getattr(image, 'revised_prompt', None)}
+
+
+class GeminiProvider(ImageProvider):
+    """Gemini 2.5 Flash Image ("Nano Banana") through OpenRouter."""
+
+    name = 'gemini'
+    RATIOS = {'1:1': 1.0, '16:9': 16 / 9, '9:16': 9 / 16, '4:3': 4 / 3, '3:4': 3 / 4, '3:2': 3 / 2, '2:3': 2 / 3}
+
+    def __init__(self, api_key=None, model="google/gemini-2.5-flash-image", app_url=None, app_title=None,
+                 session=None, max_concurrency=None):
+        super().__init__(max_concurrency)
+        self.api_key = api_key or os.getenv('OPENROUTER_API_KEY')
+        self.model = model
+        self.app_url = app_url
+        self.app_title = app_title
+        self.session = session
+
+    def _generate(self, request, output_path, deadline):
+        if not self.api_key:
+            raise RuntimeError("OPENROUTER_API_KEY not set")
+        session = self.session
+        if session is None:
+            import requests as session
+
+        headers = {"Authorization": f"Bearer {self.api_key}", "Content-Type": "application/json"}
+        if self.app_url:
+            headers["HTTP-Referer"] = self.app_url
+        if self.app_title:
+            headers["X-Title"] = self.app_title
+        ratio = _nearest_ratio(request.size, self.RATIOS)
+        payload = {
+            "model": self.model,
+            "modalities": ["image", "text"],
+            "image_config": {"aspect_ratio": ratio},
+            "usage": {"include": True},     # report the call's cost for the usage ledger
+            "messages": [{"role": "user", "content": request.prompt}],
+        }
+
+        response = session.post(OPENROUTER_URL, headers=headers, json=payload,
+                                timeout=deadline.timeout(REQUEST_TIMEOUT))
+        response.raise_for_status()
+        result = response.json()
+
+        images = result['choices'][0]['message'].get('images', [])
+        if not images:
+            raise RuntimeError("no image in response")
+        image = images[0]
+        url = image.get('image_url', {}).get('url', '') if 'image_url' in image else image.get('url', '')
+        if not url:
+            raise RuntimeError("image without URL in response")
+        # Paid for from here on: save it even if cancelled meanwhile (see DallEProvider)
+        path = save_media(url, output_path, timeout=deadline.remaining(DOWNLOAD_TIMEOUT))
+        return path, {'aspect_ratio': ratio, 'usage': result.get('usage', {})}
+
+
+class FreepikProvider(ImageProvider):
+    """Freepik Mystic, one task per request through freepik_jobs."""
+
+    name = 'freepik'
+    records_usage = False    # freepik_jobs records its tasks
+    RATIOS = {'square_1_1': 1.0, 'widescreen_16_9': 16 / 9, 'social_story_9_16': 9 / 16,
+              'classic_4_3': 4 / 3, 'traditional_3_4': 3 / 4, 'standard_3_2': 3 / 2, 'portrait_2_3': 2 / 3}
+
+    def __init__(self, api_key=None, jobs=None, timeout=300, max_concurrency=None, **job_args):
+        super().__init__(max_concurrency)
+        self.api_key = api_key or os.getenv('FREEPIK_API_KEY')
+        self.timeout = timeout
+        self._jobs = jobs
+        self._job_args = job_args
+
+    @property
+    def jobs(self):
+        if self._jobs is None:
+            if not self.api_key:
+                raise RuntimeError("FREEPIK_API_KEY not set")
+            from freepik_jobs import FreepikJobs
+            self._jobs = FreepikJobs(self.api_key, **self._job_args)
+        return self._jobs
+
+    def _generate(self, request, output_path, deadline):
+        ratio = _nearest_ratio(request.size, self.RATIOS)
+        task_id = self.jobs.submit(request.prompt, output_path, aspect_ratio=ratio)
+        path = self.jobs.wait([task_id], timeout=deadline.timeout(self.timeout), cancel=deadline.cancelled)[task_id]
+        deadline.check()
+        if not path:
+            raise RuntimeError(f"task {task_id} did not complete")
+        return path, {'task_id': task_id, 'aspect_ratio': ratio}
+
+
+class FakeProvider(ImageProvider):
+    """Offline stand-in: renders the prompt on a tinted background after `delay` seconds.
+
+    With stall > 0, that share of calls takes STALL_FACTOR times longer (a slow tail).
+    """
+
+    name = 'fake'
+    max_concurrency = 4
+    records_usage = False
+    STALL_FACTOR = 20
+
+    def __init__(self, delay=0.5, fail=False, stall=0.0, name=None, max_concurrency=None):
+        super().__init__(max_concurrency)
+        self.delay = delay
+        self.fail = fail
+        self.stall = stall
+        if name:
+            self.name = name
+
+    def _generate(self, request, output_path, deadline):
+        import hashlib
+        from PIL import Image, ImageDraw
+
+        stalled = random.random() < self.stall
+        deadline.sleep(self.delay * (self.STALL_FACTOR if stalled else 1))
+        if self.fail:
+            raise RuntimeError("fake provider failure")
+        tint = tuple(hashlib.sha1(f"{self.name}:{request.prompt}".encode('utf-8')).digest()[:3])
+        image = Image.new('RGB', request.size, tint)
+        ImageDraw.Draw(image).text((20, 20), f"{self.name}: {request.prompt[:80]}", fill=(255, 255, 255))
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        image.save(output_path)
+        return output_path, {'delay': self.delay, 'stalled': stalled}
+
+
+# Provider name -> factory, for command lines
+PROVIDERS = {
+    'dall-e': DallEProvider,
+    'gemini': GeminiProvider,
+    'freepik': FreepikProvider,
+    'fake': FakeProvider,
+    'fake-slow': lambda: FakeProvider(delay=5.0, name='fake-slow'),
+    'fake-failing': lambda: FakeProvider(fail=True, name='fake-failing'),
+    'fake-flaky': lambda: FakeProvider(delay=0.5, stall=0.05, name='fake-flaky'),
+}
+
+# ==================== FAN-OUT ====================
+
+def fan_out(requests, providers, output_dir=OUTPUT_DIR, deadline=None):
+    """Send every request to every provider concurrently.
+
+    Args:
+        requests: list of ImageRequest
+        providers: list of ImageProvider; each caps its own concurrent calls
+        output_dir: images are written as <request name>_<provider>.png
+        deadline: seconds to wait; calls not finished by then are cancelled and
+            returned as missed (error 'deadline'). None waits for all results.
+
+    Returns:
+        list of ImageResult, in request then provider order
+    """
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    pairs = [(request, provider) for request in requests for provider in providers]
+
+    budget = Deadline(deadline)
+    pool = ThreadPoolExecutor(max_workers=len(pairs) or 1, thread_name_prefix="provider")
+    futures = [pool.submit(provider.generate, request, output_dir / f"{request.name}_{provider.name}.png", budget)
+               for request, provider in pairs]
+    wait(futures, timeout=deadline)
+    budget.cancel()
+    pool.shutdown(wait=False, cancel_futures=True)
+
+    results = []
+    for future, (request, provider) in zip(futures, pairs):
+        if future.done() and not future.cancelled():
+            results.append(future.result())
+        else:
+            results.append(ImageResult(provider.name, request, error='deadline', seconds=deadline))
+    return results
+
+
+def print_results(results, palette=None):
+    """Side-by-side table of fan-out results, with brand palette coverage when palette is given."""
+    if palette:
+        from palette_analyzer import analyze_palette
+    for result in results:
+        seconds = f"{result.seconds:6.1f} s" if result.seconds is not None else "      -"
+        if not result.ok:
+            print(f"  {result.provider:<14} {seconds}  FAILED  {result.error}")
+            continue
+        line = f"  {result.provider:<14} {seconds}  {result.path}"
+        if palette:
+            line += f"  ({analyze_palette(result.path, palette)['on_brand']:.0%} on-brand)"
+        print(line)
+
+
+def main():
+    """Main execution."""
+    parser = argparse.ArgumentParser(description="Send a prompt to several image providers side by side.")
+    parser.add_argument("prompt", help="image prompt")
+    parser.add_argument("--provider", action="append", choices=list(PROVIDERS),
+                        help="provider to use (repeatable; default: dall-e and gemini)")
+    parser.add_argument("--size", default="1920x1080", help="target size WxH (default: 1920x1080)")
+    parser.add_argument("--deadline", type=float, default=None, help="seconds to wait (default: all results)")
+    parser.add_argument("--output-dir", default=str(OUTPUT_DIR))
+    parser.add_argument("--palette", choices=['reimagined', 'right_path'], default=None,
+                        help="also report brand palette coverage of each result")
+    args = parser.parse_args()
+
+    width, height = (int(v) for v in args.size.lower().split('x'))
+    providers = [PROVIDERS[name]() for name in args.provider or ['dall-e', 'gemini']]
+    request = ImageRequest(args.prompt, size=(width, height))
+
+    print("=" * 60)
+    print(f"Image Provider Fan-out: {', '.join(p.name for p in providers)}")
+    print("=" * 60)
+
+    start = time.perf_counter()
+    results = fan_out([request], providers, args.output_dir, deadline=args.deadline)
+    print(f"\n{request.name} ({time.perf_counter() - start:.1f} s)")
+    print_results(results, args.palette)
+    return results
+
+
+if __name__ == "__main__":
+    main()
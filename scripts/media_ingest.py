@@ -0,0 +1,117 @@
+"""
+Media ingest for generated images
+
+Image APIs hand back either a URL (DALL-E, Freepik) or a base64 data URL
+inside the JSON response (OpenRouter / Gemini, Freepik). Reading a download
+with `response.content`, or decoding `url.split(',')[1]` into bytes and
+wrapping it in BytesIO, keeps two or three full copies of every image alive
+at once. The helpers here write straight to disk instead:
+
+- URLs are streamed to the file in CHUNK_SIZE pieces.
+- Data URLs are decoded CHUNK_SIZE characters at a time from a slice of the
+  payload (a memoryview when it is bytes), so only the JSON string itself is
+  ever held in full.
+
+Files are written next to their destination and renamed into place, so a
+failed download never leaves a truncated image behind. load_image() goes
+through a temporary file and returns a loaded PIL image.
+
+Usage:
+    save_media(image_url, OUTPUT_DIR / "background.png")   # URL or data URL
+    background = load_image(image_url)
+"""
+import os
+import binascii
+import tempfile
+from pathlib import Path
+
+from PIL import Image
+
+# Bytes per streamed download chunk / base64 characters per decode step (a multiple of 4)
+CHUNK_SIZE = 1 << 20
+
+DOWNLOAD_TIMEOUT = 60
+
+
+def is_data_url(source):
+    prefix = source[:5]
+    return prefix in ('data:', b'data:')
+
+
+def _write_atomic(path, write_chunks):
+    """Write to a temporary file beside path, then rename it into place; returns (path, bytes)."""
+    path = Path(path)
+    fd, temp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".part")
+    written = 0
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            for chunk in write_chunks():
+                f.write(chunk)
+                written += len(chunk)
+        os.replace(temp_path, path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+    return path, written
+
+
+def download_to_file(url, path, timeout=DOWNLOAD_TIMEOUT, session=None, headers=None):
+    """Stream url to path without holding the body in memory; returns the path."""
+    if session is None:
+        import requests as session
+
+    response = session.get(url, stream=True, timeout=timeout, headers=headers)
+    with response:
+        response.raise_for_status()
+        path, _ = _write_atomic(path, lambda: response.iter_content(CHUNK_SIZE))
+    return path
+
+
+def decode_data_url(data_url, path):
+    """Decode a base64 data URL (str or bytes) to path in chunks; returns the path.
+
+    The payload is never copied whole: str input is sliced CHUNK_SIZE
+    characters at a time, bytes input through a memoryview. The base64 text
+    must not contain line breaks (data URLs never do).
+    """
+    comma = data_url.find(',' if isinstance(data_url, str) else b',')
+    header = data_url[:max(comma, 0)]
+    if isinstance(header, bytes):
+        header = header.decode('ascii', 'replace')
+    if comma < 0 or not header.endswith(';base64'):
+        raise ValueError("Not a base64 data URL")
+
+    payload = memoryview(data_url) if not isinstance(data_url, str) else data_url
+    start = comma + 1
+
+    def chunks():
+        for offset in range(start, len(data_url), CHUNK_SIZE):
+            yield binascii.a2b_base64(payload[offset:offset + CHUNK_SIZE])
+
+    path, _ = _write_atomic(path, chunks)
+    return path
+
+
+def save_media(source, path, **download_args):
+    """Write a URL or data URL to path; returns the path."""
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    if is_data_url(source):
+        return decode_data_url(source, path)
+    return download_to_file(source, path, **download_args)
+
+
+def load_image(source, **download_args):
+    """Fetch a URL or data URL into a fully loaded PIL image.
+
+    The encoded file goes through a temporary file, not memory, so the decoded
+    pixels are the only full copy held.
+    """
+    fd, temp_path = tempfile.mkstemp(prefix="ingest-")
+    os.close(fd)
+    try:
+        save_media(source, temp_path, **download_args)
+        with Image.open(temp_path) as image:
+            image.load()
+            return image
+    finally:
+        os.unlink(temp_path)
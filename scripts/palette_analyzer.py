@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+Brand palette compliance analyzer
+
+Subsamples an image, converts the pixels to CIE Lab and assigns each one to
+the nearest brand color (vectorized 1-nearest-neighbour on Delta E). Reports
+how much of the image each brand color covers and clusters the off-brand
+pixels so the dominant stray colors can be named. Many images can be screened
+at once on a worker pool, e.g. AI-generated heroes before compositing.
+
+Usage:
+    python palette_analyzer.py ../assets/branding-guide/cover_hero_image_1.png
+    python palette_analyzer.py ../assets/zoom-backgrounds --palette right_path
+"""
+import argparse
+import numpy as np
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from PIL import Image
+
+from brand import PALETTES as BRAND_PALETTES, SRGB_TO_XYZ, srgb_to_lab
+
+# Brand palettes by brand
+PALETTES = {name: palette.hex_map() for name, palette in BRAND_PALETTES.items()}
+
+# Pixels farther than this (CIE76 Delta E) from every brand color are off-brand
+MAX_DELTA_E = 25
+
+# Pixels sampled per image
+SAMPLE_SIZE = 20000
+
+# Share of sampled pixels that must be on-brand for an image to pass screening
+MIN_ON_BRAND = 0.5
+
+IMAGE_SUFFIXES = {'.png', '.jpg', '.jpeg', '.webp'}
+
+# XYZ -> linear sRGB, for naming cluster centers
+_XYZ_TO_RGB = np.linalg.inv(np.array(SRGB_TO_XYZ)).astype(np.float32)
+
+
+def hex_to_rgb(hex_color):
+    hex_color = hex_color.lstrip('#')
+    return tuple(int(hex_color[i:i + 2], 16) for i in (0, 2, 4))
+
+
+def rgb_to_hex(rgb):
+    return '#{:02X}{:02X}{:02X}'.format(*(int(round(c)) for c in rgb))
+
+
+def lab_to_rgb(lab):
+    """sRGB (0-255) of an (N, 3) Lab array; used to name cluster centers."""
+    lab = np.asarray(lab, dtype=np.float32)
+    fy = (lab[:, 0] + 16) / 116
+    f = np.stack([fy + lab[:, 1] / 500, fy, fy - lab[:, 2] / 200], axis=1)
+    xyz = np.where(f > 0.206893, f ** 3, (f - 16 / 116) / 7.787)
+    linear = np.clip(xyz @ _XYZ_TO_RGB.T, 0, 1)
+    srgb = np.where(linear <= 0.0031308, linear * 12.92, 1.055 * linear ** (1 / 2.4) - 0.055)
+    return np.clip(srgb * 255, 0, 255)
+
+
+def sample_pixels(image, sample_size=SAMPLE_SIZE, seed=0):
+    """Up to sample_size RGB pixels, drawn uniformly from a reduced copy of the image."""
+    if not isinstance(image, Image.Image):
+        image = Image.open(image)
+        image.draft('RGB', (512, 512))  # JPEG decoders can skip detail we would discard
+    if image.mode != 'RGB':
+        image = image.convert('RGB')
+
+    # Reduce to a few times the sample first so the random draw stays representative
+    factor = max(1, int((image.width * image.height / (4 * sample_size)) ** 0.5))
+    pixels = np.asarray(image.reduce(factor)).reshape(-1, 3)
+    if len(pixels) > sample_size:
+        pixels = pixels[np.random.default_rng(seed).choice(len(pixels), sample_size, replace=False)]
+    return pixels
+
+
+def _kmeans(points, k, iterations=10, seed=0):
+    """Plain vectorized k-means; returns (centers, labels)."""
+    rng = np.random.default_rng(seed)
+    centers = points[rng.choice(len(points), k, replace=False)]
+    for _ in range(iterations):
+        labels = ((points[:, None, :] - centers[None, :, :]) ** 2).sum(axis=2).argmin(axis=1)
+        for i in range(k):
+            members = points[labels == i]
+            if len(members):
+                centers[i] = members.mean(axis=0)
+    return centers, labels
+
+
+def analyze_palette(image, palette='reimagined', max_delta_e=MAX_DELTA_E, sample_size=SAMPLE_SIZE,
+                    clusters=5, seed=0):
+    """Measure how closely an image sticks to a brand palette.
+
+    Args:
+        image: PIL image or path
+        palette: key of PALETTES or a {name: '#hex'} dict
+
+    Returns:
+        dict with coverage per brand color, on_brand share, and off_brand
+        clusters (hex, share of image, Delta E to the nearest brand color)
+    """
+    if isinstance(palette, str):
+        # Brand colors carry their Lab values, computed once at import
+        names = [color.name for color in BRAND_PALETTES[palette]]
+        brand_lab = np.array([color.lab for color in BRAND_PALETTES[palette]], dtype=np.float32)
+    else:
+        names = list(palette)
+        brand_lab = srgb_to_lab(np.array([hex_to_rgb(palette[n]) for n in names]))
+
+    lab = srgb_to_lab(sample_pixels(image, sample_size, seed))
+
+    # Nearest brand color per pixel
+    distances = np.sqrt(((lab[:, None, :] - brand_lab[None, :, :]) ** 2).sum(axis=2))
+    nearest = distances.argmin(axis=1)
+    delta_e = distances[np.arange(len(lab)), nearest]
+    on_brand = delta_e <= max_delta_e
+
+    coverage = {name: float(((nearest == i) & on_brand).mean()) for i, name in enumerate(names)}
+
+    # Group what is left into a few representative stray colors
+    off_brand = []
+    stray = lab[~on_brand]
+    if len(stray) >= clusters:
+        centers, labels = _kmeans(stray, clusters, seed=seed)
+        center_distances = np.sqrt(((centers[:, None, :] - brand_lab[None, :, :]) ** 2).sum(axis=2))
+        for i, rgb in enumerate(lab_to_rgb(centers)):
+            share = float((labels == i).sum() / len(lab))
+            if share:
+                off_brand.append({
+                    'hex': rgb_to_hex(rgb),
+                    'share': share,
+                    'nearest': names[center_distances[i].argmin()],
+                    'delta_e': float(center_distances[i].min()),
+                })
+        off_brand.sort(key=lambda c: c['share'], reverse=True)
+
+    return {
+        'image': str(image) if not isinstance(image, Image.Image) else None,
+        'palette': palette if isinstance(palette, str) else 'custom',
+        'coverage': coverage,
+        'on_brand': float(on_brand.mean()),
+        'off_brand': off_brand,
+    }
+
+
+def analyze_batch(images, palette='reimagined', max_workers=None, **kwargs):
+    """Analyze many image paths on a process pool, yielding results as they complete."""
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        futures = [pool.submit(analyze_palette, str(path), palette, **kwargs) for path in images]
+        for future in as_completed(futures):
+            yield future.result()
+
+
+def print_palette_report(result, min_on_brand=MIN_ON_BRAND):
+    status = "PASS" if result['on_brand'] >= min_on_brand else "REVIEW"
+    print(f"\n[{status}] {result['image']}: {result['on_brand']:.0%} on-brand ({result['palette']})")
+    for name, share in sorted(result['coverage'].items(), key=lambda item: item[1], reverse=True):
+        if share >= 0.005:
+            print(f"    {name:<14} {share:6.1%}")
+    for cluster in result['off_brand']:
+        print(f"    off-brand {cluster['hex']} {cluster['share']:6.1%}  "
+              f"(Delta E {cluster['delta_e']:.0f} from {cluster['nearest']})")
+
+
+def main():
+    """Main execution."""
+    parser = argparse.ArgumentParser(description="Check images against a brand palette.")
+    parser.add_argument("paths", nargs="+", help="image files or directories")
+    parser.add_argument("--palette", choices=list(PALETTES), default='reimagined')
+    parser.add_argument("--min-on-brand", type=float, default=MIN_ON_BRAND,
+                        help=f"on-brand share needed to pass (default: {MIN_ON_BRAND})")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: CPU count)")
+    args = parser.parse_args()
+
+    images = []
+    for path in map(Path, args.paths):
+        if path.is_dir():
+            images.extend(sorted(p for p in path.iterdir() if p.suffix.lower() in IMAGE_SUFFIXES))
+        else:
+            images.append(path)
+
+    print("=" * 60)
+    print(f"Brand Palette Check - {len(images)} image(s)")
+    print("=" * 60)
+
+    results = []
+    for result in analyze_batch(images, args.palette, args.workers):
+        print_palette_report(result, args.min_on_brand)
+        results.append(result)
+
+    passed = sum(r['on_brand'] >= args.min_on_brand for r in results)
+    print(f"\n{passed}/{len(results)} images on-brand")
+    return results
+
+
+if __name__ == "__main__":
+    main()
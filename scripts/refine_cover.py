@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+Automated cover refinement: generate -> compose -> validate, keep the best
+
+Renders variants of the next-level cover around COVER_PARAMS (darkening,
+contrast, saturation, gradient strength, font sizes, glow), scores each batch
+with the vision validator in parallel and searches around the best variant
+until one scores >= 90 or the rounds run out. Variants that fail the local
+pre-scorer (contrast, palette, sharpness, safe area) are dropped before any
+paid validation. The best variant is written as the cover page together with
+its parameters and the scoring history.
+
+Usage:
+    python refine_cover.py
+    python refine_cover.py --rounds 6 --batch 6 --seed 7
+"""
+import json
+import random
+import argparse
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from PIL import Image
+
+from cover_prescore import prescore
+from create_cover_page_next_level import (
+    ASSETS_DIR, COVER_PARAMS, HERO_IMAGE_PATH, OUTPUT_PATH,
+    create_next_level_cover, render_cover
+)
+from image_encoding import save_image
+
+# Paths
+CANDIDATES_DIR = ASSETS_DIR / "cover_candidates"
+PARAMS_PATH = OUTPUT_PATH.with_name(OUTPUT_PATH.stem + "_params.json")
+
+PASS_SCORE = 90
+
+# Search range per parameter; integer bounds mean integer values
+SEARCH_SPACE = {
+    'brightness': (0.30, 0.55),
+    'contrast': (1.2, 1.8),
+    'saturation': (1.0, 1.4),
+    'navy_gradient': (0.6, 0.9),
+    'gold_gradient': (0.0, 0.3),
+    'logo_size': (360, 460),
+    'tagline_size': (80, 120),
+    'mission_size': (65, 90),
+    'pillars_size': (40, 56),
+    'glow_intensity': (6, 20),
+}
+
+# Candidates are reviewed at half size: the vision model downsamples far below
+# print resolution anyway, and the smaller PNG encodes and uploads faster.
+REVIEW_SCALE = 0.5
+
+VALIDATION_CONTEXT = ("Full cover page with logo, tagline, mission statement, brand pillars, "
+                      "and tech elements layered on hero image")
+
+
+def propose(params, rng, step):
+    """Perturb every searchable parameter by a Gaussian step scaled to its range."""
+    variant = dict(params)
+    for name, (low, high) in SEARCH_SPACE.items():
+        value = params[name] + rng.gauss(0, step * (high - low))
+        value = min(high, max(low, value))
+        variant[name] = int(round(value)) if isinstance(low, int) else round(value, 3)
+    return variant
+
+
+def vision_score(image_path):
+    """Score a candidate with the vision rubric; returns (score, assessment)."""
+    from validate_with_gpt_vision import validate_image_with_vision
+
+    result = validate_image_with_vision(image_path, "Cover Page (Candidate)", VALIDATION_CONTEXT)
+    if not result or result['score'] is None:
+        return 0, result['assessment'] if result else ""
+    return result['score'], result['assessment']
+
+
+def save_review_copy(image, path):
+    size = (int(image.width * REVIEW_SCALE), int(image.height * REVIEW_SCALE))
+    return save_image(image.resize(size, Image.Resampling.LANCZOS), path, 'draft')['path']
+
+
+def refine_cover(rounds=4, batch=4, seed=None, hero_path=HERO_IMAGE_PATH, score=vision_score,
+                 pass_score=PASS_SCORE, max_workers=None, use_prescore=True):
+    """Search cover parameters until a variant reaches pass_score; returns (params, score, history)."""
+    rng = random.Random(seed)
+    CANDIDATES_DIR.mkdir(parents=True, exist_ok=True)
+
+    best_params, best_score = dict(COVER_PARAMS), -1
+    history, seen = [], set()
+    step = 0.25
+
+    with ThreadPoolExecutor(max_workers=max_workers or batch) as pool:
+        for round_num in range(1, rounds + 1):
+            print(f"\n[Round {round_num}/{rounds}] Rendering {batch} variants around best score {max(best_score, 0)}...")
+
+            # First round includes the current defaults as a baseline
+            candidates = [dict(best_params)] if round_num == 1 else []
+            while len(candidates) < batch:
+                candidates.append(propose(best_params, rng, step))
+
+            # Render on this thread while earlier candidates are already being scored
+            futures = {}
+            for i, params in enumerate(candidates):
+                key = json.dumps(params, sort_keys=True)
+                if key in seen:
+                    continue
+                seen.add(key)
+                layout = []
+                image = render_cover(hero_path, layout=layout, **params)
+                path = CANDIDATES_DIR / f"round{round_num}_{i + 1}.png"
+
+                if use_prescore:
+                    local = prescore(image, layout)
+                    if not local['passed']:
+                        history.append({'round': round_num, 'image': str(path), 'score': None,
+                                        'params': params, 'assessment': "; ".join(local['reasons'])})
+                        print(f"    {path.name}: rejected locally ({'; '.join(local['reasons'])})")
+                        continue
+
+                futures[pool.submit(score, save_review_copy(image, path))] = (params, path)
+
+            for future in as_completed(futures):
+                params, path = futures[future]
+                candidate_score, assessment = future.result()
+                history.append({'round': round_num, 'image': str(path), 'score': candidate_score,
+                                'params': params, 'assessment': assessment})
+                print(f"    {path.name}: {candidate_score}/100")
+
+                if candidate_score > best_score:
+                    best_params, best_score = params, candidate_score
+                if best_score >= pass_score:
+                    break
+
+            if best_score >= pass_score:
+                # Early stop: drop validations that have not started yet
+                for future in futures:
+                    future.cancel()
+                print(f"\n  PASS at round {round_num}: {best_score}/100")
+                break
+
+            step *= 0.6
+
+    return best_params, best_score, history
+
+
+def main():
+    """Main execution."""
+    parser = argparse.ArgumentParser(description="Search cover variants until one passes vision validation.")
+    parser.add_argument("--rounds", type=int, default=4, help="maximum search rounds (default: 4)")
+    parser.add_argument("--batch", type=int, default=4, help="variants rendered and scored per round (default: 4)")
+    parser.add_argument("--seed", type=int, default=None, help="random seed for reproducible searches")
+    parser.add_argument("--no-prescore", action="store_true", help="send every variant to the vision validator")
+    args = parser.parse_args()
+
+    print("=" * 70)
+    print("REFINING NEXT LEVEL COVER PAGE")
+    print("=" * 70)
+
+    start = datetime.now()
+    best_params, best_score, history = refine_cover(args.rounds, args.batch, args.seed,
+                                                    use_prescore=not args.no_prescore)
+
+    # Write the winner at full resolution with its parameters
+    create_next_level_cover(OUTPUT_PATH, **best_params)
+    with open(PARAMS_PATH, 'w', encoding='utf-8') as f:
+        json.dump({'score': best_score, 'params': best_params, 'history': history}, f, indent=2)
+
+    elapsed = (datetime.now() - start).total_seconds()
+    print("\n" + "=" * 70)
+    validated = sum(1 for h in history if h['score'] is not None)
+    print(f"Best score: {max(best_score, 0)}/100 after {validated} validations "
+          f"({len(history) - validated} rejected locally) in {elapsed:.1f}s")
+    print(f"Status: {'PASS' if best_score >= PASS_SCORE else 'REVISE'}")
+    print(f"Parameters: {PARAMS_PATH}")
+    print("=" * 70)
+
+    return best_params, best_score
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+"""
+Resumable run journal for batch asset generation
+
+Every generated asset is recorded in an append-only JSON-lines journal: its
+parameters, status, attempts, output path and output hash. The newest line
+per key wins, and a line cut short by a crash is ignored. run_batch() then
+turns a batch of API calls into an idempotent job: it skips every item the
+journal shows as done with the same parameters and an unchanged output
+file, and runs the rest concurrently, retrying failures with backoff.
+Re-running after a crash or a rate-limit stall only pays for what is missing.
+
+Usage:
+    journal = RunJournal(OUTPUT_DIR / ".generation_journal.jsonl")
+    results = run_batch(journal, {name: {'prompt': prompt} for name, prompt in PROMPTS.items()},
+                        lambda name, params: generate_image(name, params['prompt']))
+"""
+import json
+import time
+import threading
+from pathlib import Path
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from task_graph import file_digest
+
+RETRIES = 2              # further attempts after the first failure
+RETRY_DELAY = 5.0        # seconds before the first retry; doubles each time
+
+
+class RunJournal:
+    """Latest status of every asset of a batch, persisted as JSON lines."""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.lock = threading.Lock()
+        self.entries = self._load()
+
+    def _load(self):
+        entries = {}
+        if self.path.exists():
+            with open(self.path, encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue  # partial line from an interrupted write
+                    entries[record['key']] = record
+        return entries
+
+    def record(self, key, **fields):
+        """Append a new state for key (merged over its previous one); returns it."""
+        with self.lock:
+            record = {**self.entries.get(key, {}), **fields, 'key': key,
+                      'time': datetime.now().isoformat(timespec='seconds')}
+            self.entries[key] = record
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(record, sort_keys=True) + "\n")
+        return record
+
+    def is_done(self, key, params):
+        """True when key succeeded with these params and its output is still the file that was written."""
+        record = self.entries.get(key)
+        params = json.loads(json.dumps(params))  # compare as stored (tuples become lists)
+        if not record or record.get('status') != 'done' or record.get('params') != params:
+            return False
+        return record.get('sha1') is not None and file_digest(record['output']) == record['sha1']
+
+    def compact(self):
+        """Rewrite the journal with only the latest line per key."""
+        with self.lock:
+            temp_path = self.path.with_suffix('.tmp')
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                for record in self.entries.values():
+                    f.write(json.dumps(record, sort_keys=True) + "\n")
+            temp_path.replace(self.path)
+
+
+def _run_item(journal, key, params, func, retries, retry_delay):
+    """Run one item with retries, journaling each attempt; returns its output path."""
+    attempts = journal.entries.get(key, {}).get('attempts', 0)
+    for attempt in range(retries + 1):
+        attempts += 1
+        journal.record(key, params=params, status='running', attempts=attempts, error=None)
+        try:
+            output = str(func(key, params))
+            digest = file_digest(output)
+            if digest is None:
+                raise RuntimeError(f"{output} was not written")
+        except Exception as e:
+            journal.record(key, status='failed', error=f"{type(e).__name__}: {e}")
+            if attempt == retries:
+                raise
+            delay = retry_delay * 2 ** attempt
+            print(f"  [{key}] attempt {attempt + 1} failed ({e}); retrying in {delay:.0f} s")
+            time.sleep(delay)
+        else:
+            journal.record(key, status='done', output=output, sha1=digest)
+            return output
+
+
+def run_batch(journal, items, func, max_workers=2, retries=RETRIES, retry_delay=RETRY_DELAY, force=False):
+    """Produce every item the journal does not already show as done.
+
+    Args:
+        journal: RunJournal
+        items: {key: params}; params must be JSON-serializable
+        func: func(key, params) -> output path, called on a worker thread
+        force: redo every item regardless of the journal
+
+    Returns:
+        {key: output path, or None if it failed}; failures are journaled
+    """
+    results, todo = {}, {}
+    for key, params in items.items():
+        if not force and journal.is_done(key, params):
+            results[key] = journal.entries[key]['output']
+            print(f"  [DONE] {key} (journaled)")
+        else:
+            todo[key] = params
+
+    if not todo:
+        return results
+    print(f"  Running {len(todo)} of {len(items)} item(s) with {max_workers} worker(s)")
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = {pool.submit(_run_item, journal, key, params, func, retries, retry_delay): key
+                   for key, params in todo.items()}
+        for future in as_completed(futures):
+            key = futures[future]
+            try:
+                results[key] = future.result()
+            except Exception as e:
+                results[key] = None
+                print(f"  [FAILED] {key}: {e}")
+    return {key: results[key] for key in items}
+
+
+def print_journal(journal):
+    """Status table of every journaled item."""
+    for key, record in sorted(journal.entries.items()):
+        detail = record.get('output') if record.get('status') == 'done' else record.get('error') or ""
+        print(f"  {record.get('status', '?'):<8} {key:<30} attempts {record.get('attempts', 0)}  {detail}")
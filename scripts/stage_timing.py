@@ -0,0 +1,247 @@
+"""
+Per-stage timing and memory instrumentation for the render pipelines
+
+Pipelines mark their stages with a context manager, a decorator or a running
+sequence of steps:
+
+    with stage("pdf: layout"):
+        ...
+
+    @timed("guide: save")
+    def save(...): ...
+
+    steps = stages("cover")
+    steps.next("gradient")      # ends the previous step, starts this one
+    ...
+    steps.end()
+
+Each stage records wall time, CPU time and the change in resident memory;
+with ASSET_PROFILE=memory it also records Python allocations (tracemalloc),
+which are slower to trace. Instrumentation is off unless the ASSET_PROFILE or
+ASSET_TRACE environment variable is set when this module is imported. Off,
+stage() hands back a shared no-op context, @timed returns the function
+unchanged and stages() a no-op sequence, so the markers cost nothing.
+
+When enabled, a summary table is printed at exit, and ASSET_TRACE=<path>
+writes a Chrome trace-event JSON (open it in chrome://tracing or Perfetto).
+Only stages run in this process are recorded, not those in pool workers.
+
+    ASSET_PROFILE=1 python create_cover_page_next_level.py
+    ASSET_TRACE=cover_trace.json python create_cover_page_next_level.py
+    python cli.py --profile --trace cover_trace.json cover
+"""
+import os
+import sys
+import json
+import time
+import atexit
+import threading
+from functools import wraps
+from contextlib import nullcontext
+
+MODE = os.environ.get('ASSET_PROFILE', '').lower()
+TRACE_PATH = os.environ.get('ASSET_TRACE') or None
+ENABLED = bool(MODE and MODE not in ('0', 'off', 'false')) or bool(TRACE_PATH)
+TRACE_MEMORY = ENABLED and MODE == 'memory'
+
+_NULL = nullcontext()
+_records = []    # finished stages in completion order
+_stack = []      # open stages of this thread (single-threaded pipelines)
+_origin = time.perf_counter()
+
+
+def _rss_bytes():
+    """Current resident set size, or None where it cannot be read cheaply."""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, AttributeError):
+        pass
+    try:
+        import psutil
+    except ImportError:
+        return None
+    return psutil.Process().memory_info().rss
+
+
+class _Stage:
+    """One timed stage; used only while instrumentation is enabled."""
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        if TRACE_MEMORY:
+            import tracemalloc
+            current, peak = tracemalloc.get_traced_memory()
+            if _stack:
+                # Keep the parent's peak before resetting it for this stage
+                _stack[-1].peak_seen = max(_stack[-1].peak_seen, peak)
+            tracemalloc.reset_peak()
+            self.alloc_start, self.peak_seen = current, current
+        self.depth = len(_stack)
+        _stack.append(self)
+        self.rss_start = _rss_bytes()
+        self.cpu_start = time.process_time()
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        end = time.perf_counter()
+        cpu = time.process_time() - self.cpu_start
+        rss = _rss_bytes()
+        _stack.pop()
+
+        record = {
+            'name': self.name,
+            'depth': self.depth,
+            'start': self.start - _origin,
+            'wall': end - self.start,
+            'cpu': cpu,
+            'rss_delta': rss - self.rss_start if rss is not None and self.rss_start is not None else None,
+            'rss': rss,
+            'tid': threading.get_ident(),
+        }
+        if TRACE_MEMORY:
+            import tracemalloc
+            current, peak = tracemalloc.get_traced_memory()
+            peak = max(self.peak_seen, peak)
+            if _stack:
+                _stack[-1].peak_seen = max(_stack[-1].peak_seen, peak)
+            record['alloc_delta'] = current - self.alloc_start
+            record['alloc_peak'] = peak - self.alloc_start
+        _records.append(record)
+        return False
+
+
+def stage(name):
+    """Context manager timing a named stage (a shared no-op when disabled)."""
+    return _Stage(name) if ENABLED else _NULL
+
+
+def timed(name=None):
+    """Decorator timing every call of a function as a stage.
+
+    Decided at decoration time: when instrumentation is off the function is
+    returned as is.
+    """
+    def decorate(func):
+        if not ENABLED:
+            return func
+        label = name or func.__qualname__
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            with _Stage(label):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+class _Sequence:
+    """Consecutive steps of one pipeline, each timed until the next begins."""
+
+    def __init__(self, prefix):
+        self.prefix = prefix
+        self.current = None
+
+    def next(self, name):
+        self.end()
+        self.current = _Stage(f"{self.prefix}: {name}")
+        self.current.__enter__()
+
+    def end(self):
+        if self.current is not None:
+            self.current.__exit__(None, None, None)
+            self.current = None
+
+
+class _NullSequence:
+    def next(self, name):
+        pass
+
+    def end(self):
+        pass
+
+
+_NULL_SEQUENCE = _NullSequence()
+
+
+def stages(prefix):
+    """Running sequence of steps named '<prefix>: <step>' (a no-op when disabled)."""
+    return _Sequence(prefix) if ENABLED else _NULL_SEQUENCE
+
+# ==================== REPORTING ====================
+
+def records():
+    """Finished stages in completion order."""
+    return list(_records)
+
+
+def summarize(stage_records=None):
+    """Aggregate stages by name, in the order each name first started."""
+    summary = {}
+    for r in sorted(stage_records if stage_records is not None else _records, key=lambda r: r['start']):
+        s = summary.setdefault(r['name'], {'depth': r['depth'], 'calls': 0, 'wall': 0.0, 'cpu': 0.0,
+                                           'rss_delta': 0, 'alloc_peak': 0})
+        s['calls'] += 1
+        s['wall'] += r['wall']
+        s['cpu'] += r['cpu']
+        s['rss_delta'] += r['rss_delta'] or 0
+        s['alloc_peak'] = max(s['alloc_peak'], r.get('alloc_peak', 0))
+    return summary
+
+
+def print_summary(stage_records=None):
+    summary = summarize(stage_records)
+    if not summary:
+        return
+    total = sum(s['wall'] for s in summary.values() if s['depth'] == 0) or 1e-9
+    width = max(len(name) + 2 * s['depth'] for name, s in summary.items())
+
+    print("\n" + "=" * (width + 52))
+    print(f"{'stage':<{width}}  calls   wall ms    cpu ms  share  RSS +MB" + ("  py peak MB" if TRACE_MEMORY else ""))
+    print("-" * (width + 52))
+    for name, s in summary.items():
+        label = "  " * s['depth'] + name
+        line = (f"{label:<{width}}  {s['calls']:5d}  {s['wall'] * 1000:8.1f}  {s['cpu'] * 1000:8.1f}  "
+                f"{s['wall'] / total:5.0%}  {s['rss_delta'] / 1024 / 1024:7.1f}")
+        if TRACE_MEMORY:
+            line += f"  {s['alloc_peak'] / 1024 / 1024:10.1f}"
+        print(line)
+    print("=" * (width + 52))
+
+
+def write_trace(path, stage_records=None):
+    """Write stages as Chrome trace events ('X' spans plus an RSS counter)."""
+    pid = os.getpid()
+    events = [{'name': 'process_name', 'ph': 'M', 'pid': pid, 'args': {'name': os.path.basename(sys.argv[0])}}]
+    for r in stage_records if stage_records is not None else _records:
+        args = {'cpu_ms': round(r['cpu'] * 1000, 3)}
+        if r['rss_delta'] is not None:
+            args['rss_delta_mb'] = round(r['rss_delta'] / 1024 / 1024, 2)
+        if 'alloc_peak' in r:
+            args['py_alloc_peak_mb'] = round(r['alloc_peak'] / 1024 / 1024, 2)
+        events.append({'name': r['name'], 'cat': 'stage', 'ph': 'X', 'pid': pid, 'tid': r['tid'],
+                       'ts': round(r['start'] * 1e6, 1), 'dur': round(r['wall'] * 1e6, 1), 'args': args})
+        if r['rss'] is not None:
+            events.append({'name': 'rss_mb', 'ph': 'C', 'pid': pid,
+                           'ts': round((r['start'] + r['wall']) * 1e6, 1),
+                           'args': {'rss': round(r['rss'] / 1024 / 1024, 1)}})
+
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, f)
+    return path
+
+
+def _report_at_exit():
+    print_summary()
+    if TRACE_PATH and _records:
+        print(f"Stage trace: {write_trace(TRACE_PATH)}")
+
+
+if ENABLED:
+    if TRACE_MEMORY:
+        import tracemalloc
+        tracemalloc.start()
+    atexit.register(_report_at_exit)
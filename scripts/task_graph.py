@@ -0,0 +1,249 @@
+"""
+Dependency-graph task runner with per-task content-hash caching
+
+Tasks declare the tasks they depend on plus the files they read and write.
+Ready tasks run concurrently on a process pool; a task is skipped when its
+cache key (function source, arguments and the content of its input files)
+matches the key recorded the last time it succeeded and its outputs exist.
+A task that returns without (re)writing all of its outputs counts as failed,
+so an older file left on disk is never recorded as the result of a new run.
+
+Only the task function's own source is hashed; list module_files() of the
+scripts it calls as inputs so edits to the code doing the work also rerun it.
+"""
+import re
+import json
+import hashlib
+import inspect
+from pathlib import Path
+from concurrent.futures import FIRST_COMPLETED, wait
+
+
+def file_digest(path):
+    """SHA-1 of a file's content, or None if it does not exist."""
+    path = Path(path)
+    if not path.is_file():
+        return None
+    sha = hashlib.sha1()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            sha.update(chunk)
+    return sha.hexdigest()
+
+
+# "import a.b as c, d" / "from a.b import c" at the start of a line (relative imports excluded)
+IMPORT_LINE = re.compile(r'^[ \t]*(?:from[ \t]+(\w+)[\w.]*[ \t]+import\b|import[ \t]+([\w., \t]+))', re.M)
+
+
+def _imported_modules(path):
+    """Top-level names of the absolute imports in the source file at path.
+
+    A line scan rather than a parse, some thirty times faster; an import line
+    quoted in a docstring is picked up as well, which only adds an input.
+    """
+    names = []
+    for match in IMPORT_LINE.finditer(path.read_text(encoding='utf-8')):
+        if match[1]:
+            names.append(match[1])
+        else:
+            names += [name.split()[0].split('.')[0] for name in match[2].split(',') if name.strip()]
+    return dict.fromkeys(names)
+
+
+def module_files(*paths, search=()):
+    """Source files of the given scripts plus every local module they import, transitively.
+
+    Imports (including those inside functions) are resolved against each file's
+    own directory, then the search directories; a package contributes all of
+    its .py files. Standard-library and third-party modules are not included.
+    """
+    found, queue = set(), [Path(p).resolve() for p in paths]
+    while queue:
+        path = queue.pop()
+        if path in found:
+            continue
+        found.add(path)
+        for top in _imported_modules(path):
+            for directory in (path.parent, *(Path(d).resolve() for d in search)):
+                if (directory / f"{top}.py").is_file():
+                    queue.append(directory / f"{top}.py")
+                    break
+                if (directory / top / "__init__.py").is_file():
+                    queue += sorted((directory / top).glob("*.py"))
+                    break
+    return sorted(found)
+
+
+def _mtime(path):
+    """Modification time of path in nanoseconds, or None if it does not exist."""
+    try:
+        return Path(path).stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+class Task:
+    """One node of a TaskGraph."""
+
+    def __init__(self, name, func, args=(), deps=(), inputs=(), outputs=()):
+        self.name = name
+        self.func = func
+        self.args = tuple(args)
+        self.deps = list(deps)
+        self.inputs = [Path(p) for p in inputs]
+        self.outputs = [Path(p) for p in outputs]
+
+    def key(self):
+        """Cache key over the task's code, arguments and input file content."""
+        payload = repr((
+            self.func.__module__,
+            self.func.__qualname__,
+            inspect.getsource(self.func),
+            self.args,
+            [(str(p), file_digest(p)) for p in self.inputs],
+        ))
+        return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+
+class TaskGraph:
+    """A DAG of tasks run with maximal parallelism and cached between runs."""
+
+    def __init__(self, cache_path):
+        self.cache_path = Path(cache_path)
+        self.tasks = {}
+
+    def add(self, name, func, args=(), deps=(), inputs=(), outputs=()):
+        """Register a task; func must be a module-level function so it can run in a worker process."""
+        if name in self.tasks:
+            raise ValueError(f"Duplicate task: {name}")
+        self.tasks[name] = Task(name, func, args, deps, inputs, outputs)
+        return self.tasks[name]
+
+    def _load_cache(self):
+        if self.cache_path.exists():
+            with open(self.cache_path, encoding='utf-8') as f:
+                return json.load(f)
+        return {}
+
+    def _save_cache(self, cache):
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.cache_path.with_suffix('.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(cache, f, indent=2, sort_keys=True)
+        tmp_path.replace(self.cache_path)
+
+    def order(self, targets=None):
+        """Return task names in dependency order, raising on unknown deps or cycles.
+
+        With targets, only those tasks and everything they depend on are included.
+        """
+        ordered, state = [], {}
+
+        def visit(name, chain):
+            if name not in self.tasks:
+                raise KeyError(f"Unknown task '{name}' (required by {chain[-1] if chain else 'caller'})")
+            if state.get(name) == 'done':
+                return
+            if state.get(name) == 'visiting':
+                raise ValueError(f"Dependency cycle: {' -> '.join(chain + [name])}")
+            state[name] = 'visiting'
+            for dep in self.tasks[name].deps:
+                visit(dep, chain + [name])
+            state[name] = 'done'
+            ordered.append(name)
+
+        for name in targets or self.tasks:
+            visit(name, [])
+        return ordered
+
+    @staticmethod
+    def _is_cached(task, key, cache):
+        return cache.get(task.name) == key and all(p.exists() for p in task.outputs)
+
+    def plan(self, targets=None):
+        """Dry run: return {name: 'run' | 'cached'} without executing anything.
+
+        A task is planned to run when its own key is stale or any dependency will run,
+        since the dependency's new outputs will change this task's inputs.
+        """
+        cache = self._load_cache()
+        plan = {}
+        for name in self.order(targets):
+            task = self.tasks[name]
+            stale = any(plan[dep] == 'run' for dep in task.deps) or not self._is_cached(task, task.key(), cache)
+            plan[name] = 'run' if stale else 'cached'
+        return plan
+
+    def touch(self, targets=None):
+        """Record tasks whose outputs already exist as up to date without running them (like make -t)."""
+        cache = self._load_cache()
+        touched = []
+        for name in self.order(targets):
+            task = self.tasks[name]
+            if task.outputs and all(p.exists() for p in task.outputs):
+                cache[name] = task.key()
+                touched.append(name)
+        self._save_cache(cache)
+        return touched
+
+    def run(self, max_workers=None, targets=None):
+        """Run every stale task, returning {name: 'ran' | 'cached' | 'failed' | 'blocked'}."""
+        order = self.order(targets)
+        cache = self._load_cache()
+        status = {}
+        pending = list(order)
+        running = {}
+        pool = None  # started on the first stale task, so fully cached runs never spawn workers
+
+        try:
+            while pending or running:
+                # Submit (or skip) every task whose dependencies have finished
+                for name in list(pending):
+                    task = self.tasks[name]
+                    dep_status = [status.get(dep) for dep in task.deps]
+                    if any(s in ('failed', 'blocked') for s in dep_status):
+                        status[name] = 'blocked'
+                        print(f"  [SKIP] {name} (dependency failed)")
+                        pending.remove(name)
+                    elif all(s in ('ran', 'cached') for s in dep_status):
+                        pending.remove(name)
+                        key = task.key()
+                        if self._is_cached(task, key, cache):
+                            status[name] = 'cached'
+                            print(f"  [CACHED] {name}")
+                        else:
+                            if pool is None:
+                                from concurrent.futures import ProcessPoolExecutor
+                                pool = ProcessPoolExecutor(max_workers=max_workers)
+                            before = [_mtime(p) for p in task.outputs]
+                            running[pool.submit(task.func, *task.args)] = (name, key, before)
+
+                if not running:
+                    continue
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name, key, before = running.pop(future)
+                    task = self.tasks[name]
+                    try:
+                        future.result()
+                        # Compare modification times rather than content: a rerun may rightly
+                        # write the same bytes, but a file it never touched is left over
+                        missing = [str(p) for p, mtime in zip(task.outputs, before)
+                                   if _mtime(p) is None or _mtime(p) == mtime]
+                        if missing:
+                            raise RuntimeError(f"did not write {', '.join(missing)}")
+                    except Exception as e:
+                        status[name] = 'failed'
+                        cache.pop(name, None)
+                        print(f"  [FAILED] {name}: {e}")
+                    else:
+                        status[name] = 'ran'
+                        cache[name] = key
+                        print(f"  [OK] {name}")
+                self._save_cache(cache)
+        finally:
+            if pool is not None:
+                pool.shutdown(cancel_futures=True)
+
+        return status
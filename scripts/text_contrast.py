@@ -0,0 +1,131 @@
+"""
+WCAG contrast checker for rendered text
+
+Compositors record each text element they draw (bbox, fill color, font size)
+with record_text(); check_contrast() then measures every element's fill
+against the actual pixels behind it in the finished image and reports
+pass/fail at WCAG AA and AAA. Each element is a NumPy pass over its bbox, so
+a full page takes milliseconds.
+
+Usage from a compositor:
+    layout = []
+    draw.text(xy, text, font=font, fill=fill)
+    record_text(layout, draw, xy, text, font, fill)
+    ...
+    print_contrast_report(check_contrast(final_image, layout))
+"""
+import numpy as np
+
+# Minimum contrast ratios (WCAG 2.x, success criteria 1.4.3 and 1.4.6)
+AA = {'normal': 4.5, 'large': 3.0}
+AAA = {'normal': 7.0, 'large': 4.5}
+
+# Large text: at least 18pt, or 14pt bold
+LARGE_TEXT_PT = 18
+LARGE_BOLD_TEXT_PT = 14
+
+# Linearized sRGB channel value for every 0-255 level
+_LINEAR = np.arange(256, dtype=np.float32) / 255.0
+_LINEAR = np.where(_LINEAR <= 0.03928, _LINEAR / 12.92, ((_LINEAR + 0.055) / 1.055) ** 2.4).astype(np.float32)
+_LUMINANCE_WEIGHTS = np.array([0.2126, 0.7152, 0.0722], dtype=np.float32)
+
+
+def relative_luminance(rgb):
+    """WCAG relative luminance of an (..., 3) array of 0-255 sRGB values."""
+    return _LINEAR[np.asarray(rgb, dtype=np.uint8)] @ _LUMINANCE_WEIGHTS
+
+
+def contrast_ratio(lum_a, lum_b):
+    """WCAG contrast ratio between luminances (broadcasts over arrays)."""
+    lighter, darker = np.maximum(lum_a, lum_b), np.minimum(lum_a, lum_b)
+    return (lighter + 0.05) / (darker + 0.05)
+
+
+def record_text(layout, draw, xy, text, font, fill, bold=False):
+    """Append a drawn text element to layout (no-op when layout is None)."""
+    if layout is not None:
+        layout.append({
+            'text': text,
+            'bbox': draw.textbbox(xy, text, font=font),
+            'fill': tuple(fill[:3]),
+            'size': getattr(font, 'size', None),
+            'bold': bold,
+        })
+
+
+def is_large_text(element, dpi=300):
+    """WCAG large text test from the element's font size in pixels."""
+    if not element.get('size'):
+        return False
+    points = element['size'] * 72 / dpi
+    return points >= LARGE_TEXT_PT or (element.get('bold') and points >= LARGE_BOLD_TEXT_PT)
+
+
+def _background_mask(region, fill, tolerance=60, spread=1):
+    """Pixels that are neither glyph nor glyph anti-aliasing fringe."""
+    glyph = np.abs(region.astype(np.int16) - np.array(fill, dtype=np.int16)).sum(axis=2) <= tolerance
+    near = glyph.copy()
+    for shift in range(1, spread + 1):
+        near[shift:] |= glyph[:-shift]
+        near[:-shift] |= glyph[shift:]
+        near[:, shift:] |= glyph[:, :-shift]
+        near[:, :-shift] |= glyph[:, shift:]
+    return ~near
+
+
+def element_contrast(image, element, percentile=10):
+    """Contrast of a text element's fill against the pixels behind it.
+
+    Returns a low percentile of the per-pixel ratios so thin patches of poor
+    contrast still count, or None if the bbox has no background pixels.
+    """
+    x0, y0, x1, y1 = [int(v) for v in element['bbox']]
+    box = (max(0, x0), max(0, y0), min(image.width, x1), min(image.height, y1))
+    if box[0] >= box[2] or box[1] >= box[3]:
+        return None
+
+    # Every other pixel each way keeps the percentile and quarters the work
+    region = np.asarray(image.crop(box))[::2, ::2]
+    background = region[_background_mask(region, element['fill'][:3])]
+    if not len(background):
+        return None
+
+    ratios = contrast_ratio(relative_luminance(element['fill'][:3]), relative_luminance(background))
+    return float(np.percentile(ratios, percentile))
+
+
+def check_contrast(image, layout, dpi=300, percentile=10):
+    """Report contrast and AA/AAA pass/fail for each text element.
+
+    Args:
+        image: finished PIL image
+        layout: text elements as recorded by record_text
+        dpi: output resolution, used to decide which text counts as large
+
+    Returns:
+        list of dicts with text, ratio, large, aa and aaa
+    """
+    if image.mode != 'RGB':
+        image = image.convert('RGB')
+
+    reports = []
+    for element in layout:
+        ratio = element_contrast(image, element, percentile)
+        size_class = 'large' if is_large_text(element, dpi) else 'normal'
+        reports.append({
+            'text': element['text'],
+            'ratio': ratio,
+            'large': size_class == 'large',
+            # No background pixels means the text sits on its own color block
+            'aa': ratio is None or ratio >= AA[size_class],
+            'aaa': ratio is None or ratio >= AAA[size_class],
+        })
+    return reports
+
+
+def print_contrast_report(reports):
+    print("\nText contrast (WCAG):")
+    for r in reports:
+        ratio = f"{r['ratio']:.1f}:1" if r['ratio'] is not None else "n/a"
+        level = "AAA" if r['aaa'] else "AA" if r['aa'] else "FAIL"
+        print(f"  [{level:>4}] {ratio:>7}  {'large' if r['large'] else 'normal':6}  {r['text'][:50]}")
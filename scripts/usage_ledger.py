@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+"""
+Usage and cost ledger for API calls
+
+Every paid API call (image generation, vision validation) is recorded as one
+row of a local SQLite database: tokens, images, bytes received, latency,
+outcome and estimated cost, together with the run (one per process), the
+script, the provider and model, and the asset it was for. Rollups along any
+of these show what was spent and the throughput actually reached (images per
+minute, average calls in flight), the numbers batch sizes and concurrency
+limits should be tuned against.
+
+Recording is one INSERT on a shared connection in WAL mode, well under a
+millisecond next to calls that take seconds, and a ledger error never fails
+the call it describes. Set USAGE_LEDGER to another path for a separate
+ledger, or to "off" to record nothing. Set USAGE_RUN_ID to group the calls
+of several processes as one run.
+
+Costs are estimates from IMAGE_PRICES and TOKEN_PRICES (USD). When
+OpenRouter reports the cost in the usage block of its response, that figure
+is used instead.
+
+Usage:
+    record('openrouter', 'openai/gpt-4o', 'cover_page_final', seconds=8.4, usage=result['usage'])
+
+    python usage_ledger.py                          # rollup per script
+    python usage_ledger.py --by asset --since 2026-10-01
+    python usage_ledger.py --by run --script generate_zoom_backgrounds
+"""
+import os
+import sys
+import sqlite3
+import argparse
+import threading
+from pathlib import Path
+from datetime import datetime
+
+# Paths
+SCRIPT_DIR = Path(__file__).parent
+LEDGER_PATH = SCRIPT_DIR.parent / "assets" / ".usage_ledger.sqlite"
+
+RUN_ID = os.environ.get('USAGE_RUN_ID') or f"{datetime.now():%Y%m%d-%H%M%S}-{os.getpid()}"
+
+# USD per image, by (model, size, quality)
+IMAGE_PRICES = {
+    ('dall-e-3', '1024x1024', 'standard'): 0.040,
+    ('dall-e-3', '1024x1024', 'hd'): 0.080,
+    ('dall-e-3', '1792x1024', 'standard'): 0.080,
+    ('dall-e-3', '1792x1024', 'hd'): 0.120,
+    ('dall-e-3', '1024x1792', 'standard'): 0.080,
+    ('dall-e-3', '1024x1792', 'hd'): 0.120,
+}
+
+# USD per million (prompt, completion) tokens
+TOKEN_PRICES = {
+    'google/gemini-2.5-flash-image': (0.30, 30.00),
+    'openai/gpt-4o': (2.50, 10.00),
+}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS calls (
+    id                INTEGER PRIMARY KEY,
+    started           TEXT NOT NULL,
+    run               TEXT NOT NULL,
+    script            TEXT NOT NULL,
+    provider          TEXT NOT NULL,
+    model             TEXT,
+    asset             TEXT,
+    ok                INTEGER NOT NULL,
+    error             TEXT,
+    seconds           REAL,
+    prompt_tokens     INTEGER NOT NULL DEFAULT 0,
+    completion_tokens INTEGER NOT NULL DEFAULT 0,
+    images            INTEGER NOT NULL DEFAULT 0,
+    bytes             INTEGER NOT NULL DEFAULT 0,
+    cost_usd          REAL
+);
+CREATE INDEX IF NOT EXISTS calls_started ON calls (started);
+"""
+
+# Rollup dimension -> SQL expression
+GROUPS = {
+    'run': "run",
+    'script': "script",
+    'provider': "provider",
+    'model': "model",
+    'asset': "asset",
+    'day': "substr(started, 1, 10)",
+}
+
+
+def estimate_cost(model, usage=None, images=0, size=None, quality=None):
+    """Cost of one call in USD, or None when the model has no known price."""
+    usage = usage or {}
+    if usage.get('cost') is not None:
+        return float(usage['cost'])
+    if (model, size, quality) in IMAGE_PRICES:
+        return images * IMAGE_PRICES[(model, size, quality)]
+    if model in TOKEN_PRICES:
+        prompt_price, completion_price = TOKEN_PRICES[model]
+        return (usage.get('prompt_tokens', 0) * prompt_price
+                + usage.get('completion_tokens', 0) * completion_price) / 1e6
+    return None
+
+
+class UsageLedger:
+    """SQLite table of API calls; one connection shared by all threads."""
+
+    def __init__(self, path=LEDGER_PATH):
+        self.path = Path(path)
+        self.lock = threading.Lock()
+        self._conn = None
+
+    @property
+    def conn(self):
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def record(self, provider, model=None, asset=None, seconds=None, usage=None, images=0, nbytes=0,
+               error=None, size=None, quality=None):
+        """Add one call; size and quality select the per-image price."""
+        usage = usage or {}
+        started = datetime.now().timestamp() - (seconds or 0)
+        row = (datetime.fromtimestamp(started).isoformat(timespec='milliseconds'), RUN_ID, _script_name(),
+               provider, model, asset, int(error is None), error, seconds,
+               usage.get('prompt_tokens', 0), usage.get('completion_tokens', 0), images, nbytes,
+               estimate_cost(model, usage, images, size, quality))
+        with self.lock:
+            self.conn.execute("INSERT INTO calls (started, run, script, provider, model, asset, ok, error, seconds,"
+                              " prompt_tokens, completion_tokens, images, bytes, cost_usd)"
+                              " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", row)
+            self.conn.commit()
+
+    def rollup(self, by='script', since=None, **filters):
+        """Totals per value of GROUPS[by], optionally since a date and filtered by column values.
+
+        Returns a list of dicts: calls, failed, tokens, images, bytes, cost
+        (known costs only), unpriced (successful calls without a price),
+        seconds (summed call time), wall (first start to last finish) and
+        the group value under key by.
+        """
+        where, params = [], []
+        if since:
+            where.append("started >= ?")
+            params.append(since)
+        for column, value in filters.items():
+            if value is not None:
+                where.append(f"{GROUPS[column]} = ?")
+                params.append(value)
+        query = f"""
+            SELECT {GROUPS[by]} AS {by},
+                   COUNT(*) AS calls,
+                   SUM(1 - ok) AS failed,
+                   SUM(prompt_tokens + completion_tokens) AS tokens,
+                   SUM(images) AS images,
+                   SUM(bytes) AS bytes,
+                   SUM(cost_usd) AS cost,
+                   SUM(ok AND cost_usd IS NULL) AS unpriced,
+                   SUM(seconds) AS seconds,
+                   (MAX(julianday(started) + COALESCE(seconds, 0) / 86400.0) - MIN(julianday(started))) * 86400 AS wall
+            FROM calls {"WHERE " + " AND ".join(where) if where else ""}
+            GROUP BY 1 ORDER BY MIN(started)"""
+        with self.lock:
+            return [dict(row) for row in self.conn.execute(query, params)]
+
+
+def _script_name():
+    """Name of the running script (cli.py sets argv[0] to the subcommand's script)."""
+    return Path(sys.argv[0]).stem if sys.argv and sys.argv[0] not in ('', '-c') else 'python'
+
+
+_ledger = None
+_ledger_lock = threading.Lock()
+
+
+def ledger():
+    """The process-wide ledger at USAGE_LEDGER (default LEDGER_PATH), or None when it is "off"."""
+    global _ledger
+    setting = os.environ.get('USAGE_LEDGER', '')
+    if setting.lower() == 'off':
+        return None
+    with _ledger_lock:
+        if _ledger is None:
+            _ledger = UsageLedger(setting or LEDGER_PATH)
+    return _ledger
+
+
+def record(provider, model=None, asset=None, **fields):
+    """Record one call in the process-wide ledger; never raises (see UsageLedger.record)."""
+    try:
+        target = ledger()
+        if target is not None:
+            target.record(provider, model, asset, **fields)
+    except Exception as e:
+        print(f"  Warning: usage not recorded ({e})")
+
+
+# ==================== REPORT ====================
+
+def print_rollup(rows, by):
+    """Table of rollup rows with throughput (images/min, calls in flight) and cost."""
+    if not rows:
+        print("  No calls recorded")
+        return
+    width = min(40, max(len(by), *(len(str(row[by])) for row in rows)))
+    print(f"  {by:<{width}}  calls  fail     tokens  images       MB   avg s  in flight  img/min     cost $")
+    for row in rows:
+        wall = row['wall'] or 0
+        avg = row['seconds'] / row['calls'] if row['seconds'] else 0
+        in_flight = row['seconds'] / wall if wall and row['seconds'] else 0
+        per_minute = f"{row['images'] * 60 / wall:7.1f}" if wall >= 1 else "      -"
+        cost = f"{row['cost'] or 0:10.3f}" + (f" (+{row['unpriced']} unpriced)" if row['unpriced'] else "")
+        print(f"  {str(row[by])[:width]:<{width}}  {row['calls']:>5}  {row['failed']:>4}  {row['tokens']:>9,}"
+              f"  {row['images']:>6}  {row['bytes'] / 1e6:7.1f}  {avg:6.1f}  {in_flight:9.1f}  {per_minute}"
+              f"  {cost}")
+
+    total_cost = sum(row['cost'] or 0 for row in rows)
+    print(f"\n  {sum(row['calls'] for row in rows)} call(s), {sum(row['images'] for row in rows)} image(s),"
+          f" ${total_cost:.2f} estimated")
+
+
+def main():
+    """Main execution."""
+    parser = argparse.ArgumentParser(description="Report API usage and estimated cost from the usage ledger.")
+    parser.add_argument("--by", choices=list(GROUPS), default='script', help="rollup dimension (default: script)")
+    parser.add_argument("--since", help="only calls started on or after this date (YYYY-MM-DD)")
+    for column in ('run', 'script', 'provider', 'model', 'asset'):
+        parser.add_argument(f"--{column}", help=f"only calls with this {column}")
+    parser.add_argument("--ledger", default=None, help="ledger file (default: USAGE_LEDGER or assets/.usage_ledger.sqlite)")
+    args = parser.parse_args()
+
+    target = UsageLedger(args.ledger or os.environ.get('USAGE_LEDGER') or LEDGER_PATH)
+    if not target.path.exists():
+        print(f"No usage ledger at {target.path}")
+        return None
+
+    print("=" * 60)
+    print(f"API Usage by {args.by}: {target.path}")
+    print("=" * 60)
+    rows = target.rollup(args.by, args.since, run=args.run, script=args.script, provider=args.provider,
+                         model=args.model, asset=args.asset)
+    print_rollup(rows, args.by)
+    return rows
+
+
+if __name__ == "__main__":
+    main()
@@ -2,11 +2,14 @@
 Validate branding guide pages using GPT-5 Vision against Madison Avenue quality rubric
 """
 import os
+import time
 import base64
 import requests
 from pathlib import Path
 from dotenv import load_dotenv
 
+from usage_ledger import record as record_usage
+
 # Load environment variables
 load_dotenv(Path(__file__).parent.parent.parent / '.env', override=True)
 
@@ -128,17 +131,21 @@ Be ruthlessly honest. Hold to Madison Avenue professional standards. This must b
                 ]
             }
         ],
-        "max_tokens": 2000
+        "max_tokens": 2000,
+        "usage": {"include": True}  # report the call's cost for the usage ledger
     }
 
     print(f"\nValidating {page_name} with GPT-5 Vision...")
     print(f"Image: {image_path}")
 
+    start = time.perf_counter()
     try:
         response = requests.post(url, headers=headers, json=payload, timeout=120)
         response.raise_for_status()
 
         result = response.json()
+        record_usage('openrouter', payload['model'], Path(image_path).stem, seconds=time.perf_counter() - start,
+                     usage=result.get('usage'), nbytes=len(response.content))
         assessment = result['choices'][0]['message']['content']
 
         # Parse score from assessment
@@ -163,6 +170,8 @@ Be ruthlessly honest. Hold to Madison Avenue professional standards. This must b
         }
 
     except requests.exceptions.RequestException as e:
+        record_usage('openrouter', payload['model'], Path(image_path).stem, seconds=time.perf_counter() - start,
+                     error=f"{type(e).__name__}: {e}")
         print(f"Request failed: {e}")
         if hasattr(e, 'response') and e.response:
             print(f"Response: {e.response.text}")
@@ -0,0 +1,90 @@
+"""Tests for the premium PDF's heading -> section / hero image classification."""
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "assets" / "branding-guide"))
+from generate_premium_pdf_v2 import HERO_IMAGES, SECTION_KEYWORDS, SectionClassifier
+
+
+@pytest.fixture
+def hero_files(tmp_path):
+    """HERO_IMAGES keywords mapped to files that exist, independent of the generated PNGs."""
+    heroes = {}
+    for keyword, path in HERO_IMAGES.items():
+        heroes[keyword] = tmp_path / path.name
+        heroes[keyword].write_bytes(b'')
+    return heroes
+
+
+@pytest.fixture
+def classifier(hero_files):
+    return SectionClassifier(SECTION_KEYWORDS, hero_files)
+
+
+@pytest.mark.parametrize('keyword, section', list(SECTION_KEYWORDS.items()))
+def test_every_keyword_maps_to_its_section(classifier, keyword, section):
+    assert classifier.classify(f"Our {keyword} statement")[0] == section
+
+
+@pytest.mark.parametrize('keyword', list(HERO_IMAGES))
+def test_every_hero_keyword_maps_to_its_image(classifier, hero_files, keyword):
+    assert classifier.classify(keyword.title()) == (SECTION_KEYWORDS[keyword], hero_files[keyword])
+
+
+def test_sections_without_hero_image(classifier):
+    assert classifier.classify("Imagery Guidelines") == ('IMAGERY GUIDELINES', None)
+    assert classifier.classify("Contact Us") == ('CONTACT & RESOURCES', None)
+
+
+def test_missing_hero_file_is_skipped(hero_files):
+    hero_files['mission'].unlink()
+    classifier = SectionClassifier(SECTION_KEYWORDS, hero_files)
+    assert classifier.classify("Mission") == ('MISSION & VISION', None)
+
+
+def test_earliest_keyword_in_dict_order_wins(classifier, hero_files):
+    # 'voice' appears first in the text, but 'mission' comes first in SECTION_KEYWORDS
+    assert classifier.classify("Voice of our Mission") == ('MISSION & VISION', hero_files['mission'])
+    assert classifier.classify("Audience and Target Tone") == ('TARGET AUDIENCE', hero_files['target'])
+    assert classifier.classify("Social media applications") == ('APPLICATION EXAMPLES', None)
+
+
+def test_hero_image_follows_hero_priority(classifier, hero_files):
+    # Section from 'vision', which has no hero; the hero comes from the best hero keyword
+    assert classifier.classify("Vision for our brand story") == ('MISSION & VISION', hero_files['brand story'])
+    assert classifier.classify("Voice of the target audience") == ('TARGET AUDIENCE', hero_files['target'])
+
+
+def test_keyword_that_prefixes_another_still_matches():
+    classifier = SectionClassifier({'brand': 'BRAND', 'brand story': 'STORY'}, {})
+    assert classifier.classify("The Brand Story") == ('BRAND', None)
+    classifier = SectionClassifier({'brand story': 'STORY', 'brand': 'BRAND'}, {})
+    assert classifier.classify("The Brand Story") == ('STORY', None)
+    assert classifier.classify("The Brand") == ('BRAND', None)
+
+
+def test_overlapping_keywords_are_all_found():
+    classifier = SectionClassifier({'story': 'STORY', 'brand story': 'BRAND STORY'}, {})
+    assert classifier.classify("brand story") == ('STORY', None)
+
+
+def test_keywords_match_inside_words(classifier):
+    assert classifier.classify("Pillars") == ('BRAND PILLARS', None)
+    assert classifier.classify("Visionary leaders") == ('MISSION & VISION', None)
+
+
+def test_similar_words_do_not_cross_match(classifier):
+    assert classifier.classify("Visual Language") == ('VISUAL LANGUAGE', None)
+    assert classifier.classify("Do's and Don'ts") == ("DO'S & DON'TS", None)
+
+
+@pytest.mark.parametrize('text', ["", "Executive Summary", "Leadership Team", "brandstory", "do not"])
+def test_no_match(classifier, text):
+    assert classifier.classify(text) == (None, None)
+
+
+@pytest.mark.parametrize('text', ["MISSION", "mission", "MiSsIoN", "BRAND STORY", "Social Media"])
+def test_case_insensitive(classifier, text):
+    assert classifier.classify(text)[0] == SECTION_KEYWORDS[text.lower()]